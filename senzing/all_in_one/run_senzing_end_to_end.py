@@ -12,23 +12,52 @@ This script intentionally uses Senzing CLI tools in shell order:
 8. Run explain for matched records using Python SDK (`G2Engine`)
 
 Input must already be Senzing-ready JSON objects (JSONL or JSON array).
+Compressed input (.gz, .bz2, .xz, .zst) is decompressed while normalizing.
 """
 
 from __future__ import annotations
 
 import argparse
-from collections import Counter, defaultdict
+from array import array
+import asyncio
+import bz2
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import ctypes
 import csv
 import datetime as dt
+import functools
+import gzip
+import hashlib
+import importlib.util
 import json
+import lzma
+import multiprocessing
+import multiprocessing.util
 import os
+import random
+import re
 import shlex
+import shutil
+import signal
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
+import zlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+TOOLS_DIR = Path(__file__).resolve().parents[1] / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+# pylint: disable=wrong-import-position
+from compressed_io import COMPRESSION_SUFFIXES, detect_compression, open_file  # noqa: E402
+from process_sampler import ProcessTreeSampler  # noqa: E402
+
+# pylint: enable=wrong-import-position
 
 
 def now_timestamp() -> str:
@@ -36,11 +65,18 @@ def now_timestamp() -> str:
     return dt.datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def input_format_suffix(path: Path) -> str:
+    """Return the data format suffix, ignoring a trailing compression extension."""
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return path.with_suffix("").suffix.lower()
+    return path.suffix.lower()
+
+
 def read_records(input_path: Path) -> list[dict[str, Any]]:
     """Read Senzing-ready records from JSONL or JSON array."""
-    if input_path.suffix.lower() == ".jsonl":
+    if input_format_suffix(input_path) == ".jsonl":
         records: list[dict[str, Any]] = []
-        with input_path.open("r", encoding="utf-8") as infile:
+        with open_file(input_path) as infile:
             for line_no, line in enumerate(infile, start=1):
                 text = line.strip()
                 if not text:
@@ -51,7 +87,7 @@ def read_records(input_path: Path) -> list[dict[str, Any]]:
                 records.append(obj)
         return records
 
-    with input_path.open("r", encoding="utf-8") as infile:
+    with open_file(input_path) as infile:
         data = json.load(infile)
     if not isinstance(data, list):
         raise ValueError("JSON input must be an array of objects")
@@ -90,28 +126,304 @@ def count_non_empty_lines(path: Path) -> int:
     return total
 
 
+INPUT_LABELS_NAME = "input_labels.json.gz"
+LABEL_FIELD = "SOURCE_IPG_ID"
+# Ground-truth field names checked for presence, so readers using other candidates
+# (e.g. run_management_tests.py --epg-field-candidates) can tell whether the sidecar applies.
+LABEL_FIELD_CANDIDATES = ("SOURCE_IPG_ID", "IPG ID", "IPG_ID", "EPGID", "EPG_ID")
+
+
+class InputLabelIndex:
+    """Record keys and SOURCE_IPG_ID labels of one input, collected in a single pass.
+
+    Keys are kept in first-seen order as columns (data source code, RECORD_ID) with
+    one label code per key (-1 = unlabeled). The first label of a key wins; a later,
+    different label counts as a conflict. save()/load() persist the index as a gzip
+    JSON sidecar next to the run, so later stages do not re-parse the input.
+    """
+
+    def __init__(self) -> None:
+        self.records_total = 0
+        self.rows_with_record_key = 0
+        self.rows_with_label = 0
+        self.label_conflicts = 0
+        self.field_presence: Counter[str] = Counter()
+        self.data_sources: list[str] = []
+        self.record_source = array("i")
+        self.record_ids: list[str] = []
+        self.record_label = array("q")
+        self.labels: list[str] = []
+        self._source_codes: dict[str, int] = {}
+        self._record_codes: dict[tuple[str, str], int] = {}
+        self._label_codes: dict[str, int] = {}
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Account for one input record."""
+        self.records_total += 1
+        for field in LABEL_FIELD_CANDIDATES:
+            value = record.get(field)
+            if value is not None and str(value).strip():
+                self.field_presence[field] += 1
+        key = parse_record_key(record.get("DATA_SOURCE"), record.get("RECORD_ID"))
+        if key is None:
+            return
+        self.rows_with_record_key += 1
+        code = self._record_codes.get(key)
+        if code is None:
+            source_code = self._source_codes.get(key[0])
+            if source_code is None:
+                source_code = self._source_codes[key[0]] = len(self.data_sources)
+                self.data_sources.append(key[0])
+            code = self._record_codes[key] = len(self.record_ids)
+            self.record_source.append(source_code)
+            self.record_ids.append(key[1])
+            self.record_label.append(-1)
+
+        label = str(record.get(LABEL_FIELD) or "").strip()
+        if not label:
+            return
+        self.rows_with_label += 1
+        label_code = self._label_codes.get(label)
+        if label_code is None:
+            label_code = self._label_codes[label] = len(self.labels)
+            self.labels.append(label)
+        existing = self.record_label[code]
+        if existing < 0:
+            self.record_label[code] = label_code
+        elif existing != label_code:
+            self.label_conflicts += 1
+
+    def add_jsonl(self, input_jsonl_path: Path) -> None:
+        """Account for every record of a JSONL file."""
+        with open_file(input_jsonl_path) as infile:
+            for line_no, line in enumerate(infile, start=1):
+                text = line.strip()
+                if not text:
+                    continue
+                obj = json.loads(text)
+                if not isinstance(obj, dict):
+                    raise ValueError(f"Invalid JSON object in input JSONL at line {line_no}")
+                self.add(obj)
+
+    @classmethod
+    def from_jsonl(cls, input_jsonl_path: Path) -> "InputLabelIndex":
+        """Scan a JSONL file."""
+        index = cls()
+        index.add_jsonl(input_jsonl_path)
+        return index
+
+    def iter_labeled_records(self) -> Iterator[tuple[str, str, str]]:
+        """Yield (DATA_SOURCE, RECORD_ID, label) of every labeled record key."""
+        for code, label_code in enumerate(self.record_label):
+            if label_code >= 0:
+                yield self.data_sources[self.record_source[code]], self.record_ids[code], self.labels[label_code]
+
+    def save(self, sidecar_path: Path, source_path: Path) -> None:
+        """Write the sidecar, stamped with the size and mtime of the scanned file."""
+        source_stat = source_path.stat()
+        payload = {
+            "version": 1,
+            "label_field": LABEL_FIELD,
+            "source": {
+                "path": str(source_path),
+                "size": source_stat.st_size,
+                "mtime_ns": source_stat.st_mtime_ns,
+            },
+            "records_total": self.records_total,
+            "rows_with_record_key": self.rows_with_record_key,
+            "rows_with_label": self.rows_with_label,
+            "label_conflicts": self.label_conflicts,
+            "field_presence": {field: self.field_presence.get(field, 0) for field in LABEL_FIELD_CANDIDATES},
+            "data_sources": self.data_sources,
+            "labels": self.labels,
+            "record_source": self.record_source.tolist(),
+            "record_ids": self.record_ids,
+            "record_label": self.record_label.tolist(),
+        }
+        tmp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as outfile:
+            json.dump(payload, outfile, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, sidecar_path)
+
+    @classmethod
+    def load(cls, sidecar_path: Path, source_path: Path | None = None) -> "InputLabelIndex | None":
+        """Read a sidecar; None when missing, unreadable or stale for source_path."""
+        try:
+            with gzip.open(sidecar_path, "rt", encoding="utf-8") as infile:
+                payload = json.load(infile)
+        except (OSError, ValueError, EOFError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != 1 or payload.get("label_field") != LABEL_FIELD:
+            return None
+        if source_path is not None:
+            try:
+                source_stat = source_path.stat()
+            except OSError:
+                return None
+            source = payload.get("source") or {}
+            if source.get("size") != source_stat.st_size or source.get("mtime_ns") != source_stat.st_mtime_ns:
+                return None
+        index = cls()
+        index.records_total = int(payload["records_total"])
+        index.rows_with_record_key = int(payload["rows_with_record_key"])
+        index.rows_with_label = int(payload["rows_with_label"])
+        index.label_conflicts = int(payload["label_conflicts"])
+        index.field_presence = Counter(payload.get("field_presence") or {})
+        index.data_sources = list(payload["data_sources"])
+        index.labels = list(payload["labels"])
+        index.record_source = array("i", payload["record_source"])
+        index.record_ids = payload["record_ids"]
+        index.record_label = array("q", payload["record_label"])
+        return index
+
+
+FICLONE = 0x40049409
+
+
+def clone_file(source: Path, target: Path, allow_hardlink: bool = True) -> str:
+    """Make target a copy of source as cheaply as the filesystem allows; returns the method used.
+
+    Without allow_hardlink target always gets its own data blocks (reflink or copy), so
+    writing to it can never change source.
+    """
+    target.unlink(missing_ok=True)
+    if allow_hardlink:
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except OSError:
+            pass
+    with source.open("rb") as src, target.open("wb") as dst:
+        try:
+            import fcntl  # pylint: disable=import-outside-toplevel
+
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return "reflink"
+        except (ImportError, OSError):
+            pass
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied <= 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return "copy_file_range"
+            except OSError:
+                pass
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+        shutil.copyfileobj(src, dst, 1 << 20)
+    return "copy"
+
+
+def scan_plain_jsonl(
+    input_path: Path,
+    normalized_jsonl_path: Path | None,
+    data_sources_found: set[str],
+    label_index: InputLabelIndex | None,
+    allow_hardlink: bool = False,
+) -> tuple[int, str]:
+    """Validate an uncompressed JSONL in one pass without re-serializing it.
+
+    Every line is decoded as before, but a line that already is one JSON object with
+    no surrounding whitespace is kept byte for byte. With normalized_jsonl_path the
+    output is a clone of the input when no line needed rewriting (reflink or copy; a
+    hardlink only with allow_hardlink, since it shares storage with the user's file);
+    otherwise the clean prefix is copied and the rest written line by line.
+    Returns (record count, output mode).
+    """
+    record_count = 0
+    outfile = None
+    try:
+        with input_path.open("rb") as infile:
+            offset = 0
+            for line_no, raw_line in enumerate(infile, start=1):
+                line_start = offset
+                offset += len(raw_line)
+                text = raw_line.decode("utf-8")
+                stripped = text.strip()
+                obj = json.loads(stripped) if stripped else None
+                if stripped and not isinstance(obj, dict):
+                    raise ValueError(f"Line {line_no} is not a JSON object")
+                verbatim = bool(stripped) and len(stripped) == len(text.rstrip("\r\n"))
+
+                if normalized_jsonl_path is not None:
+                    if not verbatim and outfile is None:
+                        outfile = normalized_jsonl_path.open("wb")
+                        with input_path.open("rb") as prefix:
+                            remaining = line_start
+                            while remaining > 0:
+                                chunk = prefix.read(min(1 << 20, remaining))
+                                outfile.write(chunk)
+                                remaining -= len(chunk)
+                    if outfile is not None and obj is not None:
+                        if verbatim:
+                            outfile.write(raw_line if raw_line.endswith(b"\n") else raw_line + b"\n")
+                        else:
+                            outfile.write((json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8"))
+                if obj is None:
+                    continue
+
+                record_count += 1
+                data_source = str(obj.get("DATA_SOURCE", "")).strip()
+                if data_source:
+                    data_sources_found.add(data_source)
+                if label_index is not None:
+                    label_index.add(obj)
+    finally:
+        if outfile is not None:
+            outfile.close()
+
+    if normalized_jsonl_path is None:
+        return record_count, "none"
+    if outfile is not None:
+        return record_count, "rewrite_partial"
+    return record_count, clone_file(input_path, normalized_jsonl_path, allow_hardlink=allow_hardlink)
+
+
 def normalize_input_to_jsonl(
     input_path: Path,
     normalized_jsonl_path: Path,
     provided_data_sources: list[str],
     use_input_jsonl_directly: bool,
-) -> tuple[int, list[str], Path]:
-    """Normalize supported input formats to JSONL and extract metadata."""
+    label_index: InputLabelIndex | None = None,
+    rewrite: bool = False,
+    allow_hardlink: bool = False,
+) -> tuple[int, list[str], Path, str]:
+    """Normalize supported input formats to JSONL and extract metadata.
+
+    When label_index is given it is fed every record during the same pass. With
+    use_input_jsonl_directly that means scanning each line instead of only counting.
+    Uncompressed JSONL is cloned rather than re-serialized (see scan_plain_jsonl)
+    unless rewrite is set. Returns (records, data sources, load input, output mode).
+    """
     if use_input_jsonl_directly:
-        if input_path.suffix.lower() != ".jsonl":
-            raise ValueError("--use-input-jsonl-directly requires .jsonl input")
+        if input_path.suffix.lower() != ".jsonl" or detect_compression(input_path):
+            raise ValueError("--use-input-jsonl-directly requires uncompressed .jsonl input")
         if not provided_data_sources:
             raise ValueError("--use-input-jsonl-directly requires --data-sources")
-        record_count = count_non_empty_lines(input_path)
+        if label_index is None:
+            record_count = count_non_empty_lines(input_path)
+        else:
+            record_count, _mode = scan_plain_jsonl(input_path, None, set(), label_index)
         if record_count <= 0:
             raise ValueError("Input contains no records.")
-        return record_count, provided_data_sources, input_path
+        return record_count, provided_data_sources, input_path, "direct"
 
     data_sources_found: set[str] = set()
     record_count = 0
+    output_mode = "rewrite"
 
-    if input_path.suffix.lower() == ".jsonl":
-        with input_path.open("r", encoding="utf-8") as infile, normalized_jsonl_path.open("w", encoding="utf-8") as outfile:
+    if input_format_suffix(input_path) == ".jsonl" and not rewrite and not detect_compression(input_path):
+        record_count, output_mode = scan_plain_jsonl(
+            input_path, normalized_jsonl_path, data_sources_found, label_index, allow_hardlink=allow_hardlink
+        )
+    elif input_format_suffix(input_path) == ".jsonl":
+        with open_file(input_path) as infile, normalized_jsonl_path.open("w", encoding="utf-8") as outfile:
             for line_no, line in enumerate(infile, start=1):
                 text = line.strip()
                 if not text:
@@ -122,10 +434,12 @@ def normalize_input_to_jsonl(
                 data_source = str(obj.get("DATA_SOURCE", "")).strip()
                 if data_source:
                     data_sources_found.add(data_source)
+                if label_index is not None:
+                    label_index.add(obj)
                 outfile.write(json.dumps(obj, ensure_ascii=False) + "\n")
                 record_count += 1
     else:
-        with input_path.open("r", encoding="utf-8") as infile:
+        with open_file(input_path) as infile:
             data = json.load(infile)
         if not isinstance(data, list):
             raise ValueError("JSON input must be an array of objects")
@@ -137,6 +451,8 @@ def normalize_input_to_jsonl(
                 data_source = str(item.get("DATA_SOURCE", "")).strip()
                 if data_source:
                     data_sources_found.add(data_source)
+                if label_index is not None:
+                    label_index.add(item)
                 outfile.write(json.dumps(item, ensure_ascii=False) + "\n")
                 record_count += 1
 
@@ -147,110 +463,645 @@ def normalize_input_to_jsonl(
     if not data_sources:
         raise ValueError("No DATA_SOURCE found in input records.")
 
-    return record_count, data_sources, normalized_jsonl_path
+    return record_count, data_sources, normalized_jsonl_path, output_mode
+
+
+RESOURCE_SAMPLING: dict[str, Any] = {"interval_seconds": 1.0, "timeseries": False}
+
+
+STEP_TAIL_CHARS = 1200
+PROGRESS_SAMPLE_SECONDS = 10.0
+PROGRESS_MAX_SAMPLES = 720
+PROGRESS_RATE_PATTERN = re.compile(
+    r"(\d[\d,]*(?:\.\d+)?)\s*(?:records?|rows?|entities|entity|recs?)?\s*(?:per\s+sec(?:ond)?|/\s*s(?:ec)?)\b",
+    re.IGNORECASE,
+)
+PROGRESS_COUNT_PATTERN = re.compile(r"(\d[\d,]*)\s+(?:records?|rows?|entities|entity)\b", re.IGNORECASE)
+
+
+def parse_progress_line(line: str) -> tuple[int | None, float | None]:
+    """Pull a processed count and a per-second rate out of a loader/snapshot progress line.
+
+    Matches lines such as "10,000 records processed, 1,234 records per second" or
+    "Processed 50000 entities"; either part may be missing.
+    """
+    rate_match = PROGRESS_RATE_PATTERN.search(line)
+    rate = float(rate_match.group(1).replace(",", "")) if rate_match else None
+    if rate_match:
+        line = line[: rate_match.start()] + line[rate_match.end():]
+    count_match = PROGRESS_COUNT_PATTERN.search(line)
+    count = int(count_match.group(1).replace(",", "")) if count_match else None
+    return count, rate
+
+
+class StepProgress:
+    """Progress timeseries of one running step, fed line by line from its output.
+
+    A sample (seconds since start, count, records/sec, ETA when total is known) is kept
+    at most every PROGRESS_SAMPLE_SECONDS; past PROGRESS_MAX_SAMPLES every other sample
+    is dropped and the interval doubles, so memory stays bounded on multi-hour steps.
+    """
+
+    def __init__(self, step_name: str, total: int | None = None, echo: bool = True) -> None:
+        self.step_name = step_name
+        self.total = total
+        self.echo = echo
+        self.started = time.time()
+        self.interval = PROGRESS_SAMPLE_SECONDS
+        self.samples: list[dict[str, Any]] = []
+        self.last_count: int | None = None
+        self.last_rate: float | None = None
+        self.last_seen = 0.0
+
+    def feed(self, line: str) -> None:
+        """Record the count/rate of a progress line (other lines are ignored), sampling when due."""
+        count, rate = parse_progress_line(line)
+        if count is None:
+            return
+        now = time.time() - self.started
+        self.last_count = count
+        self.last_rate = rate
+        self.last_seen = now
+        if not self.samples or now - self.samples[-1]["t"] >= self.interval:
+            self._sample(now)
+
+    def _sample(self, now: float) -> None:
+        """Append a sample for the latest count, thinning the series when it gets too long."""
+        count = int(self.last_count or 0)
+        rate = self.last_rate
+        if rate is None and self.samples:
+            # Without a printed rate, derive it from the previous sample (the first has none).
+            elapsed = now - self.samples[-1]["t"]
+            rate = (count - self.samples[-1]["count"]) / elapsed if elapsed > 0 else None
+        eta = round((self.total - count) / rate, 1) if self.total and rate and count < self.total else None
+        self.samples.append(
+            {
+                "t": round(now, 3),
+                "count": count,
+                "rate": round(rate, 1) if rate is not None else None,
+                "eta_seconds": eta,
+            }
+        )
+        if len(self.samples) > PROGRESS_MAX_SAMPLES:
+            self.samples = self.samples[::2]
+            self.interval *= 2
+        if self.echo:
+            rate_text = f", {rate:,.0f}/s" if rate is not None else ""
+            eta_text = f", ETA {dt.timedelta(seconds=int(eta))}" if eta is not None else ""
+            print(f"  [{self.step_name}] {count:,}{rate_text}{eta_text}", flush=True)
+
+    def summary(self) -> dict[str, Any] | None:
+        """Timeseries plus totals for the run summary, or None if no progress line was seen."""
+        if self.last_count is None:
+            return None
+        if self.samples[-1]["t"] != round(self.last_seen, 3):
+            self._sample(self.last_seen)
+        return {
+            "total": self.total,
+            "last_count": self.last_count,
+            "average_rate": round(self.last_count / self.last_seen, 1) if self.last_seen > 0 else None,
+            "sample_interval_seconds": self.interval,
+            "samples": self.samples,
+        }
+
+
+async def stream_subprocess(
+    argv: list[str],
+    env: dict[str, str] | None,
+    log: TextIO,
+    timeout_seconds: int | None,
+    progress: StepProgress,
+    sampler: ProcessTreeSampler | None = None,
+) -> tuple[int, bool, str, str]:
+    """Run argv, writing output lines to log as they arrive; returns (exit code, timed out, tails).
+
+    stdout lines go to the log as-is and stderr lines with a "[stderr] " prefix. Only the
+    last STEP_TAIL_CHARS of each stream are kept in memory. On timeout the whole process
+    group is killed and what was already written stays in the log.
+    """
+    tails = {"stdout": "", "stderr": ""}
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        start_new_session=True,
+    )
+    if sampler is not None:
+        sampler.start(proc.pid)
+
+    def emit(name: str, raw: bytes) -> None:
+        text = raw.decode("utf-8", errors="replace")
+        log.write(("[stderr] " if name == "stderr" else "") + text + "\n")
+        tails[name] = (tails[name] + text + "\n")[-STEP_TAIL_CHARS:]
+        progress.feed(text)
+
+    async def pump(name: str, stream: asyncio.StreamReader) -> None:
+        pending = b""
+        while True:
+            chunk = await stream.read(1 << 16)
+            if not chunk:
+                break
+            # Progress bars redraw with carriage returns; treat them as line ends.
+            *lines, pending = (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+            for line in lines:
+                if line:
+                    emit(name, line)
+            log.flush()
+        if pending:
+            emit(name, pending)
+
+    pumps = asyncio.gather(pump("stdout", proc.stdout), pump("stderr", proc.stderr))
+    timed_out = False
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        timed_out = True
+    finally:
+        if proc.returncode is None:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            await proc.wait()
+    try:
+        await asyncio.wait_for(pumps, timeout=5)
+    except asyncio.TimeoutError:
+        # A grandchild outside the killed group still holds the pipes open.
+        pumps.cancel()
+    return (124 if timed_out else int(proc.returncode or 0)), timed_out, tails["stdout"], tails["stderr"]
 
 
 def run_shell_step(
     step_name: str,
-    shell_command: str,
+    shell_command: str | list[str],
     log_path: Path,
     timeout_seconds: int | None = None,
+    setup_env: Path | None = None,
+    progress_total: int | None = None,
 ) -> dict[str, Any]:
-    """Run one shell command and store stdout/stderr into log file."""
+    """Run one command, streaming its output into the log file as it arrives.
+
+    A string runs through bash -lc as given. An argv list with setup_env is executed
+    directly in the cached setupEnv environment (see load_setup_env); if that cannot be
+    resolved it falls back to sourcing setupEnv in a login shell. Progress lines are
+    parsed into a records/sec timeseries (with ETA against progress_total) stored under
+    "progress" in the returned step.
+    """
     start = time.time()
     timed_out = False
-    try:
-        result = subprocess.run(
-            ["bash", "-lc", shell_command],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
-            timeout=timeout_seconds,
-        )
-        exit_code = result.returncode
-        stdout_text = result.stdout or ""
-        stderr_text = result.stderr or ""
-    except subprocess.TimeoutExpired as err:
-        timed_out = True
-        exit_code = 124
-        if isinstance(err.stdout, bytes):
-            stdout_text = err.stdout.decode("utf-8", errors="replace")
-        else:
-            stdout_text = err.stdout or ""
-        if isinstance(err.stderr, bytes):
-            stderr_text = err.stderr.decode("utf-8", errors="replace")
-        else:
-            stderr_text = err.stderr or ""
-        timeout_msg = f"Command timed out after {timeout_seconds} seconds."
-        stderr_text = f"{stderr_text}\n{timeout_msg}" if stderr_text else timeout_msg
-
-    elapsed = round(time.time() - start, 3)
+    env: dict[str, str] | None = None
+    if isinstance(shell_command, list):
+        env = load_setup_env(setup_env) if setup_env is not None else dict(os.environ)
+        if not env:
+            shell_command = f"source {shlex.quote(str(setup_env))} >/dev/null 2>&1 && {shlex.join(shell_command)}"
+            env = None
+    exec_mode = "shell" if isinstance(shell_command, str) else "direct"
+    argv = ["bash", "-lc", shell_command] if isinstance(shell_command, str) else shell_command
+    progress = StepProgress(step_name, progress_total)
+    sampler = ProcessTreeSampler(
+        RESOURCE_SAMPLING["interval_seconds"],
+        log_path.with_suffix(".resources.jsonl") if RESOURCE_SAMPLING["timeseries"] else None,
+    )
 
     log_path.parent.mkdir(parents=True, exist_ok=True)
     with log_path.open("w", encoding="utf-8") as outfile:
         outfile.write(f"STEP: {step_name}\n")
-        outfile.write(f"COMMAND: {shell_command}\n")
+        outfile.write(f"COMMAND: {shell_command if exec_mode == 'shell' else shlex.join(shell_command)}\n")
+        outfile.write(f"EXEC_MODE: {exec_mode}\n")
+        outfile.write(f"TIMEOUT_SECONDS: {timeout_seconds if timeout_seconds is not None else 'none'}\n")
+        outfile.write("\n--- OUTPUT (stderr lines prefixed) ---\n")
+        outfile.flush()
+        try:
+            exit_code, timed_out, stdout_text, stderr_text = asyncio.run(
+                stream_subprocess(argv, env, outfile, timeout_seconds, progress, sampler)
+            )
+        except OSError as err:
+            exit_code = 127
+            stdout_text = ""
+            stderr_text = f"Unable to execute {argv[0]}: {err}"
+            outfile.write(f"[stderr] {stderr_text}\n")
+        if timed_out:
+            timeout_msg = f"Command timed out after {timeout_seconds} seconds."
+            stderr_text = f"{stderr_text}\n{timeout_msg}" if stderr_text else timeout_msg
+        elapsed = round(time.time() - start, 3)
+        outfile.write("\n--- RESULT ---\n")
         outfile.write(f"EXIT_CODE: {exit_code}\n")
         outfile.write(f"TIMED_OUT: {timed_out}\n")
-        outfile.write(f"TIMEOUT_SECONDS: {timeout_seconds if timeout_seconds is not None else 'none'}\n")
         outfile.write(f"DURATION_SECONDS: {elapsed}\n")
-        outfile.write("\n--- STDOUT ---\n")
-        outfile.write(stdout_text)
-        outfile.write("\n--- STDERR ---\n")
-        outfile.write(stderr_text)
 
-    return {
+    step = {
         "step": step_name,
         "ok": exit_code == 0,
         "exit_code": exit_code,
         "timed_out": timed_out,
+        "exec_mode": exec_mode,
         "duration_seconds": elapsed,
         "log_file": str(log_path),
-        "stdout_tail": stdout_text[-1200:],
-        "stderr_tail": stderr_text[-1200:],
+        "stdout_tail": stdout_text[-STEP_TAIL_CHARS:],
+        "stderr_tail": stderr_text[-STEP_TAIL_CHARS:],
     }
+    sampler.stop()
+    resources = sampler.summary()
+    if resources is not None:
+        step["resources"] = resources
+    progress_summary = progress.summary()
+    if progress_summary is not None:
+        step["progress"] = progress_summary
+    return step
 
 
 def build_load_command(
-    project_setup_env: Path,
     input_jsonl: Path,
     num_threads: int,
     no_shuffle: bool = False,
-) -> str:
-    """Build sz_file_loader shell command."""
-    cmd = (
-        f"source {shlex.quote(str(project_setup_env))} >/dev/null 2>&1 && "
-        f"sz_file_loader -f {shlex.quote(str(input_jsonl))}"
-    )
+) -> list[str]:
+    """Build sz_file_loader argv (run with the setupEnv environment)."""
+    cmd = ["sz_file_loader", "-f", str(input_jsonl)]
     if num_threads > 0:
-        cmd += f" -nt {num_threads}"
+        cmd += ["-nt", str(num_threads)]
     if no_shuffle:
-        cmd += " --no-shuffle"
+        cmd.append("--no-shuffle")
     return cmd
 
 
 def build_snapshot_command(
-    project_setup_env: Path,
     snapshot_prefix: Path,
     thread_count: int,
     force_sdk: bool = False,
-) -> str:
-    """Build sz_snapshot shell command."""
-    cmd = (
-        f"source {shlex.quote(str(project_setup_env))} >/dev/null 2>&1 && "
-        f"sz_snapshot -o {shlex.quote(str(snapshot_prefix))} -Q"
-    )
+) -> list[str]:
+    """Build sz_snapshot argv (run with the setupEnv environment)."""
+    cmd = ["sz_snapshot", "-o", str(snapshot_prefix), "-Q"]
     if thread_count > 0:
-        cmd += f" -t {thread_count}"
+        cmd += ["-t", str(thread_count)]
     if force_sdk:
-        cmd += " -F"
+        cmd.append("-F")
     return cmd
 
 
+# sz_export and the SDK export report are read by a single thread.
+EXPORT_STAGE_THREADS = 1
+
+
+def plan_read_stage_threads(
+    thread_budget: int, snapshot_threads: int, run_snapshot: bool, run_export: bool
+) -> dict[str, Any]:
+    """Decide whether snapshot and export overlap and how many threads snapshot gets.
+
+    Both stages only read the loaded repository. They run side by side when the budget
+    covers the export thread plus at least one snapshot thread; snapshot then gets what
+    is left of the budget, up to snapshot_threads. Otherwise they run one after another
+    and snapshot gets the whole budget, up to snapshot_threads.
+    """
+    concurrent = run_snapshot and run_export and thread_budget >= EXPORT_STAGE_THREADS + 1
+    return {
+        "mode": "concurrent" if concurrent else "sequential",
+        "thread_budget": thread_budget,
+        "max_parallel": 2 if concurrent else 1,
+        "snapshot_threads": max(
+            1, min(snapshot_threads, thread_budget - EXPORT_STAGE_THREADS if concurrent else thread_budget)
+        ),
+        "export_threads": EXPORT_STAGE_THREADS,
+    }
+
+
+def run_stage_graph(
+    stages: dict[str, tuple[tuple[str, ...], Callable[[], bool]]],
+    max_parallel: int,
+    origin: float,
+) -> dict[str, dict[str, Any]]:
+    """Run a small dependency graph of stages, up to max_parallel at once.
+
+    stages maps name -> (dependencies, callable returning ok). A stage starts once all
+    its dependencies succeeded and is skipped if one failed; ready stages start in
+    insertion order. Returns per-stage ok/skipped plus start/end offsets in seconds
+    from origin, for the run summary timeline.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    pending = dict(stages)
+    running: dict[Future[bool], str] = {}
+
+    def call(name: str, fn: Callable[[], bool]) -> bool:
+        results[name]["start_offset_seconds"] = round(time.time() - origin, 3)
+        try:
+            return bool(fn())
+        finally:
+            results[name]["end_offset_seconds"] = round(time.time() - origin, 3)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix="stage") as pool:
+        while pending or running:
+            for name, (deps, fn) in list(pending.items()):
+                if any(dep in results and results[dep].get("ok") is False for dep in deps):
+                    results[name] = {"ok": False, "skipped": True}
+                    del pending[name]
+                elif len(running) < max(1, max_parallel) and all(results.get(dep, {}).get("ok") for dep in deps):
+                    results[name] = {"ok": None, "skipped": False}
+                    running[pool.submit(call, name, fn)] = name
+                    del pending[name]
+            if not running:
+                if pending:
+                    raise ValueError(f"Stage dependencies cannot be satisfied: {', '.join(pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name]["ok"] = future.result()
+    return results
+
+
+def stage_overlap_seconds(results: dict[str, dict[str, Any]]) -> float:
+    """Total time during which at least two stages were running."""
+    events = sorted(
+        [(item["start_offset_seconds"], 1) for item in results.values() if "start_offset_seconds" in item]
+        + [(item["end_offset_seconds"], -1) for item in results.values() if "end_offset_seconds" in item]
+    )
+    overlap = 0.0
+    active = 0
+    last = 0.0
+    for offset, delta in events:
+        if active >= 2:
+            overlap += offset - last
+        active += delta
+        last = offset
+    return round(overlap, 3)
+
+
+LOAD_CHECKPOINT_NAME = "load_checkpoint.json"
+
+
+def read_load_checkpoint(checkpoint_path: Path) -> dict[str, Any] | None:
+    """Read a load checkpoint, or None when missing/unreadable."""
+    try:
+        payload = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def write_load_checkpoint(checkpoint_path: Path, checkpoint: dict[str, Any]) -> None:
+    """Atomically persist committed load progress."""
+    checkpoint["updated_at"] = dt.datetime.now().isoformat(timespec="seconds")
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(checkpoint, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp_path, checkpoint_path)
+
+
+def write_input_slice(source: Path, start_offset: int, max_records: int, target: Path) -> tuple[int, int]:
+    """Copy up to max_records non-empty lines of source, starting at a byte offset, into target.
+
+    max_records <= 0 copies everything up to the end. Returns (end byte offset, records copied).
+    """
+    records = 0
+    offset = start_offset
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with source.open("rb") as infile, target.open("wb") as outfile:
+        infile.seek(start_offset)
+        for line in infile:
+            offset += len(line)
+            if not line.strip():
+                continue
+            outfile.write(line if line.endswith(b"\n") else line + b"\n")
+            records += 1
+            if 0 < max_records <= records:
+                break
+    return offset, records
+
+
+def run_checkpointed_file_load(
+    checkpoint: dict[str, Any],
+    checkpoint_path: Path,
+    project_setup_env: Path,
+    load_input_jsonl: Path,
+    segments_dir: Path,
+    logs_dir: Path,
+    segment_records: int,
+    attempts: list[tuple[str, int, bool]],
+    timeout_seconds: int,
+    keep_temp_files: bool,
+) -> tuple[bool, list[dict[str, Any]], list[str], list[str]]:
+    """Load with sz_file_loader segment by segment, committing progress after each segment.
+
+    Loading starts at checkpoint["byte_offset"]; each segment is a tail slice of the
+    input holding at most segment_records records (the whole file when it fits and
+    nothing is committed yet). A failed attempt is retried with the next entry of
+    attempts (mode, threads, no_shuffle) on the same segment only.
+    Returns (ok, steps, warnings, loader temp files removed).
+    """
+    steps: list[dict[str, Any]] = []
+    warnings: list[str] = []
+    removed: list[str] = []
+    total_size = load_input_jsonl.stat().st_size
+    single_segment = checkpoint["byte_offset"] == 0 and (
+        segment_records <= 0 or int(checkpoint.get("records_input_count") or 0) <= segment_records
+    )
+
+    while checkpoint["byte_offset"] < total_size:
+        segment_no = int(checkpoint.get("segments_completed", 0)) + 1
+        if single_segment:
+            segment_path = load_input_jsonl
+            end_offset = total_size
+            segment_count = int(checkpoint.get("records_input_count") or 0)
+        else:
+            segment_path = segments_dir / f"segment_{segment_no:04d}.jsonl"
+            end_offset, segment_count = write_input_slice(
+                load_input_jsonl, checkpoint["byte_offset"], segment_records, segment_path
+            )
+            if segment_count == 0:
+                segment_path.unlink(missing_ok=True)
+                checkpoint["byte_offset"] = end_offset
+                break
+
+        segment_ok = False
+        for attempt_index, (attempt_mode, threads, no_shuffle) in enumerate(attempts):
+            if single_segment:
+                step_name = "load_records" if attempt_index == 0 else f"load_records_retry_{attempt_index}"
+                log_name = "02_load.log" if attempt_index == 0 else f"02_load_retry_{attempt_index}.log"
+            else:
+                step_name = f"load_records_segment_{segment_no:04d}"
+                log_name = f"02_load_segment_{segment_no:04d}.log"
+                if attempt_index:
+                    step_name += f"_retry_{attempt_index}"
+                    log_name = log_name.replace(".log", f"_retry_{attempt_index}.log")
+            step = run_shell_step(
+                step_name,
+                build_load_command(segment_path, threads, no_shuffle=no_shuffle),
+                logs_dir / log_name,
+                timeout_seconds=timeout_seconds,
+                setup_env=project_setup_env,
+                progress_total=segment_count,
+            )
+            step["attempt_mode"] = attempt_mode
+            step["segment"] = {
+                "index": segment_no,
+                "start_offset": checkpoint["byte_offset"],
+                "end_offset": end_offset,
+                "records": segment_count,
+            }
+            steps.append(step)
+            if step["ok"]:
+                if attempt_index > 0:
+                    primary_step = step_name.rsplit("_retry_", 1)[0]
+                    warnings.append(f"{primary_step} primary attempt failed; fallback '{attempt_mode}' succeeded.")
+                segment_ok = True
+                break
+
+        if not keep_temp_files:
+            removed.extend(cleanup_loader_shuffle_files(segment_path))
+        if not segment_ok:
+            write_load_checkpoint(checkpoint_path, checkpoint)
+            return False, steps, warnings, removed
+
+        checkpoint["byte_offset"] = end_offset
+        checkpoint["records_committed"] = int(checkpoint.get("records_committed", 0)) + segment_count
+        checkpoint["segments_completed"] = segment_no
+        write_load_checkpoint(checkpoint_path, checkpoint)
+        if segment_path != load_input_jsonl:
+            segment_path.unlink(missing_ok=True)
+
+    checkpoint["completed"] = True
+    write_load_checkpoint(checkpoint_path, checkpoint)
+    return True, steps, warnings, removed
+
+
+def default_thread_candidates(cpu_count: int) -> list[int]:
+    """Thread counts to try when calibrating: 1/8, 1/4, 1/2 and all of the CPUs."""
+    return sorted({max(1, cpu_count // divisor) for divisor in (8, 4, 2, 1)})
+
+
+def choose_load_threads(
+    trials: list[dict[str, Any]], tolerance: float = 0.05, failure_margin: float = 0.01
+) -> tuple[int | None, str]:
+    """Pick the thread count for the full load from calibration trials.
+
+    Only successful trials whose failure rate is within failure_margin of the lowest one
+    are eligible. Among those, the fewest threads reaching (1 - tolerance) of the best
+    records/sec win, since more threads past that point only add contention.
+    Returns (threads or None, reason).
+    """
+    usable = [trial for trial in trials if trial["ok"] and trial["records_per_second"]]
+    if not usable:
+        return None, "no calibration slice loaded successfully"
+    lowest_failure = min(trial["failure_rate"] for trial in usable)
+    eligible = [trial for trial in usable if trial["failure_rate"] <= lowest_failure + failure_margin]
+    best = max(eligible, key=lambda trial: trial["records_per_second"])
+    chosen = min(
+        (trial for trial in eligible if trial["records_per_second"] >= best["records_per_second"] * (1 - tolerance)),
+        key=lambda trial: trial["threads"],
+    )
+    if chosen is best:
+        reason = f"highest throughput ({best['records_per_second']:,.0f} rec/s)"
+    else:
+        reason = (
+            f"{chosen['records_per_second']:,.0f} rec/s is within {tolerance:.0%} of the best "
+            f"({best['records_per_second']:,.0f} rec/s at {best['threads']} threads) with fewer threads"
+        )
+    return chosen["threads"], reason
+
+
+def calibration_rate(step: dict[str, Any], records: int) -> tuple[float | None, str]:
+    """Steady-state records/sec of one calibration slice and where it came from.
+
+    Prefers the loader's own throughput: the median per-second completions of the SDK
+    loader, or the count delta between the first and last progress samples of the file
+    loader, which leaves out process start-up and engine initialization. Falls back to
+    the last rate the loader printed, then to records over the whole step duration.
+    """
+    per_second = ((step.get("loader") or {}).get("throughput") or {}).get("records_per_second") or {}
+    if per_second.get("p50"):
+        return float(per_second["p50"]), "sdk_throughput_p50"
+    progress_samples = (step.get("progress") or {}).get("samples") or []
+    samples = [sample for sample in progress_samples if sample.get("count") is not None]
+    if len(samples) >= 2 and samples[-1]["t"] > samples[0]["t"] and samples[-1]["count"] > samples[0]["count"]:
+        rate = (samples[-1]["count"] - samples[0]["count"]) / (samples[-1]["t"] - samples[0]["t"])
+        return round(rate, 1), "progress_samples"
+    if samples and samples[-1].get("rate"):
+        return float(samples[-1]["rate"]), "progress_rate"
+    duration = float(step.get("duration_seconds") or 0.0)
+    return (round(records / duration, 1) if duration > 0 else None), "step_duration"
+
+
+def calibrate_load_threads(
+    load_input_jsonl: Path,
+    start_offset: int,
+    candidates: list[int],
+    slice_records: int,
+    slices_dir: Path,
+    run_slice: Callable[[int, Path, int], dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int, int]:
+    """Load consecutive slices of the input at each candidate thread count and measure them.
+
+    Slice i holds the slice_records records following slice i-1, starting at
+    start_offset, so nothing is loaded twice and the caller can commit the calibrated
+    prefix. run_slice(threads, slice path, records) loads one slice and returns its step;
+    records/sec comes from calibration_rate and the failure rate from the step's loader
+    stats when present, otherwise from its exit status. Returns (trials, steps, end byte
+    offset, records loaded).
+    """
+    trials: list[dict[str, Any]] = []
+    steps: list[dict[str, Any]] = []
+    offset = start_offset
+    loaded = 0
+    for threads in candidates:
+        slice_path = slices_dir / f"calibration_{threads:03d}_threads.jsonl"
+        end_offset, records = write_input_slice(load_input_jsonl, offset, slice_records, slice_path)
+        if records == 0:
+            slice_path.unlink(missing_ok=True)
+            break
+        step = run_slice(threads, slice_path, records)
+        slice_path.unlink(missing_ok=True)
+        steps.append(step)
+        loader_stats = step.get("loader") or {}
+        if "records_failed" in loader_stats:
+            failure_rate = int(loader_stats["records_failed"]) / records
+        else:
+            failure_rate = 0.0 if step["ok"] else 1.0
+        records_per_second, rate_source = calibration_rate(step, records)
+        trials.append(
+            {
+                "threads": threads,
+                "records": records,
+                "duration_seconds": float(step.get("duration_seconds") or 0.0),
+                "records_per_second": records_per_second,
+                "rate_source": rate_source,
+                "failure_rate": round(failure_rate, 4),
+                "ok": bool(step["ok"]),
+            }
+        )
+        offset = end_offset
+        loaded += records
+    return trials, steps, offset, loaded
+
+
+# Shell bookkeeping variables that describe the capturing shell, not the Senzing setup.
+SETUP_ENV_VOLATILE_KEYS = ("_", "SHLVL", "PWD", "OLDPWD")
+SETUP_ENV_CACHE: dict[tuple[str, int, str], dict[str, str]] = {}
+
+
+def setup_env_cache_key(project_setup_env: Path) -> tuple[str, int, str] | None:
+    """Cache key of a setupEnv file (path, mtime, sha256), or None when unreadable."""
+    try:
+        content = project_setup_env.read_bytes()
+        mtime_ns = project_setup_env.stat().st_mtime_ns
+    except OSError:
+        return None
+    return str(project_setup_env.absolute()), mtime_ns, hashlib.sha256(content).hexdigest()
+
+
 def load_setup_env(project_setup_env: Path) -> dict[str, str]:
-    """Load environment variables by sourcing setupEnv in a subshell."""
+    """Load environment variables by sourcing setupEnv in a subshell.
+
+    The result is cached in memory by setupEnv path, mtime and sha256, so the login
+    shell runs once per setupEnv in this process. It is not persisted: setupEnv
+    extends the parent environment (PATH, library paths, the active venv), so another
+    shell may resolve it differently. Explain worker processes are seeded with this
+    process's result (see init_explain_worker). Returns {} on failure.
+    """
+    key = setup_env_cache_key(project_setup_env)
+    if key is None:
+        return {}
+    if key in SETUP_ENV_CACHE:
+        return dict(SETUP_ENV_CACHE[key])
+
     cmd = f"source {shlex.quote(str(project_setup_env))} >/dev/null 2>&1 && env -0"
     result = subprocess.run(
         ["bash", "-lc", cmd],
@@ -265,9 +1116,13 @@ def load_setup_env(project_setup_env: Path) -> dict[str, str]:
     for item in result.stdout.split(b"\x00"):
         if not item or b"=" not in item:
             continue
-        key, value = item.split(b"=", 1)
-        env_map[key.decode("utf-8", errors="replace")] = value.decode("utf-8", errors="replace")
-    return env_map
+        name, value = item.split(b"=", 1)
+        env_map[name.decode("utf-8", errors="replace")] = value.decode("utf-8", errors="replace")
+    for name in SETUP_ENV_VOLATILE_KEYS:
+        env_map.pop(name, None)
+
+    SETUP_ENV_CACHE[key] = env_map
+    return dict(env_map)
 
 
 def build_engine_config_json(project_dir: Path) -> str:
@@ -533,26 +1388,804 @@ def run_sdk_why_records(
     }
 
 
-def write_sdk_log(
+EXPORT_CSV_COLUMNS = "RESOLVED_ENTITY_ID,RELATED_ENTITY_ID,MATCH_LEVEL,MATCH_KEY,DATA_SOURCE,RECORD_ID"
+
+
+def iter_sdk_export_lines(g2: Any, csv_columns: str = EXPORT_CSV_COLUMNS) -> Iterator[str]:
+    """Yield the CSV entity export of the SDK line by line (header first).
+
+    Uses export_csv_entity_report/fetch_next (SzEngine) or exportCSVEntityReport/fetchNext
+    (G2Engine) with the SDK default export flags; the export handle is always closed.
+    """
+    if hasattr(g2, "export_csv_entity_report"):
+        close_export = getattr(g2, "close_export_report", None) or getattr(g2, "close_export", None)
+        if close_export is None:
+            raise RuntimeError("SDK engine has export_csv_entity_report but no close_export_report/close_export.")
+        handle = g2.export_csv_entity_report(csv_columns)
+        try:
+            while True:
+                line = g2.fetch_next(handle)
+                if not line:
+                    break
+                yield line
+        finally:
+            close_export(handle)
+        return
+
+    if hasattr(g2, "exportCSVEntityReport"):
+        handle = g2.exportCSVEntityReport(csv_columns)
+        try:
+            while True:
+                response = bytearray()
+                g2.fetchNext(handle, response)
+                if not response:
+                    break
+                yield response.decode("utf-8", errors="replace")
+        finally:
+            g2.closeExport(handle)
+        return
+
+    raise RuntimeError("No supported SDK method available for CSV entity export.")
+
+
+EXPLAIN_LOG_INDEX_FIELDS = ["kind", "index", "offset", "length", "ok", "key"]
+
+
+class ExplainLog:
+    """Append-only JSONL log of explain SDK calls with a byte-offset index.
+
+    Replaces one pretty-printed file per call. Each call becomes one JSON line in
+    `log_path` (optionally gzip/bz2/xz compressed); `index_path` is a TSV with the
+    uncompressed byte offset and length of every line, so single entries can be
+    read back with `read_explain_log_entry` without parsing the whole log.
+    """
+
+    def __init__(
+        self, log_path: Path, index_path: Path, compression: str | None = None, buffer_size: int = 1 << 20
+    ) -> None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_path = log_path
+        self.index_path = index_path
+        if compression == "gzip":
+            self._raw: Any = gzip.open(log_path, "wb", compresslevel=6)
+        elif compression == "bz2":
+            self._raw = bz2.open(log_path, "wb")
+        elif compression == "xz":
+            self._raw = lzma.open(log_path, "wb")
+        else:
+            self._raw = log_path.open("wb", buffering=buffer_size)
+        self._index_file = index_path.open("w", encoding="utf-8", newline="", buffering=buffer_size)
+        self._index = csv.writer(self._index_file, delimiter="\t", lineterminator="\n")
+        self._index.writerow(EXPLAIN_LOG_INDEX_FIELDS)
+        self._offset = 0
+        self.entries = 0
+
+    def __enter__(self) -> "ExplainLog":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.close()
+
+    def append(
+        self,
+        kind: str,
+        index: int,
+        step_name: str,
+        input_payload: dict[str, Any],
+        sdk_result: dict[str, Any],
+        duration_seconds: float,
+    ) -> int:
+        """Append one explain SDK invocation and return its offset in the (uncompressed) log."""
+        payload = {
+            "kind": kind,
+            "index": index,
+            "step": step_name,
+            "duration_seconds": duration_seconds,
+            "input": input_payload,
+            "ok": sdk_result.get("ok"),
+            "method": sdk_result.get("method"),
+            "cache_hit": bool(sdk_result.get("cache_hit")),
+            "error": sdk_result.get("error"),
+            "output_json": sdk_result.get("output_json"),
+            "output_text": sdk_result.get("output_text"),
+        }
+        line = (json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        offset = self._offset
+        self._raw.write(line)
+        self._offset += len(line)
+        self.entries += 1
+        self._index.writerow(
+            [kind, index, offset, len(line), 1 if sdk_result.get("ok") else 0, explain_payload_key(kind, input_payload)]
+        )
+        return offset
+
+    def close(self) -> None:
+        """Flush and close the log and its index."""
+        self._raw.close()
+        self._index_file.close()
+
+
+def explain_payload_key(kind: str, payload: dict[str, Any]) -> str:
+    """Lookup key of an explain call: DS:RID, or DS1:RID1|DS2:RID2 for record pairs."""
+    if kind == "why_entity":
+        return f"{payload.get('data_source', '')}:{payload.get('record_id', '')}"
+    return (
+        f"{payload.get('anchor_data_source', '')}:{payload.get('anchor_record_id', '')}|"
+        f"{payload.get('matched_data_source', '')}:{payload.get('matched_record_id', '')}"
+    )
+
+
+def read_explain_log_entry(log_path: Path, offset: int, length: int) -> dict[str, Any]:
+    """Read one explain log entry by offset/length from the index.
+
+    Compressed logs are seeked by decompressing forward, so lookups there are slower.
+    """
+    with open_file(log_path, "rb") as infile:
+        infile.seek(offset)
+        return json.loads(infile.read(length).decode("utf-8"))
+
+
+def iter_explain_log(log_path: Path, index_path: Path, kind: str) -> Iterator[dict[str, Any]]:
+    """Stream the explain log entries of one kind in call order, reading them through the offset index.
+
+    Offsets only grow, so a compressed log is still read in a single forward pass.
+    """
+    if not log_path.exists() or not index_path.exists():
+        return
+    with index_path.open("r", encoding="utf-8", newline="") as index_file, open_file(log_path, "rb") as log_file:
+        for row in csv.DictReader(index_file, delimiter="\t"):
+            if row["kind"] != kind:
+                continue
+            log_file.seek(int(row["offset"]))
+            yield json.loads(log_file.read(int(row["length"])).decode("utf-8"))
+
+
+SENZING_BUILD_VERSION_FILES = ("szBuildVersion.json", "g2BuildVersion.json")
+
+
+def compute_engine_config_hash(engine_factory: Any, project_dir: Path, data_sources: list[str]) -> tuple[str, str]:
+    """Hash the engine configuration for explain cache keys.
+
+    Prefers the default config JSON exported by the SDK (stable across fresh projects
+    with the same Senzing version and data sources). Falls back to the project build
+    version file plus the configured data sources. Returns (hash, source).
+    """
+    try:
+        create_config_manager = getattr(engine_factory, "create_configmanager", None) or getattr(
+            engine_factory, "create_config_manager"
+        )
+        config_manager = create_config_manager()
+        config_id = config_manager.get_default_config_id()
+        if hasattr(config_manager, "create_config_from_config_id"):
+            config_text = config_manager.create_config_from_config_id(config_id).export()
+        else:
+            config_text = config_manager.get_config(config_id)
+        config_obj = try_parse_json(str(config_text))
+        canonical = json.dumps(config_obj, sort_keys=True) if config_obj is not None else str(config_text)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest(), "sdk_default_config"
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+    digest = hashlib.sha256()
+    source = "data_sources"
+    for name in SENZING_BUILD_VERSION_FILES:
+        version_file = project_dir / name
+        if version_file.exists():
+            digest.update(version_file.read_bytes())
+            source = f"{name}+data_sources"
+            break
+    digest.update("\n".join(sorted(data_sources)).encode("utf-8"))
+    return digest.hexdigest(), source
+
+
+def build_entity_content_hashes(
+    input_jsonl_path: Path,
+    export_index: ExportIndex,
+    entity_ids: set[str],
+) -> dict[str, list[str]]:
+    """Map each resolved entity to sorted DATA_SOURCE:RECORD_ID:content-hash entries of its records."""
+    members_by_key: dict[tuple[str, str], str] = {}
+    for entity_id, data_source, record_id, _match_level, _match_key in export_index.iter_rows():
+        if entity_id in entity_ids:
+            members_by_key[(data_source, record_id)] = entity_id
+
+    hashes_by_entity: dict[str, list[str]] = defaultdict(list)
+    with open_file(input_jsonl_path) as infile:
+        for line in infile:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            key = (str(record.get("DATA_SOURCE", "")), str(record.get("RECORD_ID", "")))
+            entity_id = members_by_key.get(key)
+            if entity_id is None:
+                continue
+            content = json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")
+            hashes_by_entity[entity_id].append(f"{key[0]}:{key[1]}:{hashlib.sha1(content).hexdigest()}")
+    return {entity_id: sorted(entries) for entity_id, entries in hashes_by_entity.items()}
+
+
+class ExplainCache:
+    """SQLite cache of successful explain results, reused across runs.
+
+    Keys hash the engine configuration, the explain kind, the explained
+    (DATA_SOURCE, RECORD_ID) pairs and the content of every record in their entity, so an
+    answer is only reused when the same data resolved the same way under the same
+    configuration. Resolved entity IDs are left out: they are reassigned on every reload.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        config_hash: str,
+        entity_hashes: dict[str, list[str]],
+        commit_every: int = 500,
+    ) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.config_hash = config_hash
+        self.entity_hashes = entity_hashes
+        self.commit_every = commit_every
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS explain_cache (
+                cache_key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                method TEXT,
+                output BLOB NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._uncommitted = 0
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.stored = 0
+
+    def key_for(self, kind: str, payload: dict[str, Any]) -> str:
+        """Build the cache key of one explain call."""
+        if kind == "why_entity":
+            records = [[payload.get("data_source"), payload.get("record_id")]]
+        else:
+            records = [
+                [payload.get("anchor_data_source"), payload.get("anchor_record_id")],
+                [payload.get("matched_data_source"), payload.get("matched_record_id")],
+            ]
+        members = self.entity_hashes.get(str(payload.get("resolved_entity_id", "")), [])
+        material = json.dumps(
+            [self.config_hash, kind, records, members],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, kind: str, key: str) -> dict[str, Any] | None:
+        """Return a cached sdk_result, or None on a miss."""
+        row = self._conn.execute("SELECT method, output FROM explain_cache WHERE cache_key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses[kind] += 1
+            return None
+        self.hits[kind] += 1
+        output_text = zlib.decompress(row[1]).decode("utf-8")
+        return {
+            "ok": True,
+            "method": row[0],
+            "output_text": output_text,
+            "output_json": try_parse_json(output_text),
+            "error": None,
+            "cache_hit": True,
+        }
+
+    def put(self, kind: str, key: str, sdk_result: dict[str, Any]) -> None:
+        """Store a successful sdk_result."""
+        if not sdk_result.get("ok"):
+            return
+        output_text = str(sdk_result.get("output_text") or "")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO explain_cache (cache_key, kind, method, output, created_at) VALUES (?, ?, ?, ?, ?)",
+            (key, kind, sdk_result.get("method"), zlib.compress(output_text.encode("utf-8"), 6), now_timestamp()),
+        )
+        self.stored += 1
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit pending inserts and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def summary(self) -> dict[str, Any]:
+        """Cache statistics for explain_summary."""
+        hits = sum(self.hits.values())
+        lookups = hits + sum(self.misses.values())
+        return {
+            "enabled": True,
+            "path": str(self.db_path),
+            "config_hash": self.config_hash,
+            "lookups": lookups,
+            "hits": hits,
+            "misses": lookups - hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "hits_by_kind": dict(self.hits),
+            "misses_by_kind": dict(self.misses),
+            "stored": self.stored,
+        }
+
+
+# Engine handle owned by each explain worker process (process executor only).
+EXPLAIN_WORKER_ENGINE: Any = None
+EXPLAIN_WORKER_CLEANUP: Any = None
+EXPLAIN_WORKER_ERROR: str | None = None
+
+
+def run_explain_call(g2: Any, kind: str, payload: dict[str, str]) -> tuple[dict[str, Any], float]:
+    """Run one why-entity or why-records call and return (sdk_result, duration_seconds)."""
+    started = time.time()
+    if kind == "why_entity":
+        sdk_result = run_sdk_why_entity(g2, payload["data_source"], payload["record_id"])
+    else:
+        sdk_result = run_sdk_why_records(
+            g2,
+            payload["anchor_data_source"],
+            payload["anchor_record_id"],
+            payload["matched_data_source"],
+            payload["matched_record_id"],
+        )
+    return sdk_result, round(time.time() - started, 3)
+
+
+def destroy_explain_worker_engine() -> None:
+    """Release the per-process explain engine at worker exit."""
+    try:
+        if EXPLAIN_WORKER_CLEANUP is not None and hasattr(EXPLAIN_WORKER_CLEANUP, "destroy"):
+            EXPLAIN_WORKER_CLEANUP.destroy()
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+
+def init_explain_worker(project_dir: str, project_setup_env: str, setup_env: dict[str, str] | None = None) -> None:
+    """Process-pool initializer: give each worker its own SDK engine.
+
+    setup_env is the parent's resolved setupEnv environment; it seeds this worker's
+    cache so the worker does not source setupEnv again.
+    """
+    global EXPLAIN_WORKER_ENGINE, EXPLAIN_WORKER_CLEANUP, EXPLAIN_WORKER_ERROR  # pylint: disable=global-statement
+    key = setup_env_cache_key(Path(project_setup_env))
+    if setup_env and key is not None:
+        SETUP_ENV_CACHE[key] = dict(setup_env)
+    g2, cleanup_target, details = init_g2_engine(Path(project_dir), Path(project_setup_env))
+    EXPLAIN_WORKER_ENGINE = g2
+    EXPLAIN_WORKER_CLEANUP = cleanup_target
+    EXPLAIN_WORKER_ERROR = None if g2 else str(details.get("error") or "SDK init failed in explain worker.")
+    multiprocessing.util.Finalize(None, destroy_explain_worker_engine, exitpriority=10)
+
+
+def run_explain_call_in_worker(kind: str, payload: dict[str, str]) -> tuple[dict[str, Any], float]:
+    """Process-pool task: run one explain call on this worker's engine."""
+    if EXPLAIN_WORKER_ENGINE is None:
+        return {
+            "ok": False,
+            "method": None,
+            "output_text": "",
+            "output_json": None,
+            "error": EXPLAIN_WORKER_ERROR or "Explain worker engine not initialized.",
+        }, 0.0
+    return run_explain_call(EXPLAIN_WORKER_ENGINE, kind, payload)
+
+
+def create_explain_executor(
+    workers: int,
+    executor_kind: str,
+    project_dir: Path,
+    project_setup_env: Path,
+) -> Executor | None:
+    """Create the explain worker pool, or None for sequential calls on the main engine."""
+    if workers <= 1:
+        return None
+    if executor_kind == "process":
+        # Spawn, not fork: a forked child must not inherit the parent's native engine state.
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_explain_worker,
+            initargs=(str(project_dir), str(project_setup_env), load_setup_env(project_setup_env)),
+        )
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="explain")
+
+
+def iter_explain_results(
+    kind: str,
+    payloads: list[dict[str, str]],
+    g2: Any,
+    executor: Executor | None,
+    max_in_flight: int,
+    cache: ExplainCache | None = None,
+) -> Iterator[tuple[int, dict[str, str], dict[str, Any], float]]:
+    """Yield (index, payload, sdk_result, duration) in input order.
+
+    With an executor, at most max_in_flight calls are outstanding; results are
+    released strictly in submission order so output files keep input ordering.
+    With a cache, hits are served without an SDK call (sdk_result["cache_hit"] is
+    True, duration 0) and successful misses are stored.
+    """
+    pending: deque[tuple[int, dict[str, str], str | None, Any]] = deque()
+
+    def release() -> tuple[int, dict[str, str], dict[str, Any], float]:
+        index, payload, cache_key, outcome = pending.popleft()
+        if isinstance(outcome, tuple):
+            sdk_result, duration = outcome
+        else:
+            try:
+                sdk_result, duration = outcome.result()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                sdk_result = {"ok": False, "method": None, "output_text": "", "output_json": None, "error": str(err)}
+                duration = 0.0
+        if cache is not None and cache_key and not sdk_result.get("cache_hit"):
+            cache.put(kind, cache_key, sdk_result)
+        return index, payload, sdk_result, duration
+
+    for index, payload in enumerate(payloads, start=1):
+        cache_key = cache.key_for(kind, payload) if cache is not None else None
+        cached = cache.get(kind, cache_key) if cache is not None and cache_key else None
+        if cached is not None:
+            outcome: Any = (cached, 0.0)
+        elif executor is None:
+            outcome = run_explain_call(g2, kind, payload)
+        elif isinstance(executor, ProcessPoolExecutor):
+            outcome = executor.submit(run_explain_call_in_worker, kind, payload)
+        else:
+            outcome = executor.submit(run_explain_call, g2, kind, payload)
+        pending.append((index, payload, cache_key, outcome))
+        if len(pending) >= max_in_flight:
+            yield release()
+    while pending:
+        yield release()
+
+
+def latency_percentiles(durations: list[float]) -> dict[str, Any]:
+    """Summarize per-call latencies (seconds) with nearest-rank percentiles."""
+    if not durations:
+        return {"count": 0, "mean": None, "p50": None, "p90": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(durations)
+
+    def rank(pct: float) -> float:
+        return ordered[max(0, min(len(ordered) - 1, int(-(-pct * len(ordered) // 100)) - 1))]
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": rank(50),
+        "p90": rank(90),
+        "p95": rank(95),
+        "p99": rank(99),
+        "max": ordered[-1],
+    }
+
+
+class SzStubRetryableError(Exception):
+    """Retryable failure raised by StubSenzingEngine."""
+
+
+class SzStubBadInputError(Exception):
+    """Bad-input failure raised by StubSenzingEngine."""
+
+
+class StubSenzingEngine:
+    """In-process stand-in for the Senzing engine, for loader tests and benchmarks.
+
+    add_record sleeps `latency_seconds` and fails with the given rates; other
+    calls are not implemented.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        bad_input_rate: float = 0.0,
+        retryable_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.bad_input_rate = bad_input_rate
+        self.retryable_rate = retryable_rate
+        self.records_added = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def add_record(self, data_source: str, record_id: str, record_definition: str, flags: int = 0) -> str:
+        """Accept one record, simulating latency and failures."""
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.bad_input_rate:
+            raise SzStubBadInputError(f"Stub rejected {data_source}:{record_id}")
+        if roll < self.bad_input_rate + self.retryable_rate:
+            raise SzStubRetryableError(f"Stub transient failure for {data_source}:{record_id}")
+        with self._lock:
+            self.records_added += 1
+        return ""
+
+    def destroy(self) -> None:
+        """Nothing to release."""
+
+
+def run_sdk_add_record(g2: Any, data_source: str, record_id: str, record_json: str) -> None:
+    """Add one record via the modern (add_record) or legacy (addRecord) SDK API."""
+    if hasattr(g2, "add_record"):
+        g2.add_record(data_source, record_id, record_json)
+        return
+    if hasattr(g2, "addRecord"):
+        g2.addRecord(data_source, record_id, record_json)
+        return
+    raise AttributeError("No supported SDK method available for add record.")
+
+
+def classify_sdk_error(err: BaseException) -> str:
+    """Map SDK exceptions to retry classes: retryable, bad_input, fatal or other."""
+    names = " ".join(cls.__name__ for cls in type(err).__mro__)
+    if "Retryable" in names or "RetryTimeoutExceeded" in names:
+        return "retryable"
+    if "BadInput" in names or "NotFound" in names or "UnknownDataSource" in names:
+        return "bad_input"
+    if "Unrecoverable" in names or "Database" in names or "License" in names or isinstance(err, AttributeError):
+        return "fatal"
+    return "other"
+
+
+def summarize_throughput(per_second_counts: list[int], bins: int = 10) -> dict[str, Any]:
+    """Summarize records completed per wall-clock second with an equal-width histogram."""
+    if not per_second_counts:
+        return {"seconds": 0, "records_per_second": None, "histogram": []}
+    ordered = sorted(per_second_counts)
+    peak = ordered[-1]
+    width = max(1, -(-peak // bins)) if peak else 1
+    histogram: Counter[int] = Counter(min(count // width, bins - 1) for count in per_second_counts)
+    return {
+        "seconds": len(per_second_counts),
+        "records_per_second": {
+            "mean": round(sum(ordered) / len(ordered), 1),
+            "p10": ordered[int(0.1 * (len(ordered) - 1))],
+            "p50": ordered[int(0.5 * (len(ordered) - 1))],
+            "p90": ordered[int(0.9 * (len(ordered) - 1))],
+            "max": peak,
+        },
+        "histogram": [
+            {
+                "records_per_second_from": b * width,
+                "records_per_second_to": (b + 1) * width,
+                "seconds": histogram.get(b, 0),
+            }
+            for b in range(bins)
+            if b * width <= peak
+        ],
+    }
+
+
+def load_records_with_sdk(
+    g2: Any,
+    input_jsonl: Path,
     log_path: Path,
-    step_name: str,
-    input_payload: dict[str, Any],
-    sdk_result: dict[str, Any],
-    duration_seconds: float,
-) -> None:
-    """Write one explain SDK invocation log file."""
+    threads: int,
+    max_in_flight: int,
+    retry_policy: dict[str, int],
+    progress_seconds: float = 10.0,
+    timeout_seconds: int | None = None,
+    step_name: str = "load_records",
+    start_offset: int = 0,
+    checkpoint_fn: Callable[[int, int], None] | None = None,
+    max_failure_rate: float = 0.1,
+) -> dict[str, Any]:
+    """Load JSONL records in-process by calling add-record from a thread pool.
+
+    The reader thread parses DATA_SOURCE/RECORD_ID, passes the raw JSON line to the
+    SDK and blocks once max_in_flight records are pending. Failures are retried per
+    error class (retry_policy maps class -> max retries; retryable errors back off
+    exponentially). A fatal error stops the load. The step also fails, without any
+    further retry, when no record loads or more than max_failure_rate of the records
+    fail. Returns a run_shell_step-style step.
+
+    Reading starts at byte start_offset of the (uncompressed) JSONL. checkpoint_fn,
+    when given, receives (byte offset, records) of the contiguous prefix of lines
+    whose records are settled (loaded, or failed without retry left); it is called
+    with every progress line and at the end.
+    """
+    started = time.time()
+    monotonic_start = time.monotonic()
+    deadline = monotonic_start + timeout_seconds if timeout_seconds else None
+    lock = threading.Lock()
+    in_flight = threading.BoundedSemaphore(max(1, max_in_flight))
+    per_second: Counter[int] = Counter()
+    error_counts: Counter[str] = Counter()
+    stats = {"submitted": 0, "loaded": 0, "failed": 0, "retries": 0, "invalid_lines": 0}
+    error_samples: list[str] = []
+    fatal_error: list[str] = []
+    timed_out = False
+
+    # Contiguous completion watermark over input lines (sequence numbers).
+    line_end_offsets: dict[int, int] = {}
+    settled: set[int] = set()
+    watermark = {"seq": 0, "offset": start_offset, "records": 0}
+
+    def settle(seq: int) -> None:
+        with lock:
+            settled.add(seq)
+            while watermark["seq"] + 1 in settled:
+                watermark["seq"] += 1
+                settled.discard(watermark["seq"])
+                watermark["offset"] = line_end_offsets.pop(watermark["seq"])
+                watermark["records"] += 1
+
+    def add_with_retry(data_source: str, record_id: str, record_json: str) -> bool:
+        """Return True when the record is settled (loaded, or failed for good)."""
+        attempt = 0
+        while True:
+            if fatal_error:
+                return False
+            try:
+                run_sdk_add_record(g2, data_source, record_id, record_json)
+                with lock:
+                    stats["loaded"] += 1
+                    per_second[int(time.monotonic() - monotonic_start)] += 1
+                return True
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                error_class = classify_sdk_error(err)
+                if attempt < retry_policy.get(error_class, 0) and not fatal_error:
+                    attempt += 1
+                    with lock:
+                        stats["retries"] += 1
+                    if error_class == "retryable":
+                        time.sleep(min(2.0, 0.05 * (2 ** (attempt - 1))))
+                    continue
+                with lock:
+                    stats["failed"] += 1
+                    error_counts[error_class] += 1
+                    per_second[int(time.monotonic() - monotonic_start)] += 1
+                    if len(error_samples) < 1000:
+                        error_samples.append(f"{error_class}\t{data_source}:{record_id}\t{err}")
+                    if error_class == "fatal" and not fatal_error:
+                        fatal_error.append(str(err))
+                return error_class != "fatal"
+
+    def release(seq: int, future: Any) -> None:
+        in_flight.release()
+        if not future.cancelled() and future.exception() is None and future.result():
+            settle(seq)
+
+    last_progress = time.monotonic()
+    progress_lines: list[str] = []
+
+    def report_progress() -> None:
+        elapsed = max(time.monotonic() - monotonic_start, 1e-9)
+        with lock:
+            done = stats["loaded"] + stats["failed"]
+            line = (
+                f"{step_name}(sdk): {done} done, {stats['loaded']} loaded, {stats['failed']} failed, "
+                f"{done / elapsed:.0f} rec/s"
+            )
+        progress_lines.append(line)
+        print(line, flush=True)
+        if checkpoint_fn is not None:
+            with lock:
+                committed_offset, committed_records = watermark["offset"], watermark["records"]
+            checkpoint_fn(committed_offset, committed_records)
+
+    with ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="sdk-load") as pool:
+        with input_jsonl.open("rb") as infile:
+            infile.seek(start_offset)
+            offset = start_offset
+            seq = 0
+            for line_no, raw_line in enumerate(infile, start=1):
+                offset += len(raw_line)
+                text = raw_line.decode("utf-8", errors="replace").strip()
+                if not text:
+                    continue
+                if fatal_error:
+                    break
+                if deadline and time.monotonic() > deadline:
+                    timed_out = True
+                    break
+                seq += 1
+                with lock:
+                    line_end_offsets[seq] = offset
+                try:
+                    record = json.loads(text)
+                    data_source = str(record["DATA_SOURCE"])
+                    record_id = str(record["RECORD_ID"])
+                except (json.JSONDecodeError, KeyError, TypeError) as err:
+                    with lock:
+                        stats["invalid_lines"] += 1
+                        stats["failed"] += 1
+                        error_counts["invalid_json"] += 1
+                        if len(error_samples) < 1000:
+                            error_samples.append(f"invalid_json\tline {line_no}\t{err}")
+                    settle(seq)
+                    continue
+                in_flight.acquire()
+                stats["submitted"] += 1
+                future = pool.submit(add_with_retry, data_source, record_id, text)
+                future.add_done_callback(lambda done, seq=seq: release(seq, done))
+                if time.monotonic() - last_progress >= progress_seconds:
+                    report_progress()
+                    last_progress = time.monotonic()
+    report_progress()
+
+    elapsed = round(time.time() - started, 3)
+    total_seconds = int(time.monotonic() - monotonic_start) + 1
+    throughput = summarize_throughput([per_second.get(second, 0) for second in range(total_seconds)])
+    attempted = stats["loaded"] + stats["failed"]
+    failure_rate = stats["failed"] / attempted if attempted else 0.0
+    too_many_failures = attempted > 0 and (stats["loaded"] == 0 or failure_rate > max_failure_rate)
+    ok = not fatal_error and not timed_out and not too_many_failures
+    loader_stats = {
+        "mode": "sdk",
+        "threads": threads,
+        "max_in_flight": max_in_flight,
+        "retry_policy": retry_policy,
+        "records_submitted": stats["submitted"],
+        "records_loaded": stats["loaded"],
+        "records_failed": stats["failed"],
+        "invalid_lines": stats["invalid_lines"],
+        "retries": stats["retries"],
+        "errors_by_class": dict(error_counts),
+        "failure_rate": round(failure_rate, 4),
+        "max_failure_rate": max_failure_rate,
+        "too_many_failures": too_many_failures,
+        "fatal_error": fatal_error[0] if fatal_error else None,
+        "records_per_second_overall": round(stats["loaded"] / elapsed, 1) if elapsed > 0 else None,
+        "throughput": throughput,
+        "start_offset": start_offset,
+        "committed_offset": watermark["offset"],
+        "committed_records": watermark["records"],
+    }
+
+    stderr_text = "\n".join(error_samples)
+    if fatal_error:
+        stderr_text = f"FATAL: {fatal_error[0]}\n{stderr_text}"
+    if timed_out:
+        stderr_text = f"Load timed out after {timeout_seconds} seconds.\n{stderr_text}"
+    if too_many_failures:
+        stderr_text = (
+            f"{stats['failed']} of {attempted} record(s) failed to load "
+            f"(limit {max_failure_rate:.0%}, see --load-max-failure-rate).\n{stderr_text}"
+        )
+    stdout_text = "\n".join(progress_lines)
+
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
+    with log_path.open("w", encoding="utf-8") as outfile:
+        outfile.write(f"STEP: {step_name}\n")
+        outfile.write(f"COMMAND: sdk:add_record {input_jsonl} (threads={threads}, max_in_flight={max_in_flight})\n")
+        outfile.write(f"EXIT_CODE: {0 if ok else 1}\n")
+        outfile.write(f"TIMED_OUT: {timed_out}\n")
+        outfile.write(f"TIMEOUT_SECONDS: {timeout_seconds if timeout_seconds is not None else 'none'}\n")
+        outfile.write(f"DURATION_SECONDS: {elapsed}\n")
+        outfile.write("\n--- LOADER STATS ---\n")
+        outfile.write(json.dumps(loader_stats, indent=2) + "\n")
+        outfile.write("\n--- STDOUT ---\n")
+        outfile.write(stdout_text)
+        outfile.write("\n--- STDERR ---\n")
+        outfile.write(stderr_text)
+
+    return {
         "step": step_name,
-        "duration_seconds": duration_seconds,
-        "input": input_payload,
-        "ok": sdk_result.get("ok"),
-        "method": sdk_result.get("method"),
-        "error": sdk_result.get("error"),
-        "output_json": sdk_result.get("output_json"),
-        "output_text": sdk_result.get("output_text"),
+        "ok": ok,
+        "exit_code": 0 if ok else (124 if timed_out else 1),
+        "timed_out": timed_out,
+        "duration_seconds": elapsed,
+        "log_file": str(log_path),
+        "stdout_tail": stdout_text[-1200:],
+        "stderr_tail": stderr_text[-1200:],
+        "loader": loader_stats,
     }
-    log_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
 
 def create_project(project_dir: Path, base_setup_env: Path | None, log_path: Path) -> dict[str, Any]:
@@ -618,10 +2251,205 @@ def create_project(project_dir: Path, base_setup_env: Path | None, log_path: Pat
     return combined_log
 
 
+def configure_data_sources(
+    project_setup_env: Path,
+    data_sources: list[str],
+    config_scripts_dir: Path,
+    logs_dir: Path,
+    timeout_seconds: int | None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Register each data source with sz_configtool. Returns (steps, failed data source or None)."""
+    steps: list[dict[str, Any]] = []
+    config_scripts_dir.mkdir(parents=True, exist_ok=True)
+    for index, data_source in enumerate(data_sources, start=1):
+        cfg_file = config_scripts_dir / f"add_{data_source}.g2c"
+        cfg_file.write_text(f"addDataSource {data_source}\nsave\n", encoding="utf-8")
+        step = run_shell_step(
+            f"configure_data_source_{data_source}",
+            ["sz_configtool", "-f", str(cfg_file)],
+            logs_dir / f"01_configure_{index:02d}_{data_source}.log",
+            timeout_seconds=timeout_seconds,
+            setup_env=project_setup_env,
+        )
+        steps.append(step)
+        if not step["ok"]:
+            stdout = (step.get("stdout_tail") or "").lower()
+            stderr = (step.get("stderr_tail") or "").lower()
+            already_exists = "already" in stdout or "already" in stderr or "exist" in stdout or "exist" in stderr
+            if not already_exists:
+                return steps, data_source
+    return steps, None
+
+
+PROJECT_TEMPLATE_META_NAME = "template.json"
+SENZING_INSTALL_DIRS = (Path("/opt/senzing/er"), Path("/opt/senzing/g2"))
+# Project parts Senzing writes to (config, SQLite DB) and top-level files such as setupEnv
+# are always given their own copy; everything else may be hardlinked into the new project.
+PROJECT_PRIVATE_DIRS = ("etc", "var")
+# Only these text files under etc/var get the template path rewritten; everything else
+# (SQLite databases and other binaries) is copied byte for byte.
+PROJECT_PATH_REWRITE_NAMES = ("setupEnv",)
+PROJECT_PATH_REWRITE_SUFFIXES = (".ini", ".json")
+
+
+def find_senzing_build_version(base_setup_env: Path | None) -> str | None:
+    """Return the build version file content of the Senzing install new projects are created from."""
+    roots = ([base_setup_env.parent] if base_setup_env is not None else []) + list(SENZING_INSTALL_DIRS)
+    for root in roots:
+        for name in SENZING_BUILD_VERSION_FILES:
+            version_file = root / name
+            if version_file.is_file():
+                return version_file.read_text(encoding="utf-8", errors="replace")
+    return None
+
+
+def project_template_key(build_version: str, data_sources: list[str]) -> str:
+    """Cache key of a configured project: Senzing build plus the set of data sources."""
+    digest = hashlib.sha256(build_version.encode("utf-8"))
+    digest.update(b"\0" + "\n".join(sorted(set(data_sources))).encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+def read_project_template(template_dir: Path) -> dict[str, Any] | None:
+    """Return template metadata, or None when template_dir holds no finished template."""
+    try:
+        meta = json.loads((template_dir / PROJECT_TEMPLATE_META_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not (template_dir / "project" / "setupEnv").exists():
+        return None
+    return meta
+
+
+def ensure_project_template(
+    cache_dir: Path,
+    build_version: str,
+    data_sources: list[str],
+    base_setup_env: Path | None,
+    logs_dir: Path,
+    timeout_seconds: int | None,
+) -> tuple[Path | None, dict[str, Any] | None, list[dict[str, Any]], str | None]:
+    """Find or build the configured project template for this Senzing build and data sources.
+
+    A miss creates and configures a project in a staging folder next to the cache entry
+    and renames it into place, so concurrent runs never see a half-built template (the
+    loser of a race discards its copy). The template DB is never loaded, so clones start
+    from an empty repository. Returns (template dir, metadata, steps, error).
+    """
+    key = project_template_key(build_version, data_sources)
+    template_dir = cache_dir / key
+    meta = read_project_template(template_dir)
+    if meta is not None:
+        return template_dir, meta, [], None
+
+    staging_dir = cache_dir / f".{key}.building-{os.getpid()}-{now_timestamp()}"
+    staging_project = staging_dir / "project"
+    steps = [create_project(staging_project, base_setup_env, logs_dir / "00_create_project.log")]
+    if not steps[0]["ok"] or not (staging_project / "setupEnv").exists():
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return None, None, steps, "create_project failed"
+    configure_steps, failed_data_source = configure_data_sources(
+        staging_project / "setupEnv", data_sources, staging_dir / "config_scripts", logs_dir, timeout_seconds
+    )
+    steps.extend(configure_steps)
+    if failed_data_source is not None:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return None, None, steps, f"configure_data_source failed for {failed_data_source}"
+
+    meta = {
+        "version": 1,
+        "key": key,
+        "created_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "senzing_build_version": try_parse_json(build_version) or build_version,
+        "data_sources": sorted(set(data_sources)),
+        "template_project_dir": str(staging_project.absolute()),
+    }
+    (staging_dir / PROJECT_TEMPLATE_META_NAME).write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+    try:
+        staging_dir.rename(template_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        meta = read_project_template(template_dir)
+        if meta is None:
+            return None, None, steps, f"Unable to publish project template: {template_dir}"
+    return template_dir, meta, steps, None
+
+
+def clone_project_template(template_dir: Path, meta: dict[str, Any], project_dir: Path) -> dict[str, Any]:
+    """Materialize a new project from a template and return a step summary.
+
+    Shared read-only parts (lib, resources, data, ...) are hardlinked or reflinked; etc,
+    var and top-level files get private copies. The template's own path is replaced by
+    project_dir in the text files among those copies (setupEnv, *.ini, *.json) and in
+    absolute symlinks; all other files are copied unchanged.
+    """
+    start = time.time()
+    source_root = template_dir / "project"
+    old_path = str(meta["template_project_dir"])
+    new_path = str(project_dir.absolute())
+    methods: Counter[str] = Counter()
+    rewritten: list[str] = []
+    step: dict[str, Any] = {
+        "step": "clone_project_template",
+        "ok": False,
+        "exit_code": 1,
+        "template_dir": str(template_dir),
+        "template_key": meta.get("key"),
+    }
+    try:
+        project_dir.parent.mkdir(parents=True, exist_ok=True)
+        project_dir.mkdir()
+        for dir_path, dir_names, file_names in os.walk(source_root):
+            source_dir = Path(dir_path)
+            relative_dir = source_dir.relative_to(source_root)
+            target_dir = project_dir / relative_dir
+            private = not relative_dir.parts or relative_dir.parts[0] in PROJECT_PRIVATE_DIRS
+            for name in list(dir_names):
+                if (source_dir / name).is_symlink():
+                    dir_names.remove(name)
+                    file_names.append(name)
+                else:
+                    (target_dir / name).mkdir()
+                    shutil.copymode(source_dir / name, target_dir / name)
+            for name in file_names:
+                source = source_dir / name
+                target = target_dir / name
+                if source.is_symlink():
+                    link_target = os.readlink(source)
+                    if link_target.startswith(old_path):
+                        link_target = new_path + link_target[len(old_path):]
+                    os.symlink(link_target, target)
+                    methods["symlink"] += 1
+                    continue
+                rewritable = (
+                    name in PROJECT_PATH_REWRITE_NAMES or source.suffix.lower() in PROJECT_PATH_REWRITE_SUFFIXES
+                )
+                if private and rewritable:
+                    content = source.read_bytes()
+                    if old_path.encode("utf-8") in content:
+                        target.write_bytes(content.replace(old_path.encode("utf-8"), new_path.encode("utf-8")))
+                        shutil.copymode(source, target)
+                        methods["rewrite"] += 1
+                        rewritten.append(str(relative_dir / name))
+                        continue
+                methods[clone_file(source, target, allow_hardlink=not private)] += 1
+                shutil.copymode(source, target)
+        step.update({"ok": True, "exit_code": 0})
+    except OSError as err:
+        step["error"] = str(err)
+    step["duration_seconds"] = round(time.time() - start, 3)
+    step["files"] = dict(sorted(methods.items()))
+    step["rewritten_files"] = rewritten
+    return step
+
+
 def parse_args() -> argparse.Namespace:
     """Build CLI parser and return parsed args."""
     parser = argparse.ArgumentParser(description="Manual-style Senzing all-in-one runner.")
-    parser.add_argument("input_file", help="Senzing-ready input (.jsonl or .json array)")
+    parser.add_argument(
+        "input_file",
+        help="Senzing-ready input (.jsonl or .json array, optionally .gz/.bz2/.xz/.zst compressed)",
+    )
     parser.add_argument("--output-root", default="senzing_runs", help="Run artifacts root folder")
     parser.add_argument("--run-name-prefix", default="senzing_e2e", help="Run folder prefix")
     parser.add_argument(
@@ -629,6 +2457,15 @@ def parse_args() -> argparse.Namespace:
         default="/mnt",
         help="Parent directory for isolated project (default: /mnt)",
     )
+    parser.add_argument(
+        "--project-template-cache",
+        default=None,
+        help=(
+            "Directory of pre-configured project templates keyed by Senzing build and data sources "
+            "(e.g. senzing_runs/project_templates). New projects are cloned from it instead of "
+            "created and configured. Default: disabled"
+        ),
+    )
     parser.add_argument(
         "--project-name-prefix",
         default="Senzing_PoC",
@@ -681,11 +2518,87 @@ def parse_args() -> argparse.Namespace:
         default=200,
         help="Maximum matched pairs to explain (default: 200, 0 = no limit)",
     )
+    parser.add_argument(
+        "--explain-sampling",
+        choices=["stratified", "first"],
+        default="stratified",
+        help=(
+            "How to pick matches when they exceed --max-explain-records/--max-explain-pairs: "
+            "spread across MATCH_KEY x MATCH_LEVEL x entity-size strata, or keep the first N "
+            "(default: stratified)"
+        ),
+    )
+    parser.add_argument(
+        "--explain-sample-floor",
+        type=int,
+        default=1,
+        help="Minimum explains per stratum before proportional allocation (default: 1)",
+    )
+    parser.add_argument(
+        "--explain-workers",
+        type=int,
+        default=1,
+        help="Concurrent explain calls (default: 1 = sequential on one engine handle)",
+    )
+    parser.add_argument(
+        "--explain-executor",
+        choices=["thread", "process"],
+        default="thread",
+        help=(
+            "Explain pool type when --explain-workers > 1: threads sharing one engine handle, "
+            "or processes each initializing their own engine (default: thread)"
+        ),
+    )
+    parser.add_argument(
+        "--explain-cache",
+        default=None,
+        help=(
+            "SQLite file caching explain results across runs, keyed by engine configuration "
+            "and record content (e.g. senzing_runs/explain_cache.sqlite). Default: disabled"
+        ),
+    )
+    parser.add_argument(
+        "--explain-log-compression",
+        choices=["none", "gzip", "bz2", "xz"],
+        default="none",
+        help="Compression for the consolidated explain/explain_log.jsonl (default: none)",
+    )
     parser.add_argument(
         "--export-output-name",
         default="entity_export.csv",
         help="Export filename inside run directory (default: entity_export.csv)",
     )
+    parser.add_argument(
+        "--normalize-mode",
+        choices=["fast", "rewrite"],
+        default="fast",
+        help=(
+            "Uncompressed JSONL input: validate every line but reflink/copy already clean files "
+            "(fast), or re-serialize every record (rewrite). Default: fast"
+        ),
+    )
+    parser.add_argument(
+        "--normalize-hardlink",
+        action="store_true",
+        help=(
+            "With --normalize-mode fast, hardlink an already clean input instead of reflinking or copying it. "
+            "The run then shares storage with the input file, so in-place edits of either change both"
+        ),
+    )
+    parser.add_argument(
+        "--exporter",
+        choices=["file", "sdk"],
+        default="file",
+        help=(
+            "Export with sz_export into a CSV that is parsed afterwards (file), or iterate the SDK "
+            "entity export in-process straight into the comparison stage (sdk). Default: file"
+        ),
+    )
+    parser.add_argument(
+        "--export-tee-csv",
+        action="store_true",
+        help="SDK exporter: also write the export CSV artifact (--export-output-name) while reading",
+    )
     parser.add_argument(
         "--step-timeout-seconds",
         type=int,
@@ -698,6 +2611,80 @@ def parse_args() -> argparse.Namespace:
         default=4,
         help="Worker threads for sz_file_loader primary attempt (default: 4)",
     )
+    parser.add_argument(
+        "--auto-threads",
+        action="store_true",
+        help=(
+            "Calibrate --load-threads before the full load: load consecutive slices of the input at each "
+            "candidate thread count and keep the best records/sec at the lowest failure rate"
+        ),
+    )
+    parser.add_argument(
+        "--auto-threads-candidates",
+        default=None,
+        help="Comma-separated thread counts to calibrate (default: 1/8, 1/4, 1/2 and all CPUs)",
+    )
+    parser.add_argument(
+        "--auto-threads-slice-records",
+        type=int,
+        default=10000,
+        help="Records per calibration slice (default: 10000)",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=["file", "sdk"],
+        default="file",
+        help=(
+            "Load with sz_file_loader (file) or in-process SDK add-record calls from a thread pool "
+            "using --load-threads workers (sdk). Default: file"
+        ),
+    )
+    parser.add_argument(
+        "--load-max-in-flight",
+        type=int,
+        default=0,
+        help="SDK loader: max records queued or in progress (default: 0 = 64 x --load-threads)",
+    )
+    parser.add_argument(
+        "--load-retries",
+        type=int,
+        default=3,
+        help="SDK loader: retries for retryable SDK errors (bad input is never retried, other errors once). Default: 3",
+    )
+    parser.add_argument(
+        "--load-max-failure-rate",
+        type=float,
+        default=0.1,
+        help=(
+            "SDK loader: fail the load step when more than this fraction of records fails to load; "
+            "it also fails when no record loads. Default: 0.1"
+        ),
+    )
+    parser.add_argument(
+        "--load-progress-seconds",
+        type=float,
+        default=10.0,
+        help="SDK loader: seconds between progress lines (default: 10)",
+    )
+    parser.add_argument(
+        "--load-segment-records",
+        type=int,
+        default=500000,
+        help=(
+            "File loader: load in segments of at most N records, checkpointing after each "
+            "segment so a retry or --resume skips the segments already loaded "
+            "(0 = whole file in one segment). Default: 500000"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="RUN_DIR",
+        help=(
+            f"Resume an interrupted run from RUN_DIR/{LOAD_CHECKPOINT_NAME}: reuse its project and "
+            "normalized input and load only the records not yet committed"
+        ),
+    )
     parser.add_argument(
         "--load-fallback-threads",
         type=int,
@@ -710,6 +2697,27 @@ def parse_args() -> argparse.Namespace:
         default=4,
         help="Worker threads for sz_snapshot primary attempt (default: 4)",
     )
+    parser.add_argument(
+        "--resource-sample-seconds",
+        type=float,
+        default=1.0,
+        help="Interval for sampling CPU/RSS/IO/threads of each step's process tree from /proc (default: 1.0, 0 = off)",
+    )
+    parser.add_argument(
+        "--resource-timeseries",
+        action="store_true",
+        help="Also write every resource sample to logs/<step log>.resources.jsonl",
+    )
+    parser.add_argument(
+        "--stage-thread-budget",
+        type=int,
+        default=0,
+        help=(
+            "Threads shared by the read-only snapshot and export stages. When it covers the export "
+            "plus at least one snapshot thread they run concurrently, snapshot capped at the rest; "
+            "1 runs them one after another with a single snapshot thread. Default: 0 = CPU count"
+        ),
+    )
     parser.add_argument(
         "--snapshot-fallback-threads",
         type=int,
@@ -742,85 +2750,393 @@ def parse_int(value: Any, fallback: int = 0) -> int:
         return fallback
 
 
-def parse_export_rows(export_file: Path) -> list[dict[str, str]]:
-    """Read sz_export CSV and normalize keys and values."""
-    if not export_file.exists():
-        return []
+NO_ENTITY = -1
+
+
+class ExportIndex:
+    """Integer-encoded view of an sz_export CSV, built in one streaming pass.
+
+    Export rows are kept as parallel typed arrays (record code, entity code, match
+    level, match-key code) instead of one dict per row. Each (DATA_SOURCE, RECORD_ID)
+    is interned once as a record code. Numeric RESOLVED_ENTITY_IDs are stored as
+    their integer value; any other entity ID text gets a negative code.
+
+    Matched records (MATCH_LEVEL > 0) and matched pairs (entity anchor -> matched
+    record) are tracked while scanning, in first-seen order with the values of the
+    last row seen for the same key.
+    """
+
+    def __init__(self) -> None:
+        self.data_sources: list[str] = []
+        self._source_codes: dict[str, int] = {}
+        self._record_codes: list[dict[str, int]] = []
+        self.record_source = array("i")
+        self.record_ids: list[str] = []
+        self.record_entity = array("q")
+        self._record_matched_slot = array("q")
+        self.match_keys: list[str] = []
+        self._match_key_codes: dict[str, int] = {}
+        self._entity_texts: list[str] = []
+        self._entity_text_codes: dict[str, int] = {}
+        self.row_record = array("q")
+        self.row_entity = array("q")
+        self.row_level = array("q")
+        self.row_match_key = array("i")
+        self.entity_sizes: Counter[int] = Counter()
+        self._first_record_of_entity: dict[int, int] = {}
+        self._anchor_of_entity: dict[int, int] = {}
+        self.matched_record_rows = array("q")
+        self.pair_anchor = array("q")
+        self.pair_row = array("q")
+        self._pair_slots: dict[int, int] = {}
+
+    @classmethod
+    def from_csv(cls, export_file: Path) -> "ExportIndex":
+        """Scan an sz_export CSV once; a missing file gives an empty index."""
+        index = cls()
+        if not export_file.exists():
+            return index
+
+        with export_file.open("r", encoding="utf-8", newline="") as infile:
+            sample = infile.read(4096)
+            infile.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+            except csv.Error:
+                dialect = csv.excel
+
+            reader = csv.reader(infile, dialect=dialect)
+            header = next(reader, None)
+            if not header:
+                return index
+            positions = {key.strip().strip('"').strip().upper(): pos for pos, key in enumerate(header)}
+            columns = [
+                positions.get(name)
+                for name in ("RESOLVED_ENTITY_ID", "DATA_SOURCE", "RECORD_ID", "MATCH_LEVEL", "MATCH_KEY")
+            ]
+            for row in reader:
+                if not row:
+                    continue
+                entity_id, data_source, record_id, match_level, match_key = (
+                    row[pos].strip().strip('"').strip() if pos is not None and pos < len(row) else ""
+                    for pos in columns
+                )
+                index.add_row(entity_id, data_source, record_id, parse_int(match_level, fallback=0), match_key)
+        return index
+
+    @classmethod
+    def from_sdk(cls, g2: Any, tee_path: Path | None = None) -> "ExportIndex":
+        """Build the index straight from the SDK entity export.
+
+        Rows come from the SDK with known columns and CSV quoting only, so no dialect
+        sniffing or per-row key/value cleanup is needed. With tee_path the export lines
+        are also written there unchanged (the same CSV sz_export would produce).
+        """
+        index = cls()
+        tee_file: TextIO | None = None
+        if tee_path is not None:
+            tee_path.parent.mkdir(parents=True, exist_ok=True)
+            tee_file = tee_path.open("w", encoding="utf-8", newline="", buffering=1 << 20)
+
+        def tee_lines() -> Iterator[str]:
+            for line in iter_sdk_export_lines(g2):
+                if tee_file is not None:
+                    tee_file.write(line if line.endswith("\n") else line + "\n")
+                yield line
+
+        try:
+            reader = csv.reader(tee_lines())
+            header = next(reader, None)
+            if not header:
+                return index
+            positions = {key.upper(): pos for pos, key in enumerate(header)}
+            entity_pos, source_pos, record_pos, level_pos, key_pos = (
+                positions[name]
+                for name in ("RESOLVED_ENTITY_ID", "DATA_SOURCE", "RECORD_ID", "MATCH_LEVEL", "MATCH_KEY")
+            )
+            for row in reader:
+                if row:
+                    index.add_row(
+                        row[entity_pos],
+                        row[source_pos],
+                        row[record_pos],
+                        parse_int(row[level_pos], fallback=0),
+                        row[key_pos],
+                    )
+        finally:
+            if tee_file is not None:
+                tee_file.close()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.row_record)
+
+    @property
+    def record_count(self) -> int:
+        """Number of distinct (DATA_SOURCE, RECORD_ID) keys in the export."""
+        return len(self.record_ids)
+
+    @property
+    def matched_records_count(self) -> int:
+        """Number of distinct records with MATCH_LEVEL > 0."""
+        return len(self.matched_record_rows)
+
+    @property
+    def matched_pairs_count(self) -> int:
+        """Number of distinct (entity anchor, matched record) pairs."""
+        return len(self.pair_row)
+
+    def entity_code(self, entity_id: str) -> int:
+        """Return the integer code of an entity ID, interning non-numeric IDs."""
+        if entity_id.isdigit() and entity_id.isascii() and (entity_id[0] != "0" or len(entity_id) == 1):
+            return int(entity_id)
+        code = self._entity_text_codes.get(entity_id)
+        if code is None:
+            code = NO_ENTITY - 1 - len(self._entity_texts)
+            self._entity_text_codes[entity_id] = code
+            self._entity_texts.append(entity_id)
+        return code
+
+    def entity_text(self, code: int) -> str:
+        """Return the entity ID text of an entity code."""
+        if code >= 0:
+            return str(code)
+        return self._entity_texts[NO_ENTITY - 1 - code]
+
+    def entity_size(self, entity_id: str) -> int:
+        """Return the number of export rows of an entity."""
+        if not entity_id:
+            return 0
+        return self.entity_sizes.get(self.entity_code(entity_id), 0)
+
+    def record_code(self, data_source: str, record_id: str) -> int | None:
+        """Return the record code of an exported record, or None when it is not exported."""
+        source_code = self._source_codes.get(data_source)
+        if source_code is None:
+            return None
+        return self._record_codes[source_code].get(record_id)
+
+    def _intern_record(self, data_source: str, record_id: str) -> int:
+        source_code = self._source_codes.get(data_source)
+        if source_code is None:
+            source_code = len(self.data_sources)
+            self._source_codes[data_source] = source_code
+            self.data_sources.append(data_source)
+            self._record_codes.append({})
+        codes = self._record_codes[source_code]
+        code = codes.get(record_id)
+        if code is None:
+            code = len(self.record_ids)
+            codes[record_id] = code
+            self.record_source.append(source_code)
+            self.record_ids.append(record_id)
+            self.record_entity.append(NO_ENTITY)
+            self._record_matched_slot.append(-1)
+        return code
+
+    def add_row(self, entity_id: str, data_source: str, record_id: str, match_level: int, match_key: str) -> None:
+        """Append one export row and update matched records/pairs."""
+        record = self._intern_record(data_source, record_id)
+        entity = self.entity_code(entity_id)
+        key_code = self._match_key_codes.get(match_key)
+        if key_code is None:
+            key_code = len(self.match_keys)
+            self._match_key_codes[match_key] = key_code
+            self.match_keys.append(match_key)
+        row = len(self.row_record)
+        self.row_record.append(record)
+        self.row_entity.append(entity)
+        self.row_level.append(match_level)
+        self.row_match_key.append(key_code)
+
+        if not entity_id:
+            return
+        self.entity_sizes[entity] += 1
+        if not data_source or not record_id:
+            return
+        self.record_entity[record] = entity
+
+        self._first_record_of_entity.setdefault(entity, record)
+        if match_level == 0:
+            self._anchor_of_entity.setdefault(entity, record)
+        if match_level <= 0:
+            return
 
-    with export_file.open("r", encoding="utf-8", newline="") as infile:
-        sample = infile.read(4096)
-        infile.seek(0)
-        try:
-            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
-        except csv.Error:
-            dialect = csv.excel
-
-        reader = csv.DictReader(infile, dialect=dialect)
-        rows: list[dict[str, str]] = []
-        for row in reader:
-            normalized: dict[str, str] = {}
-            for key, value in row.items():
-                if key is None:
-                    continue
-                norm_key = key.strip().strip('"').strip().upper()
-                norm_value = (value or "").strip().strip('"').strip()
-                normalized[norm_key] = norm_value
-            if normalized:
-                rows.append(normalized)
-    return rows
-
-
-def build_match_inputs(export_rows: list[dict[str, str]]) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
-    """Extract matched records and matched pairs from sz_export rows."""
-    first_record_by_entity: dict[str, tuple[str, str]] = {}
-    anchor_by_entity: dict[str, tuple[str, str]] = {}
-    matched_records: dict[tuple[str, str], dict[str, str]] = {}
-    matched_pairs: dict[tuple[str, str, str, str], dict[str, str]] = {}
-
-    for row in export_rows:
-        entity_id = row.get("RESOLVED_ENTITY_ID", "")
-        data_source = row.get("DATA_SOURCE", "")
-        record_id = row.get("RECORD_ID", "")
-        match_level = parse_int(row.get("MATCH_LEVEL", "0"), fallback=0)
-        match_key = row.get("MATCH_KEY", "")
-
-        if not entity_id or not data_source or not record_id:
-            continue
+        slot = self._record_matched_slot[record]
+        if slot < 0:
+            self._record_matched_slot[record] = len(self.matched_record_rows)
+            self.matched_record_rows.append(row)
+        else:
+            self.matched_record_rows[slot] = row
 
-        first_record_by_entity.setdefault(entity_id, (data_source, record_id))
-        if match_level == 0:
-            anchor_by_entity.setdefault(entity_id, (data_source, record_id))
+        anchor = self._anchor_of_entity.get(entity, self._first_record_of_entity[entity])
+        if anchor == record:
+            return
+        pair_key = (anchor << 32) | record
+        slot = self._pair_slots.get(pair_key)
+        if slot is None:
+            self._pair_slots[pair_key] = len(self.pair_row)
+            self.pair_anchor.append(anchor)
+            self.pair_row.append(row)
+        else:
+            self.pair_row[slot] = row
+
+    def row_values(self, row: int) -> tuple[str, str, str, int, str]:
+        """Return (entity ID, DATA_SOURCE, RECORD_ID, MATCH_LEVEL, MATCH_KEY) of one row."""
+        record = self.row_record[row]
+        return (
+            self.entity_text(self.row_entity[row]),
+            self.data_sources[self.record_source[record]],
+            self.record_ids[record],
+            self.row_level[row],
+            self.match_keys[self.row_match_key[row]],
+        )
 
-        if match_level <= 0:
-            continue
+    def iter_rows(self) -> Iterator[tuple[str, str, str, int, str]]:
+        """Yield row values in export order."""
+        for row in range(len(self.row_record)):
+            yield self.row_values(row)
+
+    def matched_record_items(self) -> list[dict[str, str]]:
+        """Return matched records as explain inputs."""
+        items: list[dict[str, str]] = []
+        for row in self.matched_record_rows:
+            entity_id, data_source, record_id, match_level, match_key = self.row_values(row)
+            items.append(
+                {
+                    "resolved_entity_id": entity_id,
+                    "data_source": data_source,
+                    "record_id": record_id,
+                    "match_level": str(match_level),
+                    "match_key": match_key,
+                }
+            )
+        return items
 
-        matched_records[(data_source, record_id)] = {
-            "resolved_entity_id": entity_id,
-            "data_source": data_source,
-            "record_id": record_id,
-            "match_level": str(match_level),
-            "match_key": match_key,
-        }
+    def iter_matched_pair_items(self) -> Iterator[dict[str, str]]:
+        """Yield matched pairs as explain inputs."""
+        for anchor, row in zip(self.pair_anchor, self.pair_row):
+            entity_id, data_source, record_id, match_level, match_key = self.row_values(row)
+            yield {
+                "resolved_entity_id": entity_id,
+                "anchor_data_source": self.data_sources[self.record_source[anchor]],
+                "anchor_record_id": self.record_ids[anchor],
+                "matched_data_source": data_source,
+                "matched_record_id": record_id,
+                "match_level": str(match_level),
+                "match_key": match_key,
+            }
 
-        anchor = anchor_by_entity.get(entity_id) or first_record_by_entity.get(entity_id)
-        if not anchor:
-            continue
-        anchor_ds, anchor_rid = anchor
-        if anchor_ds == data_source and anchor_rid == record_id:
-            continue
 
-        pair_key = (anchor_ds, anchor_rid, data_source, record_id)
-        matched_pairs[pair_key] = {
-            "resolved_entity_id": entity_id,
-            "anchor_data_source": anchor_ds,
-            "anchor_record_id": anchor_rid,
-            "matched_data_source": data_source,
-            "matched_record_id": record_id,
-            "match_level": str(match_level),
-            "match_key": match_key,
-        }
+def entity_size_bucket(size: int) -> str:
+    """Bucket resolved-entity record counts for explain sampling strata."""
+    if size <= 2:
+        return "2"
+    if size <= 4:
+        return "3-4"
+    if size <= 9:
+        return "5-9"
+    return "10+"
+
+
+def allocate_proportional_with_floor(populations: list[int], budget: int, floor: int = 1) -> list[int]:
+    """Split budget across strata: min(floor, size) each, rest proportional to remaining size.
+
+    When the floor alone exceeds the budget, the largest strata get one slot first.
+    Rounding uses largest remainders, so allocations sum to min(budget, total).
+    """
+    total = sum(populations)
+    if budget >= total:
+        return list(populations)
+    allocation = [0] * len(populations)
+    by_size = sorted(range(len(populations)), key=lambda i: (-populations[i], i))
+
+    # Floor pass, one slot per round so a small budget still reaches the most strata.
+    for _ in range(floor):
+        for i in by_size:
+            if budget <= 0:
+                return allocation
+            if allocation[i] < populations[i]:
+                allocation[i] += 1
+                budget -= 1
+
+    # Proportional pass over remaining capacity (largest remainder rounding).
+    while budget > 0:
+        capacity = [populations[i] - allocation[i] for i in range(len(populations))]
+        capacity_total = sum(capacity)
+        if capacity_total <= 0:
+            break
+        quotas = [budget * c / capacity_total for c in capacity]
+        grants = [min(int(q), c) for q, c in zip(quotas, capacity)]
+        remaining = budget - sum(grants)
+        order = sorted(range(len(populations)), key=lambda i: (-(quotas[i] - int(quotas[i])), -capacity[i], i))
+        for i in order:
+            if remaining <= 0:
+                break
+            if grants[i] < capacity[i]:
+                grants[i] += 1
+                remaining -= 1
+        for i, grant in enumerate(grants):
+            allocation[i] += grant
+        budget -= sum(grants)
+        if sum(grants) == 0:
+            break
+    return allocation
+
+
+def stratified_explain_sample(
+    items: list[dict[str, str]],
+    budget: int,
+    entity_sizes: dict[str, int],
+    floor: int = 1,
+) -> tuple[list[dict[str, str]], dict[str, Any]]:
+    """Pick up to budget items spread across MATCH_KEY x MATCH_LEVEL x entity-size strata.
+
+    Items inside a stratum are taken at evenly spaced positions; the selection keeps
+    the original item order. Returns (selected items, allocation report).
+    """
+    strata: dict[tuple[str, str, str], list[int]] = {}
+    for position, item in enumerate(items):
+        stratum = (
+            item.get("match_key", ""),
+            str(item.get("match_level", "")),
+            entity_size_bucket(entity_sizes.get(item.get("resolved_entity_id", ""), 0)),
+        )
+        strata.setdefault(stratum, []).append(position)
+
+    keys = list(strata.keys())
+    allocation = allocate_proportional_with_floor([len(strata[k]) for k in keys], budget, floor)
+    selected_positions: list[int] = []
+    report_strata: list[dict[str, Any]] = []
+    for key, allocated in zip(keys, allocation):
+        positions = strata[key]
+        if allocated >= len(positions):
+            chosen = positions
+        else:
+            step = len(positions) / allocated if allocated else 0
+            chosen = [positions[int(i * step)] for i in range(allocated)]
+        selected_positions.extend(chosen)
+        report_strata.append(
+            {
+                "match_key": key[0],
+                "match_level": key[1],
+                "entity_size": key[2],
+                "population": len(positions),
+                "allocated": len(chosen),
+            }
+        )
 
-    return list(matched_records.values()), list(matched_pairs.values())
+    report_strata.sort(key=lambda row: (-row["population"], row["match_key"], row["match_level"], row["entity_size"]))
+    selected = [items[position] for position in sorted(selected_positions)]
+    report = {
+        "budget": budget,
+        "population": len(items),
+        "selected": len(selected),
+        "strata_total": len(keys),
+        "strata_covered": sum(1 for row in report_strata if row["allocated"] > 0),
+        "strata": report_strata,
+    }
+    return selected, report
 
 
 def try_parse_json(text: str) -> Any:
@@ -939,73 +3255,35 @@ def format_percent(value: float | None) -> str:
     return f"{value * 100:.2f}%"
 
 
-def load_source_ipg_labels(input_jsonl_path: Path) -> dict[str, Any]:
-    """Load SOURCE_IPG_ID labels keyed by (DATA_SOURCE, RECORD_ID)."""
-    labels: dict[tuple[str, str], str] = {}
-    total_rows = 0
-    rows_with_record_key = 0
-    rows_with_source_ipg_id = 0
-    duplicate_conflicts = 0
-
-    with input_jsonl_path.open("r", encoding="utf-8") as infile:
-        for line_no, line in enumerate(infile, start=1):
-            text = line.strip()
-            if not text:
-                continue
-            total_rows += 1
-            obj = json.loads(text)
-            if not isinstance(obj, dict):
-                raise ValueError(f"Invalid JSON object in input JSONL at line {line_no}")
-            key = parse_record_key(obj.get("DATA_SOURCE"), obj.get("RECORD_ID"))
-            if key is None:
-                continue
-            rows_with_record_key += 1
-            source_ipg_id = str(obj.get("SOURCE_IPG_ID") or "").strip()
-            if not source_ipg_id:
-                continue
-            rows_with_source_ipg_id += 1
-            existing = labels.get(key)
-            if existing is not None and existing != source_ipg_id:
-                duplicate_conflicts += 1
-                continue
-            labels[key] = source_ipg_id
-
-    return {
-        "labels": labels,
-        "total_rows": total_rows,
-        "rows_with_record_key": rows_with_record_key,
-        "rows_with_source_ipg_id": rows_with_source_ipg_id,
-        "duplicate_conflicts": duplicate_conflicts,
-    }
-
-
 def build_ground_truth_match_quality(
     input_jsonl_path: Path,
-    entity_rows: list[dict[str, Any]],
+    export_index: ExportIndex,
+    input_labels_path: Path | None = None,
 ) -> dict[str, Any]:
-    """Compute match quality metrics against SOURCE_IPG_ID ground truth."""
-    source_info = load_source_ipg_labels(input_jsonl_path)
-    labels: dict[tuple[str, str], str] = source_info["labels"]
-
-    record_to_entity: dict[tuple[str, str], str] = {}
-    for row in entity_rows:
-        key = parse_record_key(row.get("data_source"), row.get("record_id"))
-        entity_id = str(row.get("resolved_entity_id") or "").strip()
-        if key is None or not entity_id:
-            continue
-        record_to_entity[key] = entity_id
+    """Compute match quality metrics against SOURCE_IPG_ID ground truth.
 
-    ipg_counts: Counter[str] = Counter()
-    entity_ipg_counts: dict[str, Counter[str]] = defaultdict(Counter)
-    labeled_records_in_export = 0
+    Labels come from the input label sidecar written during normalization; the input
+    is only re-scanned when the sidecar is missing or stale.
+    """
+    label_index = InputLabelIndex.load(input_labels_path, input_jsonl_path) if input_labels_path else None
+    labels_source = "sidecar"
+    if label_index is None:
+        label_index = InputLabelIndex.from_jsonl(input_jsonl_path)
+        labels_source = "input_scan"
 
-    for key, source_ipg_id in labels.items():
-        entity_id = record_to_entity.get(key)
-        if not entity_id:
+    labeled_records_in_export = 0
+    ipg_counts: Counter[str] = Counter()
+    entity_ipg_counts: dict[int, Counter[str]] = defaultdict(Counter)
+    for data_source, record_id, source_ipg_id in label_index.iter_labeled_records():
+        record = export_index.record_code(data_source, record_id)
+        if record is None:
+            continue
+        entity = export_index.record_entity[record]
+        if entity == NO_ENTITY:
             continue
         labeled_records_in_export += 1
         ipg_counts[source_ipg_id] += 1
-        entity_ipg_counts[entity_id][source_ipg_id] += 1
+        entity_ipg_counts[entity][source_ipg_id] += 1
 
     true_pairs = sum(comb2(count) for count in ipg_counts.values())
     predicted_pairs = sum(comb2(sum(counter.values())) for counter in entity_ipg_counts.values())
@@ -1024,7 +3302,7 @@ def build_ground_truth_match_quality(
     mixed_entities = entities_with_labels - pure_entities
     entity_purity = safe_ratio(pure_entities, entities_with_labels)
 
-    ipg_to_entities: dict[str, set[str]] = defaultdict(set)
+    ipg_to_entities: dict[str, set[int]] = defaultdict(set)
     for entity_id, counter in entity_ipg_counts.items():
         for source_ipg_id in counter.keys():
             ipg_to_entities[source_ipg_id].add(entity_id)
@@ -1040,11 +3318,13 @@ def build_ground_truth_match_quality(
 
     mixed_entity_examples: list[dict[str, Any]] = []
     for entity_id, counter in sorted(
-        entity_ipg_counts.items(),
+        (
+            (export_index.entity_text(entity), counter)
+            for entity, counter in entity_ipg_counts.items()
+            if len(counter) > 1
+        ),
         key=lambda item: (-sum(item[1].values()), item[0]),
     ):
-        if len(counter) <= 1:
-            continue
         mixed_entity_examples.append(
             {
                 "resolved_entity_id": entity_id,
@@ -1058,11 +3338,12 @@ def build_ground_truth_match_quality(
     return {
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
         "input_jsonl": str(input_jsonl_path),
+        "labels_source": labels_source,
         "data_quality": {
-            "input_rows_total": source_info["total_rows"],
-            "rows_with_record_key": source_info["rows_with_record_key"],
-            "rows_with_source_ipg_id": source_info["rows_with_source_ipg_id"],
-            "source_ipg_duplicate_conflicts": source_info["duplicate_conflicts"],
+            "input_rows_total": label_index.records_total,
+            "rows_with_record_key": label_index.rows_with_record_key,
+            "rows_with_source_ipg_id": label_index.rows_with_label,
+            "source_ipg_duplicate_conflicts": label_index.label_conflicts,
             "labeled_records_in_export": labeled_records_in_export,
         },
         "pair_metrics": {
@@ -1156,51 +3437,76 @@ def write_ground_truth_match_quality_reports(
     return quality_json, quality_md
 
 
+RUN_REGISTRY_TOOL = TOOLS_DIR / "run_registry.py"
+
+
+@functools.lru_cache(maxsize=None)
+def load_run_registry_tool() -> Any:
+    """Import senzing/tools/run_registry.py, which owns the SQLite run registry schema."""
+    spec = importlib.util.spec_from_file_location("run_registry", RUN_REGISTRY_TOOL)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {RUN_REGISTRY_TOOL}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def resolve_generation_summary_for_input(
     repo_root: Path,
     input_jsonl_path: Path,
+    registry: sqlite3.Connection | None = None,
 ) -> dict[str, str | None]:
-    """Resolve generation summary metadata matching the run input JSONL."""
-    output_dir = repo_root / "output"
-    if not output_dir.exists():
-        return {
-            "generation_summary_json": None,
-            "base_input_json": None,
-            "mapped_output_jsonl": None,
-        }
-
-    input_path_text = str(input_jsonl_path)
-    input_name = input_jsonl_path.name
-
-    for summary_path in sorted(output_dir.glob("generation_summary_*.json"), reverse=True):
-        try:
-            payload = json.loads(summary_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            continue
-        mapped_output = str(payload.get("mapped_output_jsonl") or "").strip()
-        if not mapped_output:
-            continue
-        mapped_name = Path(mapped_output).name
-        if mapped_output == input_path_text or mapped_name == input_name:
-            return {
-                "generation_summary_json": str(summary_path.resolve()),
-                "base_input_json": str(payload.get("base_input_json") or "") or None,
-                "mapped_output_jsonl": mapped_output or None,
-            }
+    """Resolve generation summary metadata matching the run input JSONL.
 
-    return {
+    Looks the input up in the run registry by mapped output path or file name
+    (newest summary first); unregistered summaries in output/ are registered
+    on a miss and the lookup repeated.
+    """
+    empty = {
         "generation_summary_json": None,
         "base_input_json": None,
         "mapped_output_jsonl": None,
     }
+    output_dir = repo_root / "output"
+    if not output_dir.exists():
+        return empty
+
+    run_registry = load_run_registry_tool()
+    if registry is not None:
+        conn = registry
+    else:
+        conn = run_registry.open_registry(output_dir / run_registry.RUN_REGISTRY_DB_NAME)
+    try:
+        match = run_registry.find_generation_summary(conn, input_jsonl_path)
+        if match is None:
+            with conn:
+                registered = run_registry.register_new_generation_summaries(conn, output_dir)
+            if registered:
+                match = run_registry.find_generation_summary(conn, input_jsonl_path)
+    finally:
+        if registry is None:
+            conn.close()
+    if match is None:
+        return empty
+    return {
+        "generation_summary_json": match[0],
+        "base_input_json": match[1] or None,
+        "mapped_output_jsonl": match[2] or None,
+    }
 
 
 def append_run_registry_entry(
     repo_root: Path,
     summary: dict[str, Any],
     load_input_jsonl: Path,
-) -> Path | None:
-    """Append one execution row to output/run_registry.csv."""
+    runtime_warnings: list[str] | None = None,
+) -> tuple[Path, Path | None] | None:
+    """Record one execution in output/run_registry.csv and output/run_registry.sqlite.
+
+    The CSV row is written first; a SQLite failure only adds a runtime warning.
+    Returns the (CSV, SQLite) registry paths (SQLite None when it failed), or None
+    without an output/ folder.
+    """
     registry_dir = repo_root / "output"
     if not registry_dir.exists():
         return None
@@ -1225,8 +3531,8 @@ def append_run_registry_entry(
         if current_meta.get("generation_summary_json"):
             generation_meta = current_meta
             break
-    run_dir = str(summary.get("run_directory") or "")
 
+    run_dir = str(summary.get("run_directory") or "")
     row = {
         "generated_at": str(summary.get("generated_at") or ""),
         "run_directory": run_dir,
@@ -1273,20 +3579,50 @@ def append_run_registry_entry(
         if write_header:
             writer.writeheader()
         writer.writerow(row)
-    return registry_path
+
+    try:
+        run_registry = load_run_registry_tool()
+        registry_db_path = registry_dir / run_registry.RUN_REGISTRY_DB_NAME
+        runtime_options = summary.get("runtime_options") if isinstance(summary.get("runtime_options"), dict) else {}
+        db_row = {
+            **{key: value or None for key, value in row.items()},
+            "overall_ok": 1 if summary.get("overall_ok") else 0,
+            "records_input": summary.get("records_input"),
+            "fast_mode": 1 if runtime_options.get("fast_mode") else 0,
+            "resumed": 1 if summary.get("resumed") else 0,
+            **run_registry.run_timings(summary),
+        }
+        registry = run_registry.open_registry(registry_db_path)
+        try:
+            with registry:
+                run_registry.insert_run(registry, db_row, replace=True)
+        finally:
+            registry.close()
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        if runtime_warnings is not None:
+            runtime_warnings.append(f"Run registry DB not updated: {err}")
+        return registry_path, None
+    return registry_path, registry_db_path
 
 
 def make_comparison_outputs(
     run_dir: Path,
     input_jsonl_path: Path,
-    export_rows: list[dict[str, str]],
-    matched_records: list[dict[str, str]],
-    matched_pairs: list[dict[str, str]],
-    why_entity_results: list[dict[str, Any]],
-    why_records_results: list[dict[str, Any]],
+    export_index: ExportIndex,
+    matched_records_count: int,
+    matched_pairs: Iterable[dict[str, str]],
+    why_entity_results: Iterable[dict[str, Any]],
+    why_records_results: Iterable[dict[str, Any]],
     records_input_count: int,
+    input_labels_path: Path | None = None,
 ) -> dict[str, Any]:
-    """Create comparison-ready artifacts for downstream testing and management."""
+    """Create comparison-ready artifacts for downstream testing and management.
+
+    Explain results are consumed once as streams and reduced to (ok, reason summary)
+    per key, so full explain payloads are never held in memory together.
+    entity_records.csv and matched_pairs.csv are written row by row from the export
+    index and the matched_pairs stream; match key/level counts are taken on the way.
+    """
     comparison_dir = run_dir / "comparison"
     comparison_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1296,13 +3632,20 @@ def make_comparison_outputs(
     management_json = comparison_dir / "management_summary.json"
     management_md = comparison_dir / "management_summary.md"
 
-    why_entity_by_key: dict[tuple[str, str], dict[str, Any]] = {}
+    explain_coverage = {"why_entity_total": 0, "why_entity_ok": 0, "why_records_total": 0, "why_records_ok": 0}
+
+    why_entity_by_key: dict[tuple[str, str], tuple[bool, str]] = {}
     for item in why_entity_results:
         rec = item.get("input", {})
         key = (str(rec.get("data_source", "")), str(rec.get("record_id", "")))
-        why_entity_by_key[key] = item
+        why_entity_by_key[key] = (
+            bool(item.get("ok")),
+            extract_reason_summary(item.get("output_json"), item.get("output_text")),
+        )
+        explain_coverage["why_entity_total"] += 1
+        explain_coverage["why_entity_ok"] += 1 if item.get("ok") else 0
 
-    why_records_by_key: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+    why_records_by_key: dict[tuple[str, str, str, str], tuple[bool, str]] = {}
     for item in why_records_results:
         rec = item.get("input", {})
         key = (
@@ -1311,113 +3654,125 @@ def make_comparison_outputs(
             str(rec.get("matched_data_source", "")),
             str(rec.get("matched_record_id", "")),
         )
-        why_records_by_key[key] = item
-
-    entity_rows: list[dict[str, Any]] = []
-    entity_ids: set[str] = set()
-    for row in export_rows:
-        resolved_entity_id = row.get("RESOLVED_ENTITY_ID", "")
-        data_source = row.get("DATA_SOURCE", "")
-        record_id = row.get("RECORD_ID", "")
-        match_level = parse_int(row.get("MATCH_LEVEL", "0"), fallback=0)
-        match_key = row.get("MATCH_KEY", "")
-        if resolved_entity_id:
-            entity_ids.add(resolved_entity_id)
-
-        why_info = why_entity_by_key.get((data_source, record_id), {})
-        reason = extract_reason_summary(
-            why_info.get("output_json"),
-            why_info.get("output_text"),
-        )
-        entity_rows.append(
-            {
-                "resolved_entity_id": resolved_entity_id,
-                "data_source": data_source,
-                "record_id": record_id,
-                "match_level": match_level,
-                "match_key": match_key,
-                "is_anchor": 1 if match_level == 0 else 0,
-                "why_entity_ok": 1 if why_info.get("ok") else 0,
-                "why_entity_reason_summary": reason,
-            }
-        )
-
-    pair_rows: list[dict[str, Any]] = []
-    for pair in matched_pairs:
-        key = (
-            pair["anchor_data_source"],
-            pair["anchor_record_id"],
-            pair["matched_data_source"],
-            pair["matched_record_id"],
+        why_records_by_key[key] = (
+            bool(item.get("ok")),
+            extract_reason_summary(item.get("output_json"), item.get("output_text")),
         )
-        why_info = why_records_by_key.get(key, {})
-        reason = extract_reason_summary(
-            why_info.get("output_json"),
-            why_info.get("output_text"),
+        explain_coverage["why_records_total"] += 1
+        explain_coverage["why_records_ok"] += 1 if item.get("ok") else 0
+
+    entity_records_csv.parent.mkdir(parents=True, exist_ok=True)
+    with entity_records_csv.open("w", encoding="utf-8", newline="") as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(
+            [
+                "resolved_entity_id",
+                "data_source",
+                "record_id",
+                "match_level",
+                "match_key",
+                "is_anchor",
+                "why_entity_ok",
+                "why_entity_reason_summary",
+            ]
         )
-        pair_rows.append(
-            {
-                "resolved_entity_id": pair["resolved_entity_id"],
-                "anchor_data_source": pair["anchor_data_source"],
-                "anchor_record_id": pair["anchor_record_id"],
-                "matched_data_source": pair["matched_data_source"],
-                "matched_record_id": pair["matched_record_id"],
-                "match_level": parse_int(pair.get("match_level", "0"), fallback=0),
-                "match_key": pair.get("match_key", ""),
-                "why_records_ok": 1 if why_info.get("ok") else 0,
-                "why_records_reason_summary": reason,
-            }
+        for resolved_entity_id, data_source, record_id, match_level, match_key in export_index.iter_rows():
+            why_ok, reason = why_entity_by_key.get((data_source, record_id), (False, ""))
+            writer.writerow(
+                [
+                    resolved_entity_id,
+                    data_source,
+                    record_id,
+                    match_level,
+                    match_key,
+                    1 if match_level == 0 else 0,
+                    1 if why_ok else 0,
+                    reason,
+                ]
+            )
+    why_entity_by_key.clear()
+
+    match_key_counts: Counter[str] = Counter()
+    match_level_counts: Counter[int] = Counter()
+    matched_pairs_count = 0
+    first_pair_rows: list[dict[str, Any]] = []
+    with matched_pairs_csv.open("w", encoding="utf-8", newline="") as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(
+            [
+                "resolved_entity_id",
+                "anchor_data_source",
+                "anchor_record_id",
+                "matched_data_source",
+                "matched_record_id",
+                "match_level",
+                "match_key",
+                "why_records_ok",
+                "why_records_reason_summary",
+            ]
         )
+        for pair in matched_pairs:
+            key = (
+                pair["anchor_data_source"],
+                pair["anchor_record_id"],
+                pair["matched_data_source"],
+                pair["matched_record_id"],
+            )
+            why_ok, reason = why_records_by_key.get(key, (False, ""))
+            match_level = parse_int(pair.get("match_level", "0"), fallback=0)
+            match_key = pair.get("match_key", "")
+            matched_pairs_count += 1
+            match_level_counts[match_level] += 1
+            if match_key:
+                match_key_counts[match_key] += 1
+            if len(first_pair_rows) < 20:
+                first_pair_rows.append(
+                    {
+                        "resolved_entity_id": pair["resolved_entity_id"],
+                        "anchor_data_source": pair["anchor_data_source"],
+                        "anchor_record_id": pair["anchor_record_id"],
+                        "matched_data_source": pair["matched_data_source"],
+                        "matched_record_id": pair["matched_record_id"],
+                        "match_level": match_level,
+                        "match_key": match_key,
+                        "why_records_reason_summary": reason,
+                    }
+                )
+            writer.writerow(
+                [
+                    pair["resolved_entity_id"],
+                    pair["anchor_data_source"],
+                    pair["anchor_record_id"],
+                    pair["matched_data_source"],
+                    pair["matched_record_id"],
+                    match_level,
+                    match_key,
+                    1 if why_ok else 0,
+                    reason,
+                ]
+            )
+    why_records_by_key.clear()
 
-    match_key_counts = Counter([p.get("match_key", "") for p in matched_pairs if p.get("match_key", "")])
-    match_level_counts = Counter([parse_int(p.get("match_level", "0"), fallback=0) for p in matched_pairs])
-
+    records_exported = len(export_index)
+    resolved_entities = len(export_index.entity_sizes)
     stats_rows = [
         {"metric": "records_input", "value": records_input_count},
-        {"metric": "records_exported", "value": len(export_rows)},
-        {"metric": "resolved_entities", "value": len(entity_ids)},
-        {"metric": "matched_records", "value": len(matched_records)},
-        {"metric": "matched_pairs", "value": len(matched_pairs)},
+        {"metric": "records_exported", "value": records_exported},
+        {"metric": "resolved_entities", "value": resolved_entities},
+        {"metric": "matched_records", "value": matched_records_count},
+        {"metric": "matched_pairs", "value": matched_pairs_count},
     ]
     for level, count in sorted(match_level_counts.items()):
         stats_rows.append({"metric": f"match_level_{level}", "value": count})
     for key, count in sorted(match_key_counts.items(), key=lambda x: (-x[1], x[0])):
         stats_rows.append({"metric": f"match_key::{key}", "value": count})
 
-    write_csv(
-        entity_records_csv,
-        [
-            "resolved_entity_id",
-            "data_source",
-            "record_id",
-            "match_level",
-            "match_key",
-            "is_anchor",
-            "why_entity_ok",
-            "why_entity_reason_summary",
-        ],
-        entity_rows,
-    )
-    write_csv(
-        matched_pairs_csv,
-        [
-            "resolved_entity_id",
-            "anchor_data_source",
-            "anchor_record_id",
-            "matched_data_source",
-            "matched_record_id",
-            "match_level",
-            "match_key",
-            "why_records_ok",
-            "why_records_reason_summary",
-        ],
-        pair_rows,
-    )
     write_csv(match_stats_csv, ["metric", "value"], stats_rows)
 
     ground_truth_payload = build_ground_truth_match_quality(
         input_jsonl_path=input_jsonl_path,
-        entity_rows=entity_rows,
+        export_index=export_index,
+        input_labels_path=input_labels_path,
     )
     ground_truth_json, ground_truth_md = write_ground_truth_match_quality_reports(
         comparison_dir=comparison_dir,
@@ -1427,18 +3782,13 @@ def make_comparison_outputs(
     summary_obj = {
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
         "records_input": records_input_count,
-        "records_exported": len(export_rows),
-        "resolved_entities": len(entity_ids),
-        "matched_records": len(matched_records),
-        "matched_pairs": len(matched_pairs),
+        "records_exported": records_exported,
+        "resolved_entities": resolved_entities,
+        "matched_records": matched_records_count,
+        "matched_pairs": matched_pairs_count,
         "match_level_distribution": {str(k): v for k, v in sorted(match_level_counts.items())},
         "match_key_distribution": dict(sorted(match_key_counts.items(), key=lambda x: (-x[1], x[0]))),
-        "explain_coverage": {
-            "why_entity_total": len(why_entity_results),
-            "why_entity_ok": sum(1 for item in why_entity_results if item.get("ok")),
-            "why_records_total": len(why_records_results),
-            "why_records_ok": sum(1 for item in why_records_results if item.get("ok")),
-        },
+        "explain_coverage": explain_coverage,
         "artifacts": {
             "entity_records_csv": str(entity_records_csv),
             "matched_pairs_csv": str(matched_pairs_csv),
@@ -1456,10 +3806,10 @@ def make_comparison_outputs(
     lines.append("")
     lines.append(f"- Generated at: {summary_obj['generated_at']}")
     lines.append(f"- Records input: {records_input_count}")
-    lines.append(f"- Records exported: {len(export_rows)}")
-    lines.append(f"- Resolved entities: {len(entity_ids)}")
-    lines.append(f"- Matched records: {len(matched_records)}")
-    lines.append(f"- Matched pairs: {len(matched_pairs)}")
+    lines.append(f"- Records exported: {records_exported}")
+    lines.append(f"- Resolved entities: {resolved_entities}")
+    lines.append(f"- Matched records: {matched_records_count}")
+    lines.append(f"- Matched pairs: {matched_pairs_count}")
     lines.append(
         "- Explain coverage: "
         f"whyEntity {summary_obj['explain_coverage']['why_entity_ok']}/{summary_obj['explain_coverage']['why_entity_total']}, "
@@ -1492,7 +3842,7 @@ def make_comparison_outputs(
     lines.append("")
     lines.append("| Entity | Anchor | Matched | Match Key | Level | Explain |")
     lines.append("| --- | --- | --- | --- | ---: | --- |")
-    for row in pair_rows[:20]:
+    for row in first_pair_rows:
         anchor = f"{row['anchor_data_source']}:{row['anchor_record_id']}"
         matched = f"{row['matched_data_source']}:{row['matched_record_id']}"
         explain_text = str(row["why_records_reason_summary"] or "").replace("\n", " ")
@@ -1500,7 +3850,7 @@ def make_comparison_outputs(
             f"| {row['resolved_entity_id']} | {anchor} | {matched} | "
             f"{row['match_key']} | {row['match_level']} | {explain_text} |"
         )
-    if not pair_rows:
+    if not first_pair_rows:
         lines.append("| - | - | - | - | - | No matched pairs detected |")
 
     management_md.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -1514,12 +3864,13 @@ def make_comparison_outputs(
         "management_summary_md": str(management_md),
         "ground_truth_match_quality_json": str(ground_truth_json),
         "ground_truth_match_quality_md": str(ground_truth_md),
-        "matched_pairs_count": len(matched_pairs),
+        "matched_pairs_count": matched_pairs_count,
     }
 
 
 def main() -> int:
     """Entry point."""
+    run_started = time.time()
     args = parse_args()
     repo_root = Path(__file__).resolve().parents[2]
     if args.fast_mode:
@@ -1541,9 +3892,42 @@ def main() -> int:
     if args.load_threads <= 0 or args.load_fallback_threads <= 0:
         print("ERROR: --load-threads and --load-fallback-threads must be > 0", file=sys.stderr)
         return 2
+    try:
+        auto_thread_candidates = sorted({int(item) for item in parse_csv_items(args.auto_threads_candidates)})
+    except ValueError:
+        print("ERROR: --auto-threads-candidates must be comma-separated integers", file=sys.stderr)
+        return 2
+    if any(item <= 0 for item in auto_thread_candidates) or args.auto_threads_slice_records <= 0:
+        print("ERROR: --auto-threads-candidates and --auto-threads-slice-records must be > 0", file=sys.stderr)
+        return 2
     if args.snapshot_threads <= 0 or args.snapshot_fallback_threads <= 0:
         print("ERROR: --snapshot-threads and --snapshot-fallback-threads must be > 0", file=sys.stderr)
         return 2
+    if args.stage_thread_budget < 0:
+        print("ERROR: --stage-thread-budget must be >= 0", file=sys.stderr)
+        return 2
+    if args.resource_sample_seconds < 0:
+        print("ERROR: --resource-sample-seconds must be >= 0", file=sys.stderr)
+        return 2
+    RESOURCE_SAMPLING.update(interval_seconds=args.resource_sample_seconds, timeseries=args.resource_timeseries)
+    if args.explain_workers <= 0:
+        print("ERROR: --explain-workers must be > 0", file=sys.stderr)
+        return 2
+    if args.load_max_in_flight < 0 or args.load_retries < 0 or args.load_progress_seconds <= 0:
+        print(
+            "ERROR: --load-max-in-flight and --load-retries must be >= 0, --load-progress-seconds > 0",
+            file=sys.stderr,
+        )
+        return 2
+    if not 0.0 <= args.load_max_failure_rate <= 1.0:
+        print("ERROR: --load-max-failure-rate must be between 0 and 1", file=sys.stderr)
+        return 2
+    if args.explain_sample_floor < 0:
+        print("ERROR: --explain-sample-floor must be >= 0", file=sys.stderr)
+        return 2
+    if args.load_segment_records < 0:
+        print("ERROR: --load-segment-records must be >= 0", file=sys.stderr)
+        return 2
 
     input_path = Path(args.input_file).expanduser().resolve()
     if not input_path.exists():
@@ -1554,13 +3938,14 @@ def main() -> int:
     if (
         args.fast_mode
         and input_path.suffix.lower() == ".jsonl"
+        and not detect_compression(input_path)
         and data_sources_override
         and not args.use_input_jsonl_directly
     ):
         args.use_input_jsonl_directly = True
     if args.use_input_jsonl_directly:
-        if input_path.suffix.lower() != ".jsonl":
-            print("ERROR: --use-input-jsonl-directly requires .jsonl input", file=sys.stderr)
+        if input_path.suffix.lower() != ".jsonl" or detect_compression(input_path):
+            print("ERROR: --use-input-jsonl-directly requires uncompressed .jsonl input", file=sys.stderr)
             return 2
         if not data_sources_override:
             print("ERROR: --use-input-jsonl-directly requires --data-sources", file=sys.stderr)
@@ -1571,24 +3956,35 @@ def main() -> int:
         print(f"ERROR: --senzing-env not found: {base_setup_env}", file=sys.stderr)
         return 2
 
-    run_dir = Path(args.output_root).expanduser().resolve() / f"{args.run_name_prefix}_{now_timestamp()}"
+    resume_checkpoint: dict[str, Any] | None = None
+    normalize_output_mode: str | None = None
+    if args.resume:
+        run_dir = Path(args.resume).expanduser().resolve()
+        resume_checkpoint = read_load_checkpoint(run_dir / LOAD_CHECKPOINT_NAME)
+        if resume_checkpoint is None:
+            print(f"ERROR: No readable {LOAD_CHECKPOINT_NAME} in --resume directory: {run_dir}", file=sys.stderr)
+            return 2
+        project_dir = Path(resume_checkpoint["project_dir"])
+    else:
+        run_dir = Path(args.output_root).expanduser().resolve() / f"{args.run_name_prefix}_{now_timestamp()}"
+        project_dir = Path(args.project_parent_dir).expanduser() / f"{args.project_name_prefix}_{now_timestamp()}"
     logs_dir = run_dir / "logs"
     run_dir.mkdir(parents=True, exist_ok=True)
     logs_dir.mkdir(parents=True, exist_ok=True)
-
-    project_dir = Path(args.project_parent_dir).expanduser() / f"{args.project_name_prefix}_{now_timestamp()}"
     project_setup_env = project_dir / "setupEnv"
+    load_checkpoint_file = run_dir / LOAD_CHECKPOINT_NAME
 
     normalized_jsonl = run_dir / "input_normalized.jsonl"
+    input_labels_file = run_dir / INPUT_LABELS_NAME
     config_scripts_dir = run_dir / "config_scripts"
     snapshot_prefix = run_dir / "snapshot"
     snapshot_json = run_dir / "snapshot.json"
     export_file = run_dir / args.export_output_name
     explain_dir = run_dir / "explain"
-    explain_logs_dir = explain_dir / "logs"
+    explain_log_suffix = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}.get(args.explain_log_compression, "")
+    explain_log_file = explain_dir / f"explain_log.jsonl{explain_log_suffix}"
+    explain_log_index_file = explain_dir / "explain_log.index.tsv"
     match_inputs_file = explain_dir / "match_inputs.json"
-    why_entity_file = explain_dir / "why_entity_by_record.jsonl"
-    why_records_file = explain_dir / "why_records_pairs.jsonl"
     summary_file = run_dir / "run_summary.json"
     comparison_artifacts: dict[str, str | int | dict[str, int] | None] = {}
     loader_temp_files_removed: list[str] = []
@@ -1600,17 +3996,47 @@ def main() -> int:
     if args.fast_mode:
         print("Fast mode: enabled")
 
-    try:
-        records_input_count, data_sources, load_input_jsonl = normalize_input_to_jsonl(
-            input_path=input_path,
-            normalized_jsonl_path=normalized_jsonl,
-            provided_data_sources=data_sources_override,
-            use_input_jsonl_directly=args.use_input_jsonl_directly,
+    if resume_checkpoint is not None:
+        # The checkpoint offsets are only meaningful against the exact file they were taken from.
+        records_input_count = int(resume_checkpoint["records_input_count"])
+        data_sources = list(resume_checkpoint["data_sources"])
+        load_input_jsonl = Path(resume_checkpoint["load_input_jsonl"])
+        try:
+            load_input_stat = load_input_jsonl.stat()
+        except OSError as err:
+            print(f"ERROR: Unable to resume, load input unavailable: {err}", file=sys.stderr)
+            return 2
+        if (
+            load_input_stat.st_size != resume_checkpoint["load_input_size"]
+            or load_input_stat.st_mtime_ns != resume_checkpoint["load_input_mtime_ns"]
+        ):
+            print(f"ERROR: Unable to resume, load input changed since checkpoint: {load_input_jsonl}", file=sys.stderr)
+            return 2
+        print(
+            f"Resuming load at byte {resume_checkpoint['byte_offset']} "
+            f"({resume_checkpoint['records_committed']} record(s) already committed)"
         )
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        print(f"ERROR: Unable to normalize input: {err}", file=sys.stderr)
-        return 2
-    print(f"Load input JSONL: {load_input_jsonl}")
+    else:
+        # Ground-truth labels are collected in the normalization pass when comparison will need
+        # them, saved to the sidecar and released before the load.
+        label_index = None if args.skip_comparison else InputLabelIndex()
+        try:
+            records_input_count, data_sources, load_input_jsonl, normalize_output_mode = normalize_input_to_jsonl(
+                input_path=input_path,
+                normalized_jsonl_path=normalized_jsonl,
+                provided_data_sources=data_sources_override,
+                use_input_jsonl_directly=args.use_input_jsonl_directly,
+                label_index=label_index,
+                rewrite=args.normalize_mode == "rewrite",
+                allow_hardlink=args.normalize_hardlink,
+            )
+            if label_index is not None:
+                label_index.save(input_labels_file, load_input_jsonl)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"ERROR: Unable to normalize input: {err}", file=sys.stderr)
+            return 2
+        del label_index
+    print(f"Load input JSONL: {load_input_jsonl}" + (f" ({normalize_output_mode})" if normalize_output_mode else ""))
     print(f"Records detected: {records_input_count}")
     print(f"Data sources: {', '.join(data_sources)}")
 
@@ -1618,91 +4044,230 @@ def main() -> int:
     steps: list[dict[str, Any]] = []
     runtime_warnings: list[str] = []
 
-    step = create_project(project_dir, base_setup_env, logs_dir / "00_create_project.log")
-    steps.append(step)
-    if not step["ok"] or not project_setup_env.exists():
-        summary = {
-            "overall_ok": False,
-            "error": "create_project failed",
+    if resume_checkpoint is None:
+        template_dir: Path | None = None
+        setup_error: str | None = None
+        if args.project_template_cache:
+            build_version = find_senzing_build_version(base_setup_env)
+            if build_version is None:
+                runtime_warnings.append("Project template cache skipped: Senzing build version file not found")
+            else:
+                template_dir, template_meta, template_steps, setup_error = ensure_project_template(
+                    Path(args.project_template_cache).expanduser().resolve(),
+                    build_version,
+                    data_sources,
+                    base_setup_env,
+                    logs_dir,
+                    args.step_timeout_seconds,
+                )
+                steps.extend(template_steps)
+                if template_dir is not None and template_meta is not None:
+                    print(f"Project template: {template_dir} ({'built' if template_steps else 'cached'})")
+                    step = clone_project_template(template_dir, template_meta, project_dir)
+                    step["cache_hit"] = not template_steps
+                    steps.append(step)
+                    if not step["ok"]:
+                        setup_error = "clone_project_template failed"
+        if template_dir is None and setup_error is None:
+            step = create_project(project_dir, base_setup_env, logs_dir / "00_create_project.log")
+            steps.append(step)
+            if not step["ok"] or not project_setup_env.exists():
+                setup_error = "create_project failed"
+            else:
+                configure_steps, failed_data_source = configure_data_sources(
+                    project_setup_env, data_sources, config_scripts_dir, logs_dir, args.step_timeout_seconds
+                )
+                steps.extend(configure_steps)
+                if failed_data_source is not None:
+                    setup_error = f"configure_data_source failed for {failed_data_source}"
+        if setup_error is not None:
+            summary = {
+                "overall_ok": False,
+                "error": setup_error,
+                "run_directory": str(run_dir),
+                "project_dir": str(project_dir),
+                "runtime_warnings": runtime_warnings,
+                "steps": steps,
+            }
+            summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            print(f"FAILED at {steps[-1]['step'] if steps else 'project setup'}", file=sys.stderr)
+            return 1
+        load_input_stat = load_input_jsonl.stat()
+        load_checkpoint: dict[str, Any] = {
+            "version": 1,
             "run_directory": str(run_dir),
-            "project_dir": str(project_dir),
-            "runtime_warnings": runtime_warnings,
-            "steps": steps,
+            "project_dir": str(project_dir.absolute()),
+            "input_file": str(input_path),
+            "load_input_jsonl": str(load_input_jsonl),
+            "load_input_size": load_input_stat.st_size,
+            "load_input_mtime_ns": load_input_stat.st_mtime_ns,
+            "data_sources": data_sources,
+            "records_input_count": records_input_count,
+            "loader": args.loader,
+            "byte_offset": 0,
+            "records_committed": 0,
+            "segments_completed": 0,
+            "completed": False,
         }
-        summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-        print("FAILED at create_project", file=sys.stderr)
-        return 1
-
-    for index, data_source in enumerate(data_sources, start=1):
-        cfg_file = config_scripts_dir / f"add_{data_source}.g2c"
-        cfg_file.write_text(f"addDataSource {data_source}\nsave\n", encoding="utf-8")
-        command = (
-            f"source {shlex.quote(str(project_setup_env))} >/dev/null 2>&1 && "
-            f"sz_configtool -f {shlex.quote(str(cfg_file))}"
-        )
-        step = run_shell_step(
-            f"configure_data_source_{data_source}",
-            command,
-            logs_dir / f"01_configure_{index:02d}_{data_source}.log",
-            timeout_seconds=args.step_timeout_seconds,
-        )
-        steps.append(step)
-        if not step["ok"]:
-            stdout = (step.get("stdout_tail") or "").lower()
-            stderr = (step.get("stderr_tail") or "").lower()
-            already_exists = "already" in stdout or "already" in stderr or "exist" in stdout or "exist" in stderr
-            if not already_exists:
-                summary = {
-                    "overall_ok": False,
-                    "error": f"configure_data_source failed for {data_source}",
-                    "run_directory": str(run_dir),
-                    "project_dir": str(project_dir),
-                    "runtime_warnings": runtime_warnings,
-                    "steps": steps,
-                }
-                summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-                print(f"FAILED at configure_data_source_{data_source}", file=sys.stderr)
-                return 1
-
-    load_attempts: list[tuple[str, str, Path]] = [
-        (
-            "primary",
-            build_load_command(project_setup_env, load_input_jsonl, args.load_threads, no_shuffle=False),
-            logs_dir / "02_load.log",
-        )
-    ]
-    if not args.disable_stability_retries:
-        load_attempts.append(
-            (
-                "fallback_single_thread",
-                build_load_command(
-                    project_setup_env,
-                    load_input_jsonl,
-                    args.load_fallback_threads,
-                    no_shuffle=True,
-                ),
-                logs_dir / "02_load_retry_1.log",
+        write_load_checkpoint(load_checkpoint_file, load_checkpoint)
+    else:
+        load_checkpoint = resume_checkpoint
+
+    load_thread_calibration: dict[str, Any] | None = None
+
+    def auto_tune_load_threads(run_slice: Callable[[int, Path, int], dict[str, Any]]) -> None:
+        # Calibration slices are the head of the remaining input, so a clean calibration
+        # is committed to the checkpoint and the full load continues after it.
+        nonlocal load_thread_calibration
+        candidates = auto_thread_candidates or default_thread_candidates(os.cpu_count() or 1)
+        remaining = records_input_count - int(load_checkpoint.get("records_committed", 0))
+        load_thread_calibration = {
+            "candidates": candidates,
+            "slice_records": args.auto_threads_slice_records,
+            "configured_threads": args.load_threads,
+            "chosen_threads": args.load_threads,
+            "trials": [],
+            "order_bias": (
+                "Trials run in ascending thread order on consecutive slices, so later trials load into "
+                "a larger repository with warmer caches; differences within the selection tolerance "
+                "are not significant."
+            ),
+        }
+        if len(candidates) < 2 or remaining < 2 * len(candidates) * args.auto_threads_slice_records:
+            load_thread_calibration["reason"] = "skipped: too few candidates or records to calibrate"
+            runtime_warnings.append(
+                f"--auto-threads {load_thread_calibration['reason']}; using {args.load_threads} thread(s)."
             )
+            return
+        print(f"Calibrating load threads: {', '.join(str(item) for item in candidates)}")
+        trials, calibration_steps, end_offset, calibrated_records = calibrate_load_threads(
+            load_input_jsonl,
+            int(load_checkpoint["byte_offset"]),
+            candidates,
+            args.auto_threads_slice_records,
+            run_dir / "load_segments",
+            run_slice,
         )
+        steps.extend(calibration_steps)
+        chosen, reason = choose_load_threads(trials)
+        load_thread_calibration.update(trials=trials, reason=reason)
+        if chosen is None:
+            runtime_warnings.append(f"--auto-threads: {reason}; using {args.load_threads} thread(s).")
+            return
+        load_thread_calibration["chosen_threads"] = chosen
+        args.load_threads = chosen
+        print(f"Load threads: {chosen} ({reason})")
+        if all(trial["ok"] for trial in trials):
+            load_checkpoint["byte_offset"] = end_offset
+            load_checkpoint["records_committed"] = int(load_checkpoint.get("records_committed", 0)) + calibrated_records
+            write_load_checkpoint(load_checkpoint_file, load_checkpoint)
+            load_thread_calibration["records_committed"] = calibrated_records
 
     load_ok = False
-    for attempt_index, (attempt_mode, load_cmd, load_log_path) in enumerate(load_attempts):
-        step_name = "load_records" if attempt_index == 0 else f"load_records_retry_{attempt_index}"
-        step = run_shell_step(
-            step_name,
-            load_cmd,
-            load_log_path,
-            timeout_seconds=args.step_timeout_seconds,
-        )
-        step["attempt_mode"] = attempt_mode
+    if args.loader == "sdk":
+        load_engine, load_cleanup_target, load_engine_details = init_g2_engine(project_dir, project_setup_env)
+        if load_engine and args.auto_threads:
+            auto_tune_load_threads(
+                lambda threads, slice_path, records: load_records_with_sdk(
+                    load_engine,
+                    slice_path,
+                    logs_dir / f"02_calibrate_{threads:03d}_threads.log",
+                    threads=threads,
+                    max_in_flight=args.load_max_in_flight or 64 * threads,
+                    retry_policy={"retryable": args.load_retries, "other": 1, "bad_input": 0, "fatal": 0},
+                    progress_seconds=args.load_progress_seconds,
+                    timeout_seconds=args.step_timeout_seconds,
+                    step_name=f"calibrate_load_threads_{threads}",
+                    max_failure_rate=args.load_max_failure_rate,
+                )
+            )
+        # Per-record retries replace the full single-thread reload used by the file loader.
+        sdk_committed_base = int(load_checkpoint.get("records_committed", 0))
+
+        def commit_sdk_progress(byte_offset: int, records: int) -> None:
+            load_checkpoint["byte_offset"] = byte_offset
+            load_checkpoint["records_committed"] = sdk_committed_base + records
+            write_load_checkpoint(load_checkpoint_file, load_checkpoint)
+
+        if not load_engine:
+            step = {
+                "step": "load_records",
+                "ok": False,
+                "exit_code": 1,
+                "timed_out": False,
+                "duration_seconds": 0.0,
+                "log_file": None,
+                "stdout_tail": "",
+                "stderr_tail": str(
+                    load_engine_details.get("error") or "Unable to initialize SDK engine for loading."
+                )[-1200:],
+            }
+        else:
+            try:
+                step = load_records_with_sdk(
+                    load_engine,
+                    load_input_jsonl,
+                    logs_dir / "02_load.log",
+                    threads=args.load_threads,
+                    max_in_flight=args.load_max_in_flight or 64 * args.load_threads,
+                    retry_policy={"retryable": args.load_retries, "other": 1, "bad_input": 0, "fatal": 0},
+                    progress_seconds=args.load_progress_seconds,
+                    timeout_seconds=args.step_timeout_seconds,
+                    start_offset=int(load_checkpoint["byte_offset"]),
+                    checkpoint_fn=commit_sdk_progress,
+                    max_failure_rate=args.load_max_failure_rate,
+                )
+            finally:
+                try:
+                    if load_cleanup_target is not None and hasattr(load_cleanup_target, "destroy"):
+                        load_cleanup_target.destroy()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+        step["attempt_mode"] = "sdk"
         steps.append(step)
-        if step["ok"]:
-            if attempt_index > 0:
-                runtime_warnings.append(
-                    f"load_records primary attempt failed; fallback '{attempt_mode}' succeeded."
+        load_ok = bool(step["ok"])
+        if load_ok:
+            load_checkpoint["completed"] = True
+            write_load_checkpoint(load_checkpoint_file, load_checkpoint)
+        failed_records = (step.get("loader") or {}).get("records_failed", 0)
+        if load_ok and failed_records:
+            runtime_warnings.append(f"SDK loader: {failed_records} record(s) failed to load; see {step['log_file']}.")
+
+    if args.loader == "file":
+        if args.auto_threads:
+
+            def load_calibration_slice(threads: int, slice_path: Path, records: int) -> dict[str, Any]:
+                step = run_shell_step(
+                    f"calibrate_load_threads_{threads}",
+                    build_load_command(slice_path, threads),
+                    logs_dir / f"02_calibrate_{threads:03d}_threads.log",
+                    timeout_seconds=args.step_timeout_seconds,
+                    setup_env=project_setup_env,
+                    progress_total=records,
                 )
-            load_ok = True
-            break
+                if not args.keep_loader_temp_files:
+                    loader_temp_files_removed.extend(cleanup_loader_shuffle_files(slice_path))
+                return step
+
+            auto_tune_load_threads(load_calibration_slice)
+        load_attempts: list[tuple[str, int, bool]] = [("primary", args.load_threads, False)]
+        if not args.disable_stability_retries:
+            load_attempts.append(("fallback_single_thread", args.load_fallback_threads, True))
+        load_ok, load_steps, load_warnings, load_temp_files_removed = run_checkpointed_file_load(
+            load_checkpoint,
+            load_checkpoint_file,
+            project_setup_env,
+            load_input_jsonl,
+            run_dir / "load_segments",
+            logs_dir,
+            args.load_segment_records,
+            load_attempts,
+            args.step_timeout_seconds,
+            args.keep_loader_temp_files,
+        )
+        steps.extend(load_steps)
+        runtime_warnings.extend(load_warnings)
+        loader_temp_files_removed.extend(load_temp_files_removed)
 
     if not load_ok:
         summary = {
@@ -1710,25 +4275,40 @@ def main() -> int:
             "error": "load_records failed after retries",
             "run_directory": str(run_dir),
             "project_dir": str(project_dir),
+            "load_checkpoint": str(load_checkpoint_file),
+            "records_committed": load_checkpoint.get("records_committed", 0),
+            "load_thread_calibration": load_thread_calibration,
             "runtime_warnings": runtime_warnings,
             "steps": steps,
         }
         summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
         print("FAILED at load_records", file=sys.stderr)
+        print(f"Resume with: --resume {shlex.quote(str(run_dir))}", file=sys.stderr)
         return 1
 
     if not args.keep_loader_temp_files:
-        loader_temp_files_removed = cleanup_loader_shuffle_files(load_input_jsonl)
+        loader_temp_files_removed.extend(cleanup_loader_shuffle_files(load_input_jsonl))
         if loader_temp_files_removed:
             runtime_warnings.append(
                 f"Removed {len(loader_temp_files_removed)} loader temp file(s)."
             )
 
-    if not args.skip_snapshot:
-        snapshot_attempts: list[tuple[str, str, Path]] = [
+    # Snapshot and export only read the loaded repository, so they may overlap.
+    stage_plan = plan_read_stage_threads(
+        args.stage_thread_budget or os.cpu_count() or 1,
+        args.snapshot_threads,
+        run_snapshot=not args.skip_snapshot,
+        run_export=not args.skip_export,
+    )
+    snapshot_steps: list[dict[str, Any]] = []
+    export_steps: list[dict[str, Any]] = []
+    export_index: ExportIndex | None = None
+
+    def run_snapshot_stage() -> bool:
+        snapshot_attempts: list[tuple[str, list[str], Path]] = [
             (
                 "primary",
-                build_snapshot_command(project_setup_env, snapshot_prefix, args.snapshot_threads, force_sdk=False),
+                build_snapshot_command(snapshot_prefix, stage_plan["snapshot_threads"], force_sdk=False),
                 logs_dir / "03_snapshot.log",
             )
         ]
@@ -1737,7 +4317,6 @@ def main() -> int:
                 (
                     "fallback_single_thread_force_sdk",
                     build_snapshot_command(
-                        project_setup_env,
                         snapshot_prefix,
                         args.snapshot_fallback_threads,
                         force_sdk=True,
@@ -1746,82 +4325,122 @@ def main() -> int:
                 )
             )
 
-        snapshot_ok = False
         for attempt_index, (attempt_mode, snapshot_cmd, snapshot_log_path) in enumerate(snapshot_attempts):
             step_name = "snapshot" if attempt_index == 0 else f"snapshot_retry_{attempt_index}"
+            attempt_started = time.time()
             step = run_shell_step(
                 step_name,
                 snapshot_cmd,
                 snapshot_log_path,
                 timeout_seconds=args.step_timeout_seconds,
+                setup_env=project_setup_env,
             )
             step["attempt_mode"] = attempt_mode
-            steps.append(step)
+            step["start_offset_seconds"] = round(attempt_started - run_started, 3)
+            step["end_offset_seconds"] = round(time.time() - run_started, 3)
+            snapshot_steps.append(step)
             if step["ok"]:
                 if attempt_index > 0:
                     runtime_warnings.append(
                         f"snapshot primary attempt failed; fallback '{attempt_mode}' succeeded."
                     )
-                snapshot_ok = True
-                break
-
-        if not snapshot_ok:
-            summary = {
-                "overall_ok": False,
-                "error": "snapshot failed after retries",
-                "run_directory": str(run_dir),
-                "project_dir": str(project_dir),
-                "runtime_warnings": runtime_warnings,
-                "steps": steps,
+                candidates = sorted(run_dir.glob("snapshot*.json"))
+                if candidates:
+                    candidates[0].replace(snapshot_json)
+                return True
+        return False
+
+    def run_export_stage() -> bool:
+        nonlocal export_index
+        export_started = time.time()
+        if args.exporter == "sdk":
+            export_engine, export_cleanup_target, export_engine_details = init_g2_engine(project_dir, project_setup_env)
+            step = {
+                "step": "export",
+                "ok": False,
+                "exit_code": 1,
+                "timed_out": False,
+                "duration_seconds": 0.0,
+                "command_used": "sdk:export_csv_entity_report",
+                "log_file": None,
+                "stdout_tail": "",
+                "stderr_tail": "",
             }
-            summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-            print("FAILED at snapshot", file=sys.stderr)
-            return 1
-
-        candidates = sorted(run_dir.glob("snapshot*.json"))
-        if candidates:
-            candidates[0].replace(snapshot_json)
+            if not export_engine:
+                step["stderr_tail"] = str(
+                    export_engine_details.get("error") or "Unable to initialize SDK engine for export."
+                )[-1200:]
+            else:
+                try:
+                    export_index = ExportIndex.from_sdk(export_engine, export_file if args.export_tee_csv else None)
+                    step["ok"] = True
+                    step["exit_code"] = 0
+                    step["stdout_tail"] = f"Exported {len(export_index)} row(s) from the SDK."
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    step["stderr_tail"] = str(err)[-1200:]
+                finally:
+                    try:
+                        if export_cleanup_target is not None and hasattr(export_cleanup_target, "destroy"):
+                            export_cleanup_target.destroy()
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        pass
+            step["duration_seconds"] = round(time.time() - export_started, 3)
+        else:
+            step = run_shell_step(
+                "export",
+                ["sz_export", "-o", str(export_file)],
+                logs_dir / "04_export.log",
+                timeout_seconds=args.step_timeout_seconds,
+                setup_env=project_setup_env,
+            )
+        step["start_offset_seconds"] = round(export_started - run_started, 3)
+        step["end_offset_seconds"] = round(time.time() - run_started, 3)
+        export_steps.append(step)
+        return bool(step["ok"])
 
+    read_stages: dict[str, tuple[tuple[str, ...], Callable[[], bool]]] = {}
+    if not args.skip_snapshot:
+        read_stages["snapshot"] = ((), run_snapshot_stage)
     if not args.skip_export:
-        export_cmd = (
-            f"source {shlex.quote(str(project_setup_env))} >/dev/null 2>&1 && "
-            f"sz_export -o {shlex.quote(str(export_file))}"
-        )
-        step = run_shell_step(
-            "export",
-            export_cmd,
-            logs_dir / "04_export.log",
-            timeout_seconds=args.step_timeout_seconds,
-        )
-        steps.append(step)
-        if not step["ok"]:
+        read_stages["export"] = ((), run_export_stage)
+    if read_stages:
+        if stage_plan["mode"] == "concurrent":
+            print(
+                f"Running snapshot ({stage_plan['snapshot_threads']} thread(s)) and export concurrently "
+                f"(thread budget {stage_plan['thread_budget']})"
+            )
+        stage_results = run_stage_graph(read_stages, stage_plan["max_parallel"], run_started)
+        stage_plan["stages"] = stage_results
+        stage_plan["overlap_seconds"] = stage_overlap_seconds(stage_results)
+        steps.extend(snapshot_steps)
+        steps.extend(export_steps)
+
+        failed_stage = next((name for name, result in stage_results.items() if not result["ok"]), None)
+        if failed_stage is not None:
             summary = {
                 "overall_ok": False,
-                "error": "export failed",
+                "error": "snapshot failed after retries" if failed_stage == "snapshot" else "export failed",
                 "run_directory": str(run_dir),
                 "project_dir": str(project_dir),
                 "runtime_warnings": runtime_warnings,
+                "read_stages": stage_plan,
                 "steps": steps,
             }
             summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-            print("FAILED at export", file=sys.stderr)
+            print(f"FAILED at {failed_stage}", file=sys.stderr)
             return 1
 
-    need_export_rows = export_file.exists() and (not args.skip_explain or not args.skip_comparison)
-    export_rows: list[dict[str, str]] = parse_export_rows(export_file) if need_export_rows else []
-    matched_records: list[dict[str, str]] = []
-    matched_pairs: list[dict[str, str]] = []
-    if export_rows:
-        matched_records, matched_pairs = build_match_inputs(export_rows)
-
-    why_entity_results: list[dict[str, Any]] = []
-    why_records_results: list[dict[str, Any]] = []
+    if export_index is None and export_file.exists() and (not args.skip_explain or not args.skip_comparison):
+        export_index = ExportIndex.from_csv(export_file)
+    # Matched records/pairs are materialized as dicts only for the explain phase.
+    matched_records: list[dict[str, str]] | None = None
+    matched_pairs: list[dict[str, str]] | None = None
 
     explain_summary: dict[str, Any] = {
         "enabled": not args.skip_explain,
         "status": "skipped" if args.skip_explain else "not_started",
-        "matched_records_detected": len(matched_records),
-        "matched_pairs_detected": len(matched_pairs),
+        "matched_records_detected": export_index.matched_records_count if export_index else 0,
+        "matched_pairs_detected": export_index.matched_pairs_count if export_index else 0,
         "why_entity_attempted": 0,
         "why_entity_ok": 0,
         "why_records_attempted": 0,
@@ -1830,14 +4449,44 @@ def main() -> int:
     }
 
     if not args.skip_explain:
-        if args.skip_export or not export_file.exists():
+        if args.skip_export or export_index is None:
             explain_summary["status"] = "skipped_no_export"
             explain_summary["warnings"].append(
                 "Explain skipped because export file is missing (export skipped or failed)."
             )
         else:
             explain_dir.mkdir(parents=True, exist_ok=True)
-            explain_logs_dir.mkdir(parents=True, exist_ok=True)
+
+            matched_records = export_index.matched_record_items()
+            matched_pairs = list(export_index.iter_matched_pair_items())
+            entity_sizes = {
+                item["resolved_entity_id"]: export_index.entity_size(item["resolved_entity_id"])
+                for item in (*matched_records, *matched_pairs)
+            }
+            explain_sampling: dict[str, Any] = {
+                "strategy": args.explain_sampling,
+                "floor": args.explain_sample_floor if args.explain_sampling == "stratified" else None,
+            }
+            explain_selection: dict[str, list[dict[str, str]]] = {}
+            for label, items, budget in (
+                ("records", matched_records, args.max_explain_records),
+                ("pairs", matched_pairs, args.max_explain_pairs),
+            ):
+                if budget <= 0 or len(items) <= budget:
+                    explain_selection[label] = items
+                    explain_sampling[label] = {"budget": budget, "population": len(items), "selected": len(items)}
+                elif args.explain_sampling == "stratified":
+                    explain_selection[label], explain_sampling[label] = stratified_explain_sample(
+                        items, budget, entity_sizes, floor=args.explain_sample_floor
+                    )
+                    explain_summary["warnings"].append(
+                        f"Matched {label} limited from {len(items)} to {budget} "
+                        f"(stratified over {explain_sampling[label]['strata_total']} strata)."
+                    )
+                else:
+                    explain_selection[label] = items[:budget]
+                    explain_sampling[label] = {"budget": budget, "population": len(items), "selected": budget}
+                    explain_summary["warnings"].append(f"Matched {label} limited from {len(items)} to {budget}.")
 
             match_inputs_file.write_text(
                 json.dumps(
@@ -1845,6 +4494,7 @@ def main() -> int:
                         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
                         "matched_records_detected": len(matched_records),
                         "matched_pairs_detected": len(matched_pairs),
+                        "explain_sampling": explain_sampling,
                         "matched_records": matched_records,
                         "matched_pairs": matched_pairs,
                     },
@@ -1856,16 +4506,9 @@ def main() -> int:
             )
 
             explain_summary["status"] = "done"
-            if args.max_explain_records > 0 and len(matched_records) > args.max_explain_records:
-                explain_summary["warnings"].append(
-                    f"Matched records limited from {len(matched_records)} to {args.max_explain_records}."
-                )
-                matched_records = matched_records[: args.max_explain_records]
-            if args.max_explain_pairs > 0 and len(matched_pairs) > args.max_explain_pairs:
-                explain_summary["warnings"].append(
-                    f"Matched pairs limited from {len(matched_pairs)} to {args.max_explain_pairs}."
-                )
-                matched_pairs = matched_pairs[: args.max_explain_pairs]
+            explain_summary["sampling_strategy"] = args.explain_sampling
+            matched_records = explain_selection["records"]
+            matched_pairs = explain_selection["pairs"]
 
             g2, engine_cleanup_target, engine_details = init_g2_engine(project_dir, project_setup_env)
             explain_summary["engine_mode"] = "python_sdk"
@@ -1878,107 +4521,109 @@ def main() -> int:
                     str(engine_details.get("error") or "Unable to initialize SDK engine for explain phase.")
                 )
             else:
+                explain_executor: Executor | None = None
+                explain_latencies: dict[str, list[float]] = {"why_entity": [], "why_records": []}
+                explain_wall_seconds: dict[str, float] = {}
+                explain_cache: ExplainCache | None = None
+                explain_summary["workers"] = args.explain_workers
+                explain_summary["executor"] = args.explain_executor if args.explain_workers > 1 else "sequential"
+                explain_summary["cache"] = {"enabled": False}
                 try:
-                    with why_entity_file.open("w", encoding="utf-8") as outfile:
-                        for index, rec in enumerate(matched_records, start=1):
-                            ds = rec["data_source"]
-                            rid = rec["record_id"]
-                            started = time.time()
-                            sdk_result = run_sdk_why_entity(g2, ds, rid)
-                            duration = round(time.time() - started, 3)
-                            log_path = explain_logs_dir / f"why_entity_{index:04d}.log"
-                            write_sdk_log(
-                                log_path=log_path,
-                                step_name=f"why_entity_by_record_{index:04d}",
-                                input_payload=rec,
-                                sdk_result=sdk_result,
-                                duration_seconds=duration,
-                            )
-
-                            explain_summary["why_entity_attempted"] += 1
-                            if sdk_result.get("ok"):
-                                explain_summary["why_entity_ok"] += 1
-
-                            item = {
-                                "index": index,
-                                "input": rec,
-                                "ok": bool(sdk_result.get("ok")),
-                                "command_used": f"sdk:{sdk_result.get('method')}" if sdk_result.get("method") else "sdk:unavailable",
-                                "log_file": str(log_path),
-                                "output_json": sdk_result.get("output_json"),
-                                "output_text": None if sdk_result.get("output_json") is not None else str(sdk_result.get("output_text", "")).strip(),
-                                "stderr": sdk_result.get("error"),
-                            }
-                            why_entity_results.append(item)
-                            outfile.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-                            steps.append(
-                                {
-                                    "step": f"why_entity_by_record_{index:04d}",
-                                    "ok": item["ok"],
-                                    "exit_code": 0 if item["ok"] else 1,
-                                    "duration_seconds": duration,
-                                    "command_used": item["command_used"],
-                                    "log_file": str(log_path),
-                                    "stdout_tail": str(item.get("output_text") or "")[-1200:],
-                                    "stderr_tail": str(item.get("stderr") or "")[-1200:],
-                                }
-                            )
-
-                    with why_records_file.open("w", encoding="utf-8") as outfile:
-                        for index, pair in enumerate(matched_pairs, start=1):
-                            ds1 = pair["anchor_data_source"]
-                            rid1 = pair["anchor_record_id"]
-                            ds2 = pair["matched_data_source"]
-                            rid2 = pair["matched_record_id"]
-                            started = time.time()
-                            sdk_result = run_sdk_why_records(g2, ds1, rid1, ds2, rid2)
-                            duration = round(time.time() - started, 3)
-                            log_path = explain_logs_dir / f"why_records_{index:04d}.log"
-                            write_sdk_log(
-                                log_path=log_path,
-                                step_name=f"why_records_{index:04d}",
-                                input_payload=pair,
-                                sdk_result=sdk_result,
-                                duration_seconds=duration,
-                            )
-
-                            explain_summary["why_records_attempted"] += 1
-                            if sdk_result.get("ok"):
-                                explain_summary["why_records_ok"] += 1
-
-                            item = {
-                                "index": index,
-                                "input": pair,
-                                "ok": bool(sdk_result.get("ok")),
-                                "command_used": f"sdk:{sdk_result.get('method')}" if sdk_result.get("method") else "sdk:unavailable",
-                                "log_file": str(log_path),
-                                "output_json": sdk_result.get("output_json"),
-                                "output_text": None if sdk_result.get("output_json") is not None else str(sdk_result.get("output_text", "")).strip(),
-                                "stderr": sdk_result.get("error"),
-                            }
-                            why_records_results.append(item)
-                            outfile.write(json.dumps(item, ensure_ascii=False) + "\n")
-
+                    if args.explain_cache:
+                        config_hash, config_hash_source = compute_engine_config_hash(
+                            engine_cleanup_target, project_dir, data_sources
+                        )
+                        explained_entity_ids = {
+                            item["resolved_entity_id"] for item in [*matched_records, *matched_pairs]
+                        }
+                        explain_cache = ExplainCache(
+                            Path(args.explain_cache).expanduser(),
+                            config_hash,
+                            build_entity_content_hashes(load_input_jsonl, export_index, explained_entity_ids),
+                        )
+                        explain_summary["cache"]["config_hash_source"] = config_hash_source
+                    explain_executor = create_explain_executor(
+                        args.explain_workers, args.explain_executor, project_dir, project_setup_env
+                    )
+                    explain_phases = [
+                        ("why_entity", matched_records, "why_entity_by_record"),
+                        ("why_records", matched_pairs, "why_records"),
+                    ]
+                    explain_log_writer = ExplainLog(
+                        explain_log_file, explain_log_index_file, args.explain_log_compression
+                    )
+                    with explain_log_writer as explain_log:
+                        for kind, payloads, step_prefix in explain_phases:
+                            phase_started = time.time()
+                            last_error: str | None = None
+                            for index, payload, sdk_result, duration in iter_explain_results(
+                                kind,
+                                payloads,
+                                g2,
+                                explain_executor,
+                                max_in_flight=args.explain_workers * 4,
+                                cache=explain_cache,
+                            ):
+                                explain_log.append(
+                                    kind=kind,
+                                    index=index,
+                                    step_name=f"{step_prefix}_{index:04d}",
+                                    input_payload=payload,
+                                    sdk_result=sdk_result,
+                                    duration_seconds=duration,
+                                )
+
+                                explain_summary[f"{kind}_attempted"] += 1
+                                if sdk_result.get("ok"):
+                                    explain_summary[f"{kind}_ok"] += 1
+                                else:
+                                    last_error = sdk_result.get("error") or last_error
+                                if not sdk_result.get("cache_hit"):
+                                    explain_latencies[kind].append(duration)
+                            explain_wall_seconds[kind] = round(time.time() - phase_started, 3)
+
+                            # One step entry per explain phase; per-call details live in the explain log.
+                            attempted = explain_summary[f"{kind}_attempted"]
+                            succeeded = explain_summary[f"{kind}_ok"]
                             steps.append(
                                 {
-                                    "step": f"why_records_{index:04d}",
-                                    "ok": item["ok"],
-                                    "exit_code": 0 if item["ok"] else 1,
-                                    "duration_seconds": duration,
-                                    "command_used": item["command_used"],
-                                    "log_file": str(log_path),
-                                    "stdout_tail": str(item.get("output_text") or "")[-1200:],
-                                    "stderr_tail": str(item.get("stderr") or "")[-1200:],
+                                    "step": step_prefix,
+                                    "ok": succeeded == attempted,
+                                    "exit_code": 0 if succeeded == attempted else 1,
+                                    "duration_seconds": explain_wall_seconds[kind],
+                                    "command_used": f"sdk:{kind}",
+                                    "log_file": str(explain_log_file),
+                                    "calls_attempted": attempted,
+                                    "calls_ok": succeeded,
+                                    "stdout_tail": "",
+                                    "stderr_tail": str(last_error or "")[-1200:],
                                 }
                             )
                 finally:
+                    if explain_executor is not None:
+                        explain_executor.shutdown(wait=True)
+                    if explain_cache is not None:
+                        explain_cache.close()
+                        explain_summary["cache"] = {**explain_summary["cache"], **explain_cache.summary()}
                     try:
                         if engine_cleanup_target is not None and hasattr(engine_cleanup_target, "destroy"):
                             engine_cleanup_target.destroy()
                     except Exception:
                         pass
 
+                explain_summary["latency_seconds"] = {
+                    kind: {
+                        **latency_percentiles(durations),
+                        "wall_seconds": explain_wall_seconds.get(kind),
+                        "calls_per_second": (
+                            round(len(durations) / explain_wall_seconds[kind], 2)
+                            if explain_wall_seconds.get(kind)
+                            else None
+                        ),
+                    }
+                    for kind, durations in explain_latencies.items()
+                }
+
                 if explain_summary["why_entity_attempted"] > 0 and explain_summary["why_entity_ok"] == 0:
                     explain_summary["warnings"].append(
                         "No why-entity call succeeded in SDK mode."
@@ -1988,52 +4633,68 @@ def main() -> int:
                         "No why-records call succeeded in SDK mode."
                     )
 
-    if export_rows and not args.skip_comparison:
+    if export_index and not args.skip_comparison:
         comparison_artifacts = make_comparison_outputs(
             run_dir=run_dir,
             input_jsonl_path=load_input_jsonl,
-            export_rows=export_rows,
-            matched_records=matched_records,
-            matched_pairs=matched_pairs,
-            why_entity_results=why_entity_results,
-            why_records_results=why_records_results,
+            export_index=export_index,
+            matched_records_count=(
+                len(matched_records) if matched_records is not None else export_index.matched_records_count
+            ),
+            matched_pairs=matched_pairs if matched_pairs is not None else export_index.iter_matched_pair_items(),
+            why_entity_results=iter_explain_log(explain_log_file, explain_log_index_file, "why_entity"),
+            why_records_results=iter_explain_log(explain_log_file, explain_log_index_file, "why_records"),
             records_input_count=records_input_count,
+            input_labels_path=input_labels_file,
         )
 
     summary = {
         "overall_ok": True,
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "duration_seconds": round(time.time() - run_started, 3),
         "input_file": str(input_path),
         "project_dir": str(project_dir),
         "project_setup_env": str(project_setup_env),
         "run_directory": str(run_dir),
         "records_input": records_input_count,
         "data_sources": data_sources,
+        "resumed": resume_checkpoint is not None,
         "runtime_options": {
             "step_timeout_seconds": args.step_timeout_seconds,
             "load_threads": args.load_threads,
+            "auto_threads": args.auto_threads,
             "load_fallback_threads": args.load_fallback_threads,
             "snapshot_threads": args.snapshot_threads,
             "snapshot_fallback_threads": args.snapshot_fallback_threads,
+            "stage_thread_budget": args.stage_thread_budget,
+            "resource_sample_seconds": args.resource_sample_seconds,
             "fast_mode": args.fast_mode,
             "skip_comparison": args.skip_comparison,
             "use_input_jsonl_directly": args.use_input_jsonl_directly,
             "data_sources_override": data_sources_override,
             "keep_loader_temp_files": args.keep_loader_temp_files,
             "stability_retries_enabled": not args.disable_stability_retries,
+            "load_segment_records": args.load_segment_records,
+            "exporter": args.exporter,
+            "normalize_mode": args.normalize_mode,
+            "normalize_hardlink": args.normalize_hardlink,
+            "project_template_cache": args.project_template_cache,
+            "normalize_output_mode": normalize_output_mode,
         },
         "runtime_warnings": runtime_warnings,
         "artifacts": {
             "normalized_jsonl": str(normalized_jsonl) if normalized_jsonl.exists() else None,
             "load_input_jsonl": str(load_input_jsonl),
             "loader_temp_files_removed": loader_temp_files_removed,
+            "load_checkpoint": str(load_checkpoint_file),
+            "input_labels_sidecar": str(input_labels_file) if input_labels_file.exists() else None,
             "config_scripts_dir": str(config_scripts_dir),
             "snapshot_json": str(snapshot_json) if snapshot_json.exists() else None,
             "export_file": str(export_file) if export_file.exists() else None,
             "explain_dir": str(explain_dir) if explain_dir.exists() else None,
             "match_inputs_file": str(match_inputs_file) if match_inputs_file.exists() else None,
-            "why_entity_file": str(why_entity_file) if why_entity_file.exists() else None,
-            "why_records_file": str(why_records_file) if why_records_file.exists() else None,
+            "explain_log_file": str(explain_log_file) if explain_log_file.exists() else None,
+            "explain_log_index_file": str(explain_log_index_file) if explain_log_index_file.exists() else None,
             "comparison_dir": comparison_artifacts.get("comparison_dir"),
             "entity_records_csv": comparison_artifacts.get("entity_records_csv"),
             "matched_pairs_csv": comparison_artifacts.get("matched_pairs_csv"),
@@ -2046,19 +4707,24 @@ def main() -> int:
         },
         "explain": explain_summary,
         "comparison": comparison_artifacts,
+        "read_stages": stage_plan,
+        "load_thread_calibration": load_thread_calibration,
         "steps": steps,
     }
     try:
-        run_registry_path = append_run_registry_entry(
+        run_registry_paths = append_run_registry_entry(
             repo_root=repo_root,
             summary=summary,
             load_input_jsonl=load_input_jsonl,
+            runtime_warnings=runtime_warnings,
         )
     except Exception as err:  # pylint: disable=broad-exception-caught
         runtime_warnings.append(f"Unable to append run registry entry: {err}")
-        run_registry_path = None
+        run_registry_paths = None
+    run_registry_path, run_registry_db_path = run_registry_paths or (None, None)
 
     summary["artifacts"]["run_registry_csv"] = str(run_registry_path) if run_registry_path else None
+    summary["artifacts"]["run_registry_db"] = str(run_registry_db_path) if run_registry_db_path else None
 
     summary_file.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
@@ -2066,6 +4732,8 @@ def main() -> int:
     print(f"Summary: {summary_file}")
     if run_registry_path:
         print(f"Run registry: {run_registry_path}")
+    if run_registry_db_path:
+        print(f"Run registry DB: {run_registry_db_path}")
     print(f"Project: {project_dir}")
     print(f"Artifacts: {run_dir}")
     return 0
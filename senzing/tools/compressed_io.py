@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Open plain or compressed (gzip, bz2, xz, zstd) files by extension or magic bytes.
+
+Shared by the mapper, linter, analyzer, schema generator and the E2E runner;
+zstd needs the optional `zstandard` package.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, Any
+
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+COMPRESSION_MAGIC = [(b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "xz"), (b"\x28\xb5\x2f\xfd", "zstd")]
+
+
+def detect_compression(path: str | os.PathLike[str], for_write: bool = False) -> str | None:
+    """Detect the compression codec from the extension or, when reading a regular file, magic bytes."""
+    codec = COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+    if codec or for_write or not os.path.isfile(path):
+        return codec
+    with open(path, "rb") as raw:
+        head = raw.read(6)
+    return next((name for magic, name in COMPRESSION_MAGIC if head.startswith(magic)), None)
+
+
+def open_file(path: str | os.PathLike[str], mode: str = "r", encoding: str = "utf-8") -> IO[Any]:
+    """Open a file in text or binary ("rb"/"wb") mode, streaming through gzip/bz2/xz/zstd when detected.
+
+    Raises ValueError for zstd files when the zstandard package is not installed.
+    """
+    codec = detect_compression(path, for_write=mode[0] in "wax")
+    binary = "b" in mode
+    kwargs = {} if binary else {"encoding": encoding}
+    stream_mode = mode if binary else mode.rstrip("t") + "t"
+    if codec == "gzip":
+        return gzip.open(path, stream_mode, compresslevel=6, **kwargs)
+    if codec == "bz2":
+        return bz2.open(path, stream_mode, **kwargs)
+    if codec == "xz":
+        return lzma.open(path, stream_mode, **kwargs)
+    if codec == "zstd":
+        try:
+            import zstandard  # type: ignore  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ValueError(f"zstd compressed file requires the 'zstandard' package: {path}") from err
+        return zstandard.open(path, stream_mode, **kwargs)
+    return open(path, mode, **kwargs)  # pylint: disable=unspecified-encoding
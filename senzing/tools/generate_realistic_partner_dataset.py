@@ -2,7 +2,7 @@
 """Generate a realistic partner input sample and map it to Senzing JSONL.
 
 This script creates:
-1) A base input JSON array in `sample/` (internal/source-style schema).
+1) A base input JSON array (or JSONL, optionally compressed) in `sample/` (internal/source-style schema).
 2) A mapped Senzing JSONL file in `output/` using partner_json_to_senzing.py.
 
 The generated base records always include:
@@ -15,16 +15,25 @@ The generated base records always include:
 from __future__ import annotations
 
 import argparse
+import bz2
 import datetime as dt
+import gzip
+import hashlib
+import importlib.util
 import json
+import lzma
+import os
 import random
 import re
+import shutil
+import sqlite3
 import string
 import subprocess
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 
 COUNTRY_PROFILES: list[dict[str, Any]] = [
@@ -330,14 +339,74 @@ def cluster_sizes_for_records(total_cluster_records: int, rng: random.Random) ->
     return sizes
 
 
+def record_type_counts(stats: dict[str, Any], record_type: str) -> None:
+    """Count one generated record by type."""
+    if record_type == "PERSON":
+        stats["person_records"] += 1
+    else:
+        stats["organization_records"] += 1
+
+
+def cluster_records(
+    rng: random.Random,
+    person_ratio: float,
+    ipg_id: str,
+    size: int,
+    first_record_number: int,
+) -> tuple[str, list[dict[str, Any]]]:
+    """Generate the records of one IPG cluster (variants of one anchor profile)."""
+    record_type = choose_record_type(rng, person_ratio)
+    anchor_profile = build_profile(record_type, rng)
+    payloads: list[dict[str, Any]] = []
+    for member_index in range(size):
+        profile = dict(anchor_profile)
+        if member_index > 0:
+            mutate_variant(profile, rng)
+        apply_sparsity(profile, record_type, rng, clustered=True)
+        payloads.append(to_input_record(profile, first_record_number + member_index, ipg_id, rng))
+    return record_type, payloads
+
+
+def singleton_record(rng: random.Random, person_ratio: float, record_number: int) -> tuple[str, dict[str, Any]]:
+    """Generate one record without IPG ID."""
+    record_type = choose_record_type(rng, person_ratio)
+    profile = build_profile(record_type, rng)
+    apply_sparsity(profile, record_type, rng, clustered=False)
+    return record_type, to_input_record(profile, record_number, None, rng)
+
+
+def open_dataset_output(output_path: Path, compression: str) -> TextIO:
+    """Open the dataset file for text writing, compressed as requested."""
+    if compression == "gzip":
+        return gzip.open(output_path, "wt", encoding="utf-8")
+    if compression == "bz2":
+        return bz2.open(output_path, "wt", encoding="utf-8")
+    if compression == "xz":
+        return lzma.open(output_path, "wt", encoding="utf-8")
+    return output_path.open("w", encoding="utf-8")
+
+
+def compress_bytes(data: bytes, compression: str) -> bytes:
+    """Compress one piece as a standalone member/stream of the given format."""
+    if compression == "gzip":
+        return gzip.compress(data, mtime=0)
+    if compression == "bz2":
+        return bz2.compress(data)
+    if compression == "xz":
+        return lzma.compress(data)
+    return data
+
+
 def generate_dataset(
     records: int,
     person_ratio: float,
     ipg_rate: float,
     seed: int,
     output_path: Path,
+    output_format: str = "json",
+    compression: str = "none",
 ) -> dict[str, Any]:
-    """Generate dataset and write JSON array streaming to disk."""
+    """Generate dataset on one random stream and write it streaming to disk."""
     rng = random.Random(seed)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -354,59 +423,200 @@ def generate_dataset(
 
     record_number = 0
     ipg_counter = 0
+    separator = ",\n" if output_format == "json" else ""
+    terminator = "" if output_format == "json" else "\n"
 
-    with output_path.open("w", encoding="utf-8") as out:
-        out.write("[")
+    with open_dataset_output(output_path, compression) as out:
+        if output_format == "json":
+            out.write("[")
 
         def write_record(payload: dict[str, Any], is_first: bool) -> None:
             if not is_first:
-                out.write(",\n")
+                out.write(separator)
             out.write(json.dumps(payload, ensure_ascii=False))
+            out.write(terminator)
 
         first = True
 
         # 1) Records with IPG clusters (known internal matches).
         for size in cluster_sizes:
             ipg_counter += 1
-            ipg_id = f"IPG-{ipg_counter:09d}"
-            record_type = choose_record_type(rng, person_ratio)
-            anchor_profile = build_profile(record_type, rng)
-
-            for member_index in range(size):
-                profile = dict(anchor_profile)
-                if member_index > 0:
-                    mutate_variant(profile, rng)
-                apply_sparsity(profile, record_type, rng, clustered=True)
-
+            record_type, payloads = cluster_records(
+                rng, person_ratio, f"IPG-{ipg_counter:09d}", size, record_number + 1
+            )
+            for payload in payloads:
                 record_number += 1
-                payload = to_input_record(profile, record_number, ipg_id, rng)
                 write_record(payload, first)
                 first = False
-
                 stats["records_with_ipg_id"] += 1
-                if record_type == "PERSON":
-                    stats["person_records"] += 1
-                else:
-                    stats["organization_records"] += 1
+                record_type_counts(stats, record_type)
 
         # 2) Remaining singleton records without IPG.
         while record_number < records:
-            record_type = choose_record_type(rng, person_ratio)
-            profile = build_profile(record_type, rng)
-            apply_sparsity(profile, record_type, rng, clustered=False)
-
             record_number += 1
-            payload = to_input_record(profile, record_number, None, rng)
+            record_type, payload = singleton_record(rng, person_ratio, record_number)
             write_record(payload, first)
             first = False
+            record_type_counts(stats, record_type)
+
+        if output_format == "json":
+            out.write("\n]\n")
 
-            if record_type == "PERSON":
-                stats["person_records"] += 1
-            else:
-                stats["organization_records"] += 1
+    return stats
 
-        out.write("\n]\n")
 
+def chunk_seed(seed: int, chunk_index: int) -> int:
+    """Seed of one chunk, derived from the master seed only."""
+    digest = hashlib.sha256(f"{seed}:{chunk_index}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def plan_chunks(records: int, ipg_rate: float, seed: int, chunk_records: int) -> tuple[list[dict[str, Any]], int]:
+    """Split the record sequence into chunks of about chunk_records records.
+
+    Cluster sizes come from the master seed as in generate_dataset; a chunk only
+    closes after a complete cluster, so every IPG cluster is generated by one
+    chunk. IPG numbers and record numbers are global. Returns (chunks, clusters).
+    """
+    cluster_sizes = cluster_sizes_for_records(int(round(records * ipg_rate)), random.Random(seed))
+    chunks: list[dict[str, Any]] = []
+    current: dict[str, Any] = {"first_record": 1, "first_ipg": 1, "cluster_sizes": [], "singletons": 0, "records": 0}
+
+    def close_chunk() -> None:
+        nonlocal current
+        chunks.append(current)
+        current = {
+            "first_record": current["first_record"] + current["records"],
+            "first_ipg": current["first_ipg"] + len(current["cluster_sizes"]),
+            "cluster_sizes": [],
+            "singletons": 0,
+            "records": 0,
+        }
+
+    for size in cluster_sizes:
+        current["cluster_sizes"].append(size)
+        current["records"] += size
+        if current["records"] >= chunk_records:
+            close_chunk()
+    remaining = records - sum(cluster_sizes)
+    while remaining > 0:
+        take = min(chunk_records - current["records"], remaining)
+        current["singletons"] += take
+        current["records"] += take
+        remaining -= take
+        if current["records"] >= chunk_records:
+            close_chunk()
+    if current["records"]:
+        chunks.append(current)
+    return chunks, len(cluster_sizes)
+
+
+def generate_chunk(task: dict[str, Any]) -> dict[str, Any]:
+    """Generate one planned chunk into its own (compressed) file; returns its stats.
+
+    Runs in a worker process. Records are separated as in the final file, without
+    a leading or trailing separator, so chunk files can be concatenated as bytes.
+    """
+    rng = random.Random(chunk_seed(task["seed"], task["index"]))
+    stats = {"records_with_ipg_id": 0, "person_records": 0, "organization_records": 0}
+    json_array = task["output_format"] == "json"
+    record_number = task["first_record"]
+    first = True
+    with open_dataset_output(Path(task["path"]), task["compression"]) as out:
+
+        def write_record(payload: dict[str, Any]) -> None:
+            nonlocal first
+            if json_array and not first:
+                out.write(",\n")
+            out.write(json.dumps(payload, ensure_ascii=False))
+            if not json_array:
+                out.write("\n")
+            first = False
+
+        for offset, size in enumerate(task["cluster_sizes"]):
+            ipg_id = f"IPG-{task['first_ipg'] + offset:09d}"
+            record_type, payloads = cluster_records(rng, task["person_ratio"], ipg_id, size, record_number)
+            for payload in payloads:
+                write_record(payload)
+                stats["records_with_ipg_id"] += 1
+                record_type_counts(stats, record_type)
+            record_number += size
+        for _ in range(task["singletons"]):
+            record_type, payload = singleton_record(rng, task["person_ratio"], record_number)
+            write_record(payload)
+            record_type_counts(stats, record_type)
+            record_number += 1
+    return stats
+
+
+def generate_dataset_parallel(
+    records: int,
+    person_ratio: float,
+    ipg_rate: float,
+    seed: int,
+    output_path: Path,
+    workers: int,
+    chunk_records: int,
+    output_format: str = "json",
+    compression: str = "none",
+) -> dict[str, Any]:
+    """Generate dataset chunks in worker processes and concatenate the chunk files.
+
+    Each chunk has its own seed derived from the master seed, so the output is
+    the same for any worker count (for a given seed and chunk_records). It is not
+    the same as the single-stream output of generate_dataset.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    chunks, clusters = plan_chunks(records, ipg_rate, seed, chunk_records)
+    chunks_dir = output_path.parent / f".{output_path.name}.chunks"
+    shutil.rmtree(chunks_dir, ignore_errors=True)
+    chunks_dir.mkdir(parents=True)
+    tasks = [
+        {
+            **chunk,
+            "index": index,
+            "seed": seed,
+            "person_ratio": person_ratio,
+            "output_format": output_format,
+            "compression": compression,
+            "path": str(chunks_dir / f"chunk_{index:06d}"),
+        }
+        for index, chunk in enumerate(chunks)
+    ]
+
+    stats = {
+        "records_total": records,
+        "records_with_ipg_id": 0,
+        "person_records": 0,
+        "organization_records": 0,
+        "clusters_with_ipg_id": clusters,
+        "chunks": len(tasks),
+    }
+    try:
+        if workers == 1:
+            chunk_stats = [generate_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                chunk_stats = list(executor.map(generate_chunk, tasks))
+        for item in chunk_stats:
+            for key, value in item.items():
+                stats[key] += value
+
+        # gzip members, bz2 and xz streams concatenate into one valid file, so chunk
+        # files are copied as bytes; only the array brackets and separators are new.
+        with output_path.open("wb") as out:
+            if output_format == "json":
+                out.write(compress_bytes(b"[", compression))
+            for index, task in enumerate(tasks):
+                if output_format == "json" and index > 0:
+                    out.write(compress_bytes(b",\n", compression))
+                with open(task["path"], "rb") as chunk_file:
+                    shutil.copyfileobj(chunk_file, out, 1024 * 1024)
+                os.unlink(task["path"])
+            if output_format == "json":
+                out.write(compress_bytes(b"\n]\n", compression))
+    finally:
+        shutil.rmtree(chunks_dir, ignore_errors=True)
     return stats
 
 
@@ -429,6 +639,27 @@ def run_mapper(repo_root: Path, input_json: Path, output_jsonl: Path, field_map_
     return result.returncode
 
 
+RUN_REGISTRY_TOOL = Path(__file__).resolve().with_name("run_registry.py")
+
+
+def record_generation_summary(output_dir: Path, metadata_path: Path, metadata: dict[str, Any]) -> None:
+    """Register the written summary in output/run_registry.sqlite for E2E input lookups."""
+    try:
+        spec = importlib.util.spec_from_file_location("run_registry", RUN_REGISTRY_TOOL)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load {RUN_REGISTRY_TOOL}")
+        run_registry = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(run_registry)
+        conn = run_registry.open_registry(output_dir / run_registry.RUN_REGISTRY_DB_NAME)
+        try:
+            with conn:
+                run_registry.register_generation_summary(conn, metadata_path, metadata)
+        finally:
+            conn.close()
+    except (ImportError, OSError, sqlite3.Error) as err:
+        print(f"WARNING: unable to register {metadata_path.name} in run registry: {err}", file=sys.stderr)
+
+
 def parse_args() -> argparse.Namespace:
     """CLI parser."""
     parser = argparse.ArgumentParser(description="Generate realistic partner sample and Senzing JSONL.")
@@ -439,6 +670,31 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--sample-dir", default="sample", help="Directory for generated base input JSON files")
     parser.add_argument("--output-dir", default="output", help="Directory for mapped JSONL and metadata")
     parser.add_argument("--skip-mapper", action="store_true", help="Generate base sample only, skip mapper conversion")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Generate in chunks on N processes; output is the same for any N >= 1 "
+        "(default: 0 = single random stream, as before)",
+    )
+    parser.add_argument(
+        "--chunk-records",
+        type=int,
+        default=100000,
+        help="Records per chunk with --workers; changing it changes the output (default: 100000)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("json", "jsonl"),
+        default="json",
+        help="Base input as one JSON array or JSONL (default: json)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=("none", "gzip", "bz2", "xz"),
+        default="none",
+        help="Compress the base input (default: none)",
+    )
     return parser.parse_args()
 
 
@@ -454,6 +710,12 @@ def main() -> int:
     if not 0.0 <= args.ipg_rate <= 1.0:
         print("ERROR: --ipg-rate must be in [0,1]", file=sys.stderr)
         return 2
+    if args.workers < 0:
+        print("ERROR: --workers must be >= 0", file=sys.stderr)
+        return 2
+    if args.chunk_records <= 0:
+        print("ERROR: --chunk-records must be > 0", file=sys.stderr)
+        return 2
 
     repo_root = Path(__file__).resolve().parents[2]
     sample_dir = (repo_root / args.sample_dir).resolve()
@@ -462,19 +724,39 @@ def main() -> int:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     timestamp = now_timestamp()
-    base_input_path = sample_dir / f"partner_input_realistic_{args.records}_{timestamp}.json"
+    compression_suffix = {"none": "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}[args.compression]
+    base_input_path = (
+        sample_dir / f"partner_input_realistic_{args.records}_{timestamp}.{args.output_format}{compression_suffix}"
+    )
     mapped_output_path = output_dir / f"partner_output_senzing_{args.records}_{timestamp}.jsonl"
     field_map_path = output_dir / f"field_map_{args.records}_{timestamp}.json"
     metadata_path = output_dir / f"generation_summary_{args.records}_{timestamp}.json"
 
     print(f"Generating base input: {base_input_path}")
-    stats = generate_dataset(
-        records=args.records,
-        person_ratio=args.person_ratio,
-        ipg_rate=args.ipg_rate,
-        seed=args.seed,
-        output_path=base_input_path,
-    )
+    generation_started = dt.datetime.now()
+    if args.workers > 0:
+        stats = generate_dataset_parallel(
+            records=args.records,
+            person_ratio=args.person_ratio,
+            ipg_rate=args.ipg_rate,
+            seed=args.seed,
+            output_path=base_input_path,
+            workers=args.workers,
+            chunk_records=args.chunk_records,
+            output_format=args.output_format,
+            compression=args.compression,
+        )
+    else:
+        stats = generate_dataset(
+            records=args.records,
+            person_ratio=args.person_ratio,
+            ipg_rate=args.ipg_rate,
+            seed=args.seed,
+            output_path=base_input_path,
+            output_format=args.output_format,
+            compression=args.compression,
+        )
+    generation_seconds = round((dt.datetime.now() - generation_started).total_seconds(), 3)
 
     metadata: dict[str, Any] = {
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
@@ -482,6 +764,11 @@ def main() -> int:
         "records": args.records,
         "person_ratio_target": args.person_ratio,
         "ipg_rate_target": args.ipg_rate,
+        "workers": args.workers,
+        "chunk_records": args.chunk_records if args.workers > 0 else None,
+        "output_format": args.output_format,
+        "compression": args.compression,
+        "generation_seconds": generation_seconds,
         "base_input_json": str(base_input_path),
         "mapped_output_jsonl": None if args.skip_mapper else str(mapped_output_path),
         "field_map_json": None if args.skip_mapper else str(field_map_path),
@@ -495,11 +782,13 @@ def main() -> int:
         metadata["mapper_exit_code"] = exit_code
         if exit_code != 0:
             metadata_path.write_text(json.dumps(metadata, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            record_generation_summary(output_dir, metadata_path, metadata)
             print(f"ERROR: mapper failed with exit code {exit_code}", file=sys.stderr)
             print(f"Metadata: {metadata_path}", file=sys.stderr)
             return 1
 
     metadata_path.write_text(json.dumps(metadata, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    record_generation_summary(output_dir, metadata_path, metadata)
 
     print("Done.")
     print(f"Base sample: {base_input_path}")
@@ -18,6 +18,9 @@ USAGE EXAMPLES:
   # Lint all JSON/JSONL files in a directory (recursive)
   python3 lint_senzing_json.py /path/to/directory
 
+  # Lint a compressed file (gzip, bz2, xz; zstd when zstandard is installed)
+  python3 lint_senzing_json.py records.jsonl.gz
+
   # Read from stdin (pipe or redirect)
   cat records.jsonl | python3 lint_senzing_json.py
   python3 lint_senzing_json.py < records.json
@@ -26,6 +29,11 @@ USAGE EXAMPLES:
   # Explicit stdin with "-"
   python3 lint_senzing_json.py -
 
+  # Stream JSONL through the linter: valid records are echoed to stdout,
+  # messages go to stderr (use between the mapper and a loader)
+  python3 partner_json_to_senzing.py input.json - | \
+    python3 lint_senzing_json.py - --passthrough > records.jsonl
+
   # Show this help
   python3 lint_senzing_json.py --help
 
@@ -55,6 +63,8 @@ import os
 import sys
 from typing import Any, Dict, List, Tuple
 
+from compressed_io import COMPRESSION_SUFFIXES, open_file
+
 SCALAR_TYPES = (str, int, float, bool, type(None))
 
 ALLOWED_ROOT_KEYS = {"DATA_SOURCE", "RECORD_ID", "FEATURES"}
@@ -314,13 +324,19 @@ def lint_record(doc: Any, where: str, *, strict: bool = True) -> List[str]:
     return errors
 
 
+def strip_compression_suffix(path: str) -> str:
+    """Return path without a trailing compression extension (data.jsonl.gz -> data.jsonl)."""
+    base, ext = os.path.splitext(path)
+    return base if ext.lower() in COMPRESSION_SUFFIXES else path
+
+
 def iter_paths(root: str) -> List[str]:
-    """Return list of JSON/JSONL file paths from root (file or directory)."""
+    """Return list of JSON/JSONL file paths (optionally compressed) from root (file or directory)."""
     if os.path.isdir(root):
         out: List[str] = []
         for d, _, files in os.walk(root):
             for fn in files:
-                if fn.lower().endswith((".json", ".jsonl")):
+                if strip_compression_suffix(fn).lower().endswith((".json", ".jsonl")):
                     out.append(os.path.join(d, fn))
         return sorted(out)
     return [root]
@@ -329,8 +345,12 @@ def iter_paths(root: str) -> List[str]:
 def load_file(path: str) -> List[Tuple[Any, str]]:
     """Load JSON/JSONL file and return list of (object, location) tuples."""
     items: List[Tuple[Any, str]] = []
-    with open(path, "r", encoding="utf-8") as f:
-        if path.lower().endswith(".jsonl"):
+    try:
+        f = open_file(path)
+    except ValueError as e:
+        return [(None, f"{path} ({e})")]
+    with f:
+        if strip_compression_suffix(path).lower().endswith(".jsonl"):
             for i, line in enumerate(f, start=1):
                 line = line.strip()
                 if not line:
@@ -378,6 +398,35 @@ def load_stdin() -> List[Tuple[Any, str]]:
     return items
 
 
+def passthrough_stdin(strict: bool = True) -> Tuple[int, int]:
+    """Stream JSONL from stdin to stdout, echoing only records that pass linting.
+
+    Returns (records_passed, total_errors). All messages go to stderr so stdout
+    can feed a downstream loader.
+    """
+    passed = 0
+    total_errors = 0
+    for i, line in enumerate(sys.stdin, start=1):
+        if not line.strip():
+            continue
+        where = f"stdin:{i}"
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"ERROR: {where} (invalid JSON: {e})", file=sys.stderr)
+            total_errors += 1
+            continue
+        errs = lint_record(obj, where, strict=strict)
+        if errs:
+            total_errors += len(errs)
+            for e in errs:
+                print(f"ERROR: {e}", file=sys.stderr)
+            continue
+        sys.stdout.write(line if line.endswith("\n") else line + "\n")
+        passed += 1
+    return passed, total_errors
+
+
 def self_test() -> int:
     """Run self-test with minimal valid and invalid Senzing JSON records."""
     print("Running linter self-test...")
@@ -434,6 +483,25 @@ def main(argv: List[str]) -> int:
     # Determine if using stdin
     use_stdin = len(argv) < 2 or (len(argv) >= 2 and argv[1] == "-")
 
+    if use_stdin and "--passthrough" in argv[2:]:
+        strict = "--no-strict" not in argv[2:]
+        try:
+            passed, total_errors = passthrough_stdin(strict=strict)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            print("ERROR: Output pipe closed before linting finished.", file=sys.stderr)
+            return 1
+        if total_errors:
+            print(f"FAIL: {total_errors} error(s) found, {passed} record(s) passed", file=sys.stderr)
+            return 1
+        if not passed:
+            print("ERROR: No valid JSON found in stdin", file=sys.stderr)
+            return 2
+        print(f"OK: {passed} record(s) passed", file=sys.stderr)
+        return 0
+
     if use_stdin:
         # Read from stdin
         items = load_stdin()
@@ -2,11 +2,14 @@
 """Convert partner JSON arrays into Senzing-ready JSONL records.
 
 Input format:
-- A JSON file containing an array of objects.
+- A JSON file containing an array of objects, or JSONL (one object per line).
 - Each object represents one source record.
+- gzip, bz2, xz and zstd (when `zstandard` is installed) inputs are read
+  transparently, detected by extension or magic bytes.
+- `-` reads from stdin; records are streamed, never loaded all at once.
 
 Output format:
-- JSONL file (one Senzing record per line), with:
+- JSONL file, or stdout when the output path is `-` (one Senzing record per line), with:
   - DATA_SOURCE
   - RECORD_ID
   - FEATURES (Senzing feature objects)
@@ -30,13 +33,21 @@ fallback, so it can handle naming variations (spaces, underscores, camelCase).
 from __future__ import annotations
 
 import argparse
+import contextlib
 import difflib
 import datetime as dt
+import itertools
 import json
+import os
+import queue
 import re
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
+
+from compressed_io import COMPRESSION_SUFFIXES, open_file
 
 
 CANONICAL_FIELDS: dict[str, list[str]] = {
@@ -205,6 +216,16 @@ CLASS_CODE_TO_RECORD_TYPE = {
 }
 
 
+STDIO_PATH = "-"
+
+
+def strip_compression_suffix(path: Path) -> Path:
+    """Return path without a trailing compression extension (data.jsonl.gz -> data.jsonl)."""
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return path.with_suffix("")
+    return path
+
+
 def normalize_key(text: str) -> str:
     """Normalize key names for robust matching."""
     return re.sub(r"[^a-z0-9]+", "", text.lower())
@@ -370,156 +391,286 @@ def append_other_id_feature(
     features.append(feature)
 
 
+class RecordConversionError(ValueError):
+    """Raised by MapperEngine in strict mode when a record cannot be converted."""
+
+
+class MapperEngine:
+    """Reusable partner-to-Senzing converter for in-process and batch use.
+
+    Construct once from a field map and mapping options, then call `convert_batch`
+    or `iter_convert` repeatedly. Source-key resolution is cached per record key
+    layout, so records sharing the same keys skip alias and fuzzy matching.
+    RECORD_ID continues as one sequence across calls unless `start_index` is given.
+    """
+
+    PLAN_CACHE_LIMIT = 1024
+
+    def __init__(
+        self,
+        field_map: dict[str, str],
+        *,
+        data_source: str = "PARTNERS",
+        partner_id_feature_type: str = "PARTNER_ID",
+        business_relation_feature_type: str = "BUSINESS_RELATION_ID",
+        tax_id_type: str = "TIN",
+        fuzzy_cutoff: float = 0.90,
+        include_unmapped_source_fields: bool = False,
+        strict: bool = False,
+    ) -> None:
+        if not 0.0 <= fuzzy_cutoff <= 1.0:
+            raise ValueError("fuzzy_cutoff must be between 0 and 1")
+        self.field_map = dict(field_map)
+        self.data_source = data_source
+        self.partner_id_feature_type = partner_id_feature_type
+        self.business_relation_feature_type = business_relation_feature_type
+        self.tax_id_type = tax_id_type
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.include_unmapped_source_fields = include_unmapped_source_fields
+        self.strict = strict
+        self.next_record_index = 1
+        self.records_converted = 0
+        self.records_skipped = 0
+        self._plan_cache: dict[tuple[str, ...], dict[str, str | None]] = {}
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace, field_map: dict[str, str]) -> "MapperEngine":
+        """Build an engine from parsed CLI arguments."""
+        return cls(
+            field_map,
+            data_source=args.data_source,
+            partner_id_feature_type=args.partner_id_feature_type,
+            business_relation_feature_type=args.business_relation_feature_type,
+            tax_id_type=args.tax_id_type,
+            fuzzy_cutoff=args.fuzzy_cutoff,
+            include_unmapped_source_fields=args.include_unmapped_source_fields,
+            strict=getattr(args, "strict", False),
+        )
+
+    @classmethod
+    def from_sample(cls, sample_records: list[dict[str, Any]], **options: Any) -> "MapperEngine":
+        """Build an engine whose field map is inferred from sample records."""
+        return cls(infer_field_map(sample_records, options.get("fuzzy_cutoff", 0.90)), **options)
+
+    @property
+    def unresolved_fields(self) -> list[str]:
+        """Canonical fields without a dataset-level source key."""
+        return [field for field in CANONICAL_FIELDS if field not in self.field_map]
+
+    def resolution_plan(self, record: dict[str, Any]) -> dict[str, str | None]:
+        """Return the canonical->source key resolution for the record's key layout."""
+        layout = tuple(record)
+        plan = self._plan_cache.get(layout)
+        if plan is None:
+            plan = {
+                canonical: resolve_value(record, self.field_map, canonical, self.fuzzy_cutoff)[1]
+                for canonical in CANONICAL_FIELDS
+            }
+            if len(self._plan_cache) >= self.PLAN_CACHE_LIMIT:
+                self._plan_cache.clear()
+            self._plan_cache[layout] = plan
+        return plan
+
+    def convert(self, record: dict[str, Any], record_index: int) -> tuple[dict[str, Any] | None, str | None]:
+        """Convert one source record to one Senzing record.
+
+        Returns (output_record, None) on success or (None, error message).
+        """
+        if not isinstance(record, dict):
+            return None, "record is not a JSON object"
+
+        plan = self.resolution_plan(record)
+        resolved_source_keys = {source_key for source_key in plan.values() if source_key}
+
+        def read(canonical_field: str) -> str | None:
+            source_key = plan[canonical_field]
+            return to_text(record.get(source_key)) if source_key else None
+
+        external_partner_key_dir_external_id = read("external_partner_key_dir_external_id")
+        partner_key_dir_bus_rel_external_id = read("partner_key_dir_bus_rel_external_id")
+
+        # RECORD_ID is a simple monotonically increasing sequence per input file.
+        record_id = str(record_index)
+
+        partner_class_code = read("partner_class_code")
+        partner_name = read("partner_name")
+        legal_first_name = read("legal_first_name")
+        additional_name = read("additional_name")
+        birth_or_foundation_date = read("birth_or_foundation_date")
+        domicile_country_code = read("domicile_country_code")
+        prime_nationality_country_code = read("prime_nationality_country_code")
+        address_street_name = read("address_street_name")
+        address_residence_identifier = read("address_residence_identifier")
+        address_postal_code = read("address_postal_code")
+        address_postal_city_name = read("address_postal_city_name")
+        lei = read("lei")
+        lem_id = read("lem_id")
+        crn = read("crn")
+        tax_id = read("tax_id")
+        id_document_number = read("id_document_number")
+        electronic_address = read("electronic_address")
+        ipg_id = read("ipg_id")
+
+        normalized_class_code = (partner_class_code or "").upper()
+        record_type = CLASS_CODE_TO_RECORD_TYPE.get(normalized_class_code)
+
+        features: list[dict[str, str]] = []
+
+        if record_type:
+            features.append({"RECORD_TYPE": record_type})
+
+        name_feature = build_name(record_type, partner_name, legal_first_name, additional_name)
+        if name_feature:
+            features.append(name_feature)
+        if record_type != "ORGANIZATION" and any([legal_first_name, additional_name]):
+            parsed_name_feature: dict[str, str] = {}
+            if legal_first_name:
+                parsed_name_feature["NAME_FIRST"] = legal_first_name
+            if additional_name:
+                parsed_name_feature["NAME_LAST"] = additional_name
+            if parsed_name_feature:
+                features.append(parsed_name_feature)
+
+        if birth_or_foundation_date:
+            if record_type == "ORGANIZATION":
+                features.append({"REGISTRATION_DATE": birth_or_foundation_date})
+            else:
+                features.append({"DATE_OF_BIRTH": birth_or_foundation_date})
+
+        if prime_nationality_country_code:
+            features.append({"NATIONALITY": prime_nationality_country_code})
+
+        if any(
+            [
+                address_street_name,
+                address_residence_identifier,
+                address_postal_code,
+                address_postal_city_name,
+                domicile_country_code,
+            ]
+        ):
+            address_feature: dict[str, str] = {"ADDR_TYPE": "BUSINESS" if record_type == "ORGANIZATION" else "HOME"}
+            line1_parts = [part for part in [address_street_name, address_residence_identifier] if part]
+            if line1_parts:
+                address_feature["ADDR_LINE1"] = " ".join(line1_parts)
+            if address_postal_city_name:
+                address_feature["ADDR_CITY"] = address_postal_city_name
+            if address_postal_code:
+                address_feature["ADDR_POSTAL_CODE"] = address_postal_code
+            if domicile_country_code:
+                address_feature["ADDR_COUNTRY"] = domicile_country_code
+            features.append(address_feature)
+
+        if tax_id:
+            tax_feature: dict[str, str] = {
+                "TAX_ID_TYPE": self.tax_id_type,
+                "TAX_ID_NUMBER": tax_id,
+            }
+            if domicile_country_code:
+                tax_feature["TAX_ID_COUNTRY"] = domicile_country_code
+            features.append(tax_feature)
+
+        if lei:
+            features.append({"LEI_NUMBER": lei})
+
+        append_other_id_feature(features, lem_id, "LEM_ID", domicile_country_code)
+        append_other_id_feature(features, crn, "CRN", domicile_country_code)
+        append_other_id_feature(features, id_document_number, "ID_DOCUMENT_NUMBER", domicile_country_code)
+
+        # Internal source IDs are matching features, not payload.
+        append_other_id_feature(
+            features,
+            external_partner_key_dir_external_id,
+            self.partner_id_feature_type,
+            domicile_country_code,
+        )
+        append_other_id_feature(
+            features,
+            partner_key_dir_bus_rel_external_id,
+            self.business_relation_feature_type,
+            domicile_country_code,
+        )
+        if electronic_address:
+            if looks_like_email(electronic_address):
+                features.append({"EMAIL_ADDRESS": electronic_address})
+            elif looks_like_website(electronic_address):
+                features.append({"WEBSITE_ADDRESS": electronic_address})
+            else:
+                append_other_id_feature(features, electronic_address, "ELECTRONIC_ADDRESS", domicile_country_code)
+
+        output_record: dict[str, Any] = {
+            "DATA_SOURCE": self.data_source,
+            "RECORD_ID": record_id,
+            "FEATURES": features,
+        }
+
+        # Keep only source-system operational ID IPG in payload.
+        payload_fields = {
+            "SOURCE_IPG_ID": ipg_id,
+        }
+
+        for payload_key, payload_value in payload_fields.items():
+            if payload_value is not None:
+                output_record[payload_key] = payload_value
+
+        if self.include_unmapped_source_fields:
+            for source_key, source_value in record.items():
+                if source_key in resolved_source_keys:
+                    continue
+                if source_value is None:
+                    continue
+                output_record[safe_payload_key(source_key)] = (
+                    source_value
+                    if isinstance(source_value, (str, int, float, bool))
+                    else json.dumps(source_value, ensure_ascii=False)
+                )
+
+        return output_record, None
+
+    def iter_convert(
+        self,
+        records: Iterable[dict[str, Any]],
+        start_index: int | None = None,
+    ) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+        """Lazily convert a record stream, yielding (record_index, output_record, error).
+
+        In strict mode the first conversion error raises RecordConversionError instead of being yielded.
+        """
+        if start_index is not None:
+            self.next_record_index = start_index
+        for record in records:
+            record_index = self.next_record_index
+            self.next_record_index += 1
+            output_record, error = self.convert(record, record_index)
+            if error:
+                if self.strict:
+                    raise RecordConversionError(f"Record {record_index}: {error}")
+                self.records_skipped += 1
+            else:
+                self.records_converted += 1
+            yield record_index, output_record, error
+
+    def convert_batch(self, records: Iterable[dict[str, Any]], start_index: int | None = None) -> list[dict[str, Any]]:
+        """Convert a batch of records, returning only successfully converted Senzing records."""
+        return [output_record for _, output_record, _ in self.iter_convert(records, start_index) if output_record]
+
+
 def convert_record(
     record: dict[str, Any],
     field_map: dict[str, str],
     args: argparse.Namespace,
     record_index: int,
 ) -> tuple[dict[str, Any] | None, str | None]:
-    """Convert one source record to one Senzing record."""
-    resolved_source_keys: set[str] = set()
-
-    def read(canonical_field: str) -> str | None:
-        value, source_key = resolve_value(record, field_map, canonical_field, args.fuzzy_cutoff)
-        if source_key:
-            resolved_source_keys.add(source_key)
-        return value
-
-    external_partner_key_dir_external_id = read("external_partner_key_dir_external_id")
-    partner_key_dir_bus_rel_external_id = read("partner_key_dir_bus_rel_external_id")
-
-    # RECORD_ID is a simple monotonically increasing sequence per input file.
-    record_id = str(record_index)
-
-    partner_class_code = read("partner_class_code")
-    partner_name = read("partner_name")
-    legal_first_name = read("legal_first_name")
-    additional_name = read("additional_name")
-    birth_or_foundation_date = read("birth_or_foundation_date")
-    domicile_country_code = read("domicile_country_code")
-    prime_nationality_country_code = read("prime_nationality_country_code")
-    address_street_name = read("address_street_name")
-    address_residence_identifier = read("address_residence_identifier")
-    address_postal_code = read("address_postal_code")
-    address_postal_city_name = read("address_postal_city_name")
-    lei = read("lei")
-    lem_id = read("lem_id")
-    crn = read("crn")
-    tax_id = read("tax_id")
-    id_document_number = read("id_document_number")
-    electronic_address = read("electronic_address")
-    ipg_id = read("ipg_id")
-
-    normalized_class_code = (partner_class_code or "").upper()
-    record_type = CLASS_CODE_TO_RECORD_TYPE.get(normalized_class_code)
-
-    features: list[dict[str, str]] = []
-
-    if record_type:
-        features.append({"RECORD_TYPE": record_type})
-
-    name_feature = build_name(record_type, partner_name, legal_first_name, additional_name)
-    if name_feature:
-        features.append(name_feature)
-    if record_type != "ORGANIZATION" and any([legal_first_name, additional_name]):
-        parsed_name_feature: dict[str, str] = {}
-        if legal_first_name:
-            parsed_name_feature["NAME_FIRST"] = legal_first_name
-        if additional_name:
-            parsed_name_feature["NAME_LAST"] = additional_name
-        if parsed_name_feature:
-            features.append(parsed_name_feature)
-
-    if birth_or_foundation_date:
-        if record_type == "ORGANIZATION":
-            features.append({"REGISTRATION_DATE": birth_or_foundation_date})
-        else:
-            features.append({"DATE_OF_BIRTH": birth_or_foundation_date})
-
-    if prime_nationality_country_code:
-        features.append({"NATIONALITY": prime_nationality_country_code})
-
-    if any([address_street_name, address_residence_identifier, address_postal_code, address_postal_city_name, domicile_country_code]):
-        address_feature: dict[str, str] = {"ADDR_TYPE": "BUSINESS" if record_type == "ORGANIZATION" else "HOME"}
-        line1_parts = [part for part in [address_street_name, address_residence_identifier] if part]
-        if line1_parts:
-            address_feature["ADDR_LINE1"] = " ".join(line1_parts)
-        if address_postal_city_name:
-            address_feature["ADDR_CITY"] = address_postal_city_name
-        if address_postal_code:
-            address_feature["ADDR_POSTAL_CODE"] = address_postal_code
-        if domicile_country_code:
-            address_feature["ADDR_COUNTRY"] = domicile_country_code
-        features.append(address_feature)
-
-    if tax_id:
-        tax_feature: dict[str, str] = {
-            "TAX_ID_TYPE": args.tax_id_type,
-            "TAX_ID_NUMBER": tax_id,
-        }
-        if domicile_country_code:
-            tax_feature["TAX_ID_COUNTRY"] = domicile_country_code
-        features.append(tax_feature)
-
-    if lei:
-        features.append({"LEI_NUMBER": lei})
-
-    append_other_id_feature(features, lem_id, "LEM_ID", domicile_country_code)
-    append_other_id_feature(features, crn, "CRN", domicile_country_code)
-    append_other_id_feature(features, id_document_number, "ID_DOCUMENT_NUMBER", domicile_country_code)
-
-    # Internal source IDs are matching features, not payload.
-    append_other_id_feature(
-        features,
-        external_partner_key_dir_external_id,
-        args.partner_id_feature_type,
-        domicile_country_code,
-    )
-    append_other_id_feature(
-        features,
-        partner_key_dir_bus_rel_external_id,
-        args.business_relation_feature_type,
-        domicile_country_code,
-    )
-    if electronic_address:
-        if looks_like_email(electronic_address):
-            features.append({"EMAIL_ADDRESS": electronic_address})
-        elif looks_like_website(electronic_address):
-            features.append({"WEBSITE_ADDRESS": electronic_address})
-        else:
-            append_other_id_feature(features, electronic_address, "ELECTRONIC_ADDRESS", domicile_country_code)
-
-    output_record: dict[str, Any] = {
-        "DATA_SOURCE": args.data_source,
-        "RECORD_ID": record_id,
-        "FEATURES": features,
-    }
-
-    # Keep only source-system operational ID IPG in payload.
-    payload_fields = {
-        "SOURCE_IPG_ID": ipg_id,
-    }
-
-    for payload_key, payload_value in payload_fields.items():
-        if payload_value is not None:
-            output_record[payload_key] = payload_value
-
-    if args.include_unmapped_source_fields:
-        for source_key, source_value in record.items():
-            if source_key in resolved_source_keys:
-                continue
-            if source_value is None:
-                continue
-            output_record[safe_payload_key(source_key)] = (
-                source_value if isinstance(source_value, (str, int, float, bool)) else json.dumps(source_value, ensure_ascii=False)
-            )
+    """Convert one source record to one Senzing record.
 
-    return output_record, None
+    Kept for backward compatibility; prefer a reused `MapperEngine` for more than one record.
+    """
+    return MapperEngine.from_args(args, field_map).convert(record, record_index)
 
 
 def parse_input_records(input_path: Path, array_key: str | None) -> list[dict[str, Any]]:
     """Load and validate input records."""
-    with input_path.open("r", encoding="utf-8") as infile:
+    with open_file(input_path) as infile:
         raw_data = json.load(infile)
 
     if isinstance(raw_data, list):
@@ -540,19 +691,293 @@ def parse_input_records(input_path: Path, array_key: str | None) -> list[dict[st
     return validated
 
 
+def iter_json_array(infile: TextIO, buffer: str = "", chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array incrementally from a text stream.
+
+    `buffer` holds text already consumed from the stream (for example the opening bracket).
+    Missing, doubled, leading or trailing commas raise ValueError.
+    """
+    decoder = json.JSONDecoder()
+    position = 0
+    eof = False
+    opened = False
+    # What the array syntax allows next: "first" (value or "]"), "value", or "separator" ("," or "]").
+    expect = "first"
+
+    def refill() -> None:
+        nonlocal buffer, position, eof
+        chunk = infile.read(chunk_size)
+        buffer = buffer[position:] + chunk
+        position = 0
+        eof = not chunk
+
+    while True:
+        while position < len(buffer) and buffer[position].isspace():
+            position += 1
+        if position >= len(buffer):
+            if eof:
+                raise ValueError("Unexpected end of input inside JSON array.")
+            refill()
+            continue
+
+        char = buffer[position]
+        if not opened:
+            if char != "[":
+                raise ValueError("Input must be a JSON array.")
+            opened = True
+            position += 1
+            continue
+        if char == "]":
+            if expect == "value":
+                raise ValueError("Trailing comma before end of JSON array.")
+            position += 1
+            return
+        if expect == "separator":
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' between JSON array elements, found {char!r}.")
+            expect = "value"
+            position += 1
+            continue
+        if char == ",":
+            raise ValueError("Missing JSON array element before ','.")
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            refill()
+            continue
+        if end >= len(buffer) and not eof:
+            # A value ending exactly at the buffer edge may be truncated (e.g. a number).
+            refill()
+            continue
+        position = end
+        expect = "separator"
+        yield item
+
+
+def iter_input_records(infile: TextIO, array_key: str | None) -> Iterator[dict[str, Any]]:
+    """Stream input records from a JSON array, JSONL, or an object holding an array at array_key."""
+    first_char = infile.read(1)
+    while first_char and first_char.isspace():
+        first_char = infile.read(1)
+    if not first_char:
+        return
+
+    if first_char == "[":
+        items: Iterator[Any] = iter_json_array(infile, buffer=first_char)
+    elif first_char == "{" and array_key:
+        raw_data = json.loads(first_char + infile.read())
+        if not isinstance(raw_data, dict) or not isinstance(raw_data.get(array_key), list):
+            raise ValueError(
+                "Input must be a JSON array, or a JSON object containing an array at --array-key."
+            )
+        items = iter(raw_data[array_key])
+    elif first_char == "{":
+        first_line = first_char + infile.readline()
+        try:
+            first_item = json.loads(first_line)
+        except json.JSONDecodeError:
+            # Not one object per line: a single (pretty-printed) JSON object.
+            items = iter([json.loads(first_line + infile.read())])
+        else:
+            items = itertools.chain([first_item], iter_jsonl_objects(infile, first_line_no=2))
+    else:
+        raise ValueError(
+            "Input must be a JSON array, JSONL objects, or a JSON object containing an array at --array-key."
+        )
+
+    for index, item in enumerate(items, start=1):
+        if not isinstance(item, dict):
+            raise ValueError(f"Record {index} is not a JSON object.")
+        yield item
+
+
+def iter_jsonl_objects(lines: Iterable[str], first_line_no: int = 1) -> Iterator[Any]:
+    """Yield parsed values from JSONL lines, skipping blank lines."""
+    for line_no, line in enumerate(lines, start=first_line_no):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            yield json.loads(text)
+        except json.JSONDecodeError as err:
+            raise ValueError(f"Invalid JSON on line {line_no}: {err}") from err
+
+
+class BatchedJsonlWriter:
+    """Write JSONL records in large batches from a background thread.
+
+    Records are encoded on the caller's thread and joined into batches of about
+    `batch_bytes` characters. Full batches go through a bounded queue to a writer
+    thread that UTF-8 encodes and writes them, so conversion, encoding and (possibly
+    compressed) disk I/O overlap. With `queue_depth` batches in flight the caller
+    blocks instead of buffering without limit.
+
+    flush_mode: "close" flushes once at the end, "batch" after every batch.
+    fsync_mode: "none", "close" (once at the end) or "batch" (after every batch).
+    """
+
+    FLUSH_MODES = ("close", "batch")
+    FSYNC_MODES = ("none", "close", "batch")
+
+    def __init__(
+        self,
+        outfile: TextIO,
+        *,
+        batch_bytes: int = 1 << 20,
+        queue_depth: int = 4,
+        compact: bool = False,
+        flush_mode: str = "close",
+        fsync_mode: str = "none",
+    ) -> None:
+        if batch_bytes < 1 or queue_depth < 1:
+            raise ValueError("batch_bytes and queue_depth must be positive")
+        if flush_mode not in self.FLUSH_MODES:
+            raise ValueError(f"flush_mode must be one of {self.FLUSH_MODES}")
+        if fsync_mode not in self.FSYNC_MODES:
+            raise ValueError(f"fsync_mode must be one of {self.FSYNC_MODES}")
+        self.outfile = outfile
+        self.batch_bytes = batch_bytes
+        self.flush_mode = flush_mode
+        self.fsync_mode = fsync_mode
+        separators = (",", ":") if compact else (", ", ": ")
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=separators).encode
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=queue_depth)
+        self._error: BaseException | None = None
+        self._closed = False
+        self.records_written = 0
+        self.bytes_written = 0
+        self.batches_written = 0
+        self.write_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self._started = time.perf_counter()
+        self._elapsed_seconds = 0.0
+        self._thread = threading.Thread(target=self._drain, name="jsonl-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BatchedJsonlWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.close()
+
+    def write_record(self, record: dict[str, Any]) -> None:
+        """Encode one record and queue it for writing."""
+        line = self._encode(record) + "\n"
+        self._pending.append(line)
+        self._pending_chars += len(line)
+        self.records_written += 1
+        if self._pending_chars >= self.batch_bytes:
+            self._submit()
+
+    def _submit(self) -> None:
+        """Hand the pending batch to the writer thread, blocking while the queue is full."""
+        if self._error:
+            raise self._error
+        if not self._pending:
+            return
+        chunk = "".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        wait_started = time.perf_counter()
+        while True:
+            try:
+                self._queue.put(chunk, timeout=0.5)
+                break
+            except queue.Full:
+                if self._error:
+                    raise self._error from None
+        self.blocked_seconds += time.perf_counter() - wait_started
+
+    def _sync(self, final: bool) -> None:
+        """Apply the configured flush and fsync behavior."""
+        if final or self.flush_mode == "batch" or self.fsync_mode == "batch":
+            self.outfile.flush()
+        if self.fsync_mode == "batch" or (final and self.fsync_mode == "close"):
+            try:
+                os.fsync(self.outfile.fileno())
+            except OSError:
+                # Pipes and some stream wrappers cannot be synced.
+                pass
+
+    def _drain(self) -> None:
+        """Writer thread: write queued batches until the end sentinel arrives."""
+        binary = getattr(self.outfile, "buffer", None)
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error:
+                continue
+            try:
+                write_started = time.perf_counter()
+                data = chunk.encode("utf-8")
+                if binary is not None:
+                    binary.write(data)
+                else:
+                    self.outfile.write(chunk)
+                self.bytes_written += len(data)
+                self.batches_written += 1
+                self._sync(final=False)
+                self.write_seconds += time.perf_counter() - write_started
+            except BaseException as err:  # pylint: disable=broad-exception-caught
+                self._error = err
+
+    def close(self) -> None:
+        """Write remaining records, stop the writer thread and apply final flush/fsync."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if not self._error:
+                self._submit()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+        if self._error:
+            raise self._error
+        self._sync(final=True)
+        self._elapsed_seconds = time.perf_counter() - self._started
+
+    def stats(self) -> dict[str, Any]:
+        """Return writer throughput counters for run summaries."""
+        elapsed = self._elapsed_seconds or (time.perf_counter() - self._started)
+        return {
+            "records_written": self.records_written,
+            "bytes_written": self.bytes_written,
+            "batches_written": self.batches_written,
+            "batch_bytes": self.batch_bytes,
+            "flush_mode": self.flush_mode,
+            "fsync_mode": self.fsync_mode,
+            "elapsed_seconds": round(elapsed, 3),
+            "write_seconds": round(self.write_seconds, 3),
+            "producer_blocked_seconds": round(self.blocked_seconds, 3),
+            "bytes_per_second": round(self.bytes_written / elapsed, 1) if elapsed > 0 else None,
+        }
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     """Create CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Map partner JSON records into Senzing-ready JSONL."
     )
-    parser.add_argument("input_json", help="Input JSON file path")
+    parser.add_argument(
+        "input_json",
+        help="Input JSON array or JSONL file path (optionally .gz/.bz2/.xz/.zst compressed), or - for stdin",
+    )
     parser.add_argument(
         "output_jsonl",
         nargs="?",
         default=None,
         help=(
             "Optional output JSONL file path. If omitted, a timestamped run "
-            "directory is created automatically under --run-output-root."
+            "directory is created automatically under --run-output-root. "
+            "A .gz/.bz2/.xz/.zst extension compresses the output; - writes JSONL to stdout "
+            "(progress messages then go to stderr)."
         ),
     )
     parser.add_argument(
@@ -623,6 +1048,44 @@ def build_arg_parser() -> argparse.ArgumentParser:
             "(used only when output_jsonl is omitted). Default: mapper_runs"
         ),
     )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "bz2", "xz", "zstd"],
+        default=None,
+        help=(
+            "Compress the auto-generated output.jsonl in the run folder "
+            "(used only when output_jsonl is omitted)"
+        ),
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write output JSONL with compact separators (no spaces after , and :)",
+    )
+    parser.add_argument(
+        "--write-batch-bytes",
+        type=int,
+        default=1 << 20,
+        help="Approximate size of each output write batch in characters (default: 1048576)",
+    )
+    parser.add_argument(
+        "--write-queue-depth",
+        type=int,
+        default=4,
+        help="Max output batches queued for the background writer thread (default: 4)",
+    )
+    parser.add_argument(
+        "--flush-mode",
+        choices=BatchedJsonlWriter.FLUSH_MODES,
+        default="close",
+        help="Flush output after every batch or only at close (default: close)",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=BatchedJsonlWriter.FSYNC_MODES,
+        default="none",
+        help="fsync output never, once at close, or after every batch (default: none)",
+    )
     parser.add_argument(
         "--run-name-prefix",
         default="partner_mapping",
@@ -639,9 +1102,13 @@ def main() -> int:
     parser = build_arg_parser()
     args = parser.parse_args()
 
+    reading_stdin = args.input_json == STDIO_PATH
+    writing_stdout = args.output_jsonl == STDIO_PATH
+    # Keep stdout clean for records when streaming into a pipe.
+    info = sys.stderr if writing_stdout else sys.stdout
     input_path = Path(args.input_json)
 
-    if not input_path.exists():
+    if not reading_stdin and not input_path.exists():
         print(f"ERROR: Input file not found: {input_path}", file=sys.stderr)
         return 2
 
@@ -649,62 +1116,113 @@ def main() -> int:
         print("ERROR: --fuzzy-cutoff must be between 0 and 1", file=sys.stderr)
         return 2
 
-    try:
-        records = parse_input_records(input_path, args.array_key)
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        print(f"ERROR: Unable to parse input JSON: {err}", file=sys.stderr)
-        return 2
-
-    if not records:
-        print("ERROR: Input JSON contains no records.", file=sys.stderr)
+    if args.write_batch_bytes < 1 or args.write_queue_depth < 1:
+        print("ERROR: --write-batch-bytes and --write-queue-depth must be positive", file=sys.stderr)
         return 2
 
-    sample_records = records[: args.scan_records]
-    field_map = infer_field_map(sample_records, args.fuzzy_cutoff)
-
-    print("Inferred field map:")
-    for canonical in sorted(CANONICAL_FIELDS.keys()):
-        source_key = field_map.get(canonical, "<NOT_FOUND>")
-        print(f"  - {canonical}: {source_key}")
-
-    unresolved = [field for field in CANONICAL_FIELDS if field not in field_map]
-    if unresolved:
-        print("\nUnresolved canonical fields (no confident source match):")
-        for field in unresolved:
-            print(f"  - {field}")
-
-    # Output strategy:
-    # - If output_jsonl is provided: use it directly (backward compatible mode).
-    # - If output_jsonl is omitted: create a timestamped run directory automatically.
-    run_directory: Path | None = None
-    if args.output_jsonl:
-        output_path = Path(args.output_jsonl)
+    if reading_stdin:
+        sys.stdin.reconfigure(encoding="utf-8")
+        input_context: Any = contextlib.nullcontext(sys.stdin)
     else:
-        timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_root = Path(args.run_output_root)
-        run_directory = run_root / f"{args.run_name_prefix}_{timestamp}"
-        run_directory.mkdir(parents=True, exist_ok=True)
-        output_path = run_directory / "output.jsonl"
-        if not args.write_field_map:
-            args.write_field_map = str(run_directory / "field_map.json")
-
-    converted = 0
-    skipped = 0
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as outfile:
-        for index, record in enumerate(records, start=1):
-            output_record, error = convert_record(record, field_map, args, index)
-            if error:
-                message = f"Record {index}: {error}"
-                if args.strict:
-                    print(f"ERROR: {message}", file=sys.stderr)
-                    return 1
-                print(f"WARN: {message}", file=sys.stderr)
-                skipped += 1
-                continue
-            outfile.write(json.dumps(output_record, ensure_ascii=False) + "\n")
-            converted += 1
+        try:
+            input_context = open_file(input_path)
+        except (OSError, ValueError) as err:
+            print(f"ERROR: Unable to open input: {err}", file=sys.stderr)
+            return 2
+
+    with input_context as infile:
+        try:
+            record_stream = iter_input_records(infile, args.array_key)
+            # Field-map inference only needs the head of the stream; keep it buffered for conversion.
+            head_records = list(itertools.islice(record_stream, max(args.scan_records, 1)))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"ERROR: Unable to parse input JSON: {err}", file=sys.stderr)
+            return 2
+
+        if not head_records:
+            print("ERROR: Input JSON contains no records.", file=sys.stderr)
+            return 2
+
+        sample_records = head_records[: args.scan_records]
+        field_map = infer_field_map(sample_records, args.fuzzy_cutoff)
+        engine = MapperEngine.from_args(args, field_map)
+
+        print("Inferred field map:", file=info)
+        for canonical in sorted(CANONICAL_FIELDS.keys()):
+            source_key = field_map.get(canonical, "<NOT_FOUND>")
+            print(f"  - {canonical}: {source_key}", file=info)
+
+        unresolved = engine.unresolved_fields
+        if unresolved:
+            print("\nUnresolved canonical fields (no confident source match):", file=info)
+            for field in unresolved:
+                print(f"  - {field}", file=info)
+
+        # Output strategy:
+        # - If output_jsonl is "-": stream JSONL to stdout; without --write-field-map a
+        #   timestamped run directory still keeps field_map.json and run_info.json.
+        # - If output_jsonl is provided: use it directly (backward compatible mode).
+        # - If output_jsonl is omitted: create a timestamped run directory automatically.
+        run_directory: Path | None = None
+        if not args.output_jsonl or (writing_stdout and not args.write_field_map):
+            timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+            run_root = Path(args.run_output_root)
+            run_directory = run_root / f"{args.run_name_prefix}_{timestamp}"
+            run_directory.mkdir(parents=True, exist_ok=True)
+            if not args.write_field_map:
+                args.write_field_map = str(run_directory / "field_map.json")
+        if writing_stdout:
+            output_path = Path(STDIO_PATH)
+        elif args.output_jsonl:
+            output_path = Path(args.output_jsonl)
+        else:
+            output_suffix = {codec: suffix for suffix, codec in COMPRESSION_SUFFIXES.items()}.get(args.compress, "")
+            output_path = run_directory / f"output.jsonl{output_suffix}"
+
+        records_input = 0
+
+        if writing_stdout:
+            sys.stdout.reconfigure(encoding="utf-8")
+            output_context: Any = contextlib.nullcontext(sys.stdout)
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_context = open_file(output_path, "w")
+
+        writer: BatchedJsonlWriter | None = None
+        try:
+            with output_context as outfile:
+                writer = BatchedJsonlWriter(
+                    outfile,
+                    batch_bytes=args.write_batch_bytes,
+                    queue_depth=args.write_queue_depth,
+                    compact=args.compact_json,
+                    flush_mode=args.flush_mode,
+                    fsync_mode=args.fsync,
+                )
+                with writer:
+                    records = itertools.chain(head_records, record_stream)
+                    for index, output_record, error in engine.iter_convert(records):
+                        records_input = index
+                        if error:
+                            print(f"WARN: Record {index}: {error}", file=sys.stderr)
+                            continue
+                        writer.write_record(output_record)
+        except BrokenPipeError:
+            # Downstream consumer closed the pipe; silence the flush at interpreter exit.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            print("ERROR: Output pipe closed before conversion finished.", file=sys.stderr)
+            return 1
+        except RecordConversionError as err:
+            print(f"ERROR: {err}", file=sys.stderr)
+            return 1
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"ERROR: Unable to parse input JSON: {err}", file=sys.stderr)
+            return 2
+
+    converted = engine.records_converted
+    skipped = engine.records_skipped
+    writer_stats = writer.stats()
 
     if args.write_field_map:
         mapping_output = {
@@ -720,27 +1238,33 @@ def main() -> int:
         run_info = {
             "run_directory": str(run_directory),
             "input_file": str(input_path),
-            "output_jsonl": str(output_path),
+            "output_jsonl": "<stdout>" if writing_stdout else str(output_path),
             "field_map_file": args.write_field_map,
             "data_source": args.data_source,
-            "records_input": len(records),
+            "records_input": records_input,
             "records_converted": converted,
             "records_skipped": skipped,
+            "output_writer": writer_stats,
             "unresolved_canonical_fields": unresolved,
             "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
         }
         run_info_path = run_directory / "run_info.json"
         run_info_path.write_text(json.dumps(run_info, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
-    print("\nConversion complete.")
-    print(f"  - Input records: {len(records)}")
-    print(f"  - Converted: {converted}")
-    print(f"  - Skipped: {skipped}")
-    print(f"  - Output JSONL: {output_path}")
+    print("\nConversion complete.", file=info)
+    print(f"  - Input records: {records_input}", file=info)
+    print(f"  - Converted: {converted}", file=info)
+    print(f"  - Skipped: {skipped}", file=info)
+    print(f"  - Output JSONL: {'<stdout>' if writing_stdout else output_path}", file=info)
+    print(
+        f"  - Output bytes: {writer_stats['bytes_written']} "
+        f"({(writer_stats['bytes_per_second'] or 0) / 1e6:.1f} MB/s, {writer_stats['batches_written']} batches)",
+        file=info,
+    )
     if args.write_field_map:
-        print(f"  - Field map: {args.write_field_map}")
+        print(f"  - Field map: {args.write_field_map}", file=info)
     if run_directory:
-        print(f"  - Run directory: {run_directory}")
+        print(f"  - Run directory: {run_directory}", file=info)
 
     return 0 if converted > 0 else 1
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Sample CPU, memory, I/O and thread usage of a child process tree from /proc.
+
+Shared by the E2E runner and the partner mapping pipeline to report per-step resources.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, TextIO
+
+
+class ProcessTreeSampler:
+    """Sample CPU, RSS, I/O and threads of a child process tree from /proc in a background thread.
+
+    Every interval the tree below root_pid is walked (via /proc/<pid>/task/*/children)
+    and per-process counters are read from stat and io. CPU time and I/O bytes are
+    cumulative per pid and kept after a process exits, so short-lived children still
+    count; the last interval before the root exits is not seen. Without /proc the
+    sampler does nothing and summary() returns None.
+    """
+
+    def __init__(self, interval_seconds: float, timeseries_path: Path | None = None) -> None:
+        self.interval_seconds = interval_seconds
+        self.timeseries_path = timeseries_path
+        self.root_pid: int | None = None
+        self.clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self.counters: dict[int, tuple[int, int, int]] = {}
+        self.samples: list[dict[str, Any]] = []
+        self.started = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._timeseries: TextIO | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether sampling is on (positive interval) and /proc is available."""
+        return self.interval_seconds > 0 and Path("/proc/self/stat").exists()
+
+    def start(self, root_pid: int) -> None:
+        """Start sampling the tree below root_pid in a daemon thread; no-op when disabled."""
+        if not self.enabled:
+            return
+        self.root_pid = root_pid
+        self.started = time.time()
+        if self.timeseries_path is not None:
+            self._timeseries = self.timeseries_path.open("w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name=f"resources-{root_pid}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and close the timeseries file; safe to call when not started."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._timeseries is not None:
+            self._timeseries.close()
+            self._timeseries = None
+
+    def _tree_pids(self) -> list[int]:
+        """Pids of root_pid and all of its live descendants."""
+        pids: list[int] = []
+        pending = [self.root_pid]
+        while pending:
+            pid = pending.pop()
+            pids.append(pid)
+            for children_file in Path(f"/proc/{pid}/task").glob("*/children"):
+                try:
+                    pending.extend(int(child) for child in children_file.read_text().split())
+                except (OSError, ValueError):
+                    pass
+        return pids
+
+    def _read_process(self, pid: int) -> tuple[int, int, int, int, int] | None:
+        """Return (cpu ticks, rss bytes, threads, read bytes, write bytes) of one process."""
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+        except OSError:
+            return None
+        # The command name may contain spaces; fields after it are fixed.
+        fields = stat[stat.rfind(")") + 2 :].split()
+        ticks = int(fields[11]) + int(fields[12])
+        threads = int(fields[17])
+        rss = int(fields[21]) * self.page_size
+        read_bytes = write_bytes = 0
+        try:
+            for line in Path(f"/proc/{pid}/io").read_text().splitlines():
+                name, _, value = line.partition(":")
+                if name == "read_bytes":
+                    read_bytes = int(value)
+                elif name == "write_bytes":
+                    write_bytes = int(value)
+        except (OSError, ValueError):
+            pass
+        return ticks, rss, threads, read_bytes, write_bytes
+
+    def _sample(self) -> None:
+        """Take one sample of the tree and append it (and to the timeseries file, if any)."""
+        now = time.time() - self.started
+        previous_ticks = sum(item[0] for item in self.counters.values())
+        rss_total = threads_total = processes = 0
+        for pid in self._tree_pids():
+            values = self._read_process(pid)
+            if values is None:
+                continue
+            ticks, rss, threads, read_bytes, write_bytes = values
+            last = self.counters.get(pid, (0, 0, 0))
+            self.counters[pid] = (max(ticks, last[0]), max(read_bytes, last[1]), max(write_bytes, last[2]))
+            rss_total += rss
+            threads_total += threads
+            processes += 1
+        if processes == 0:
+            return
+        previous_t = self.samples[-1]["t"] if self.samples else 0.0
+        cpu_ticks = sum(item[0] for item in self.counters.values())
+        elapsed = now - previous_t
+        sample = {
+            "t": round(now, 3),
+            "cpu_percent": (
+                round((cpu_ticks - previous_ticks) / self.clock_ticks / elapsed * 100, 1) if elapsed > 0 else 0.0
+            ),
+            "rss_bytes": rss_total,
+            "threads": threads_total,
+            "processes": processes,
+            "read_bytes": sum(item[1] for item in self.counters.values()),
+            "write_bytes": sum(item[2] for item in self.counters.values()),
+        }
+        self.samples.append(sample)
+        if self._timeseries is not None:
+            self._timeseries.write(json.dumps(sample) + "\n")
+            self._timeseries.flush()
+
+    def _run(self) -> None:
+        """Thread body: sample every interval until stop() is called."""
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def summary(self) -> dict[str, Any] | None:
+        """Peak and mean of each gauge plus cumulative totals, or None when nothing was sampled."""
+        if not self.samples:
+            return None
+
+        def gauge(name: str) -> dict[str, float]:
+            values = [sample[name] for sample in self.samples]
+            return {"peak": max(values), "mean": round(sum(values) / len(values), 1)}
+
+        return {
+            "interval_seconds": self.interval_seconds,
+            "samples": len(self.samples),
+            "cpu_percent": gauge("cpu_percent"),
+            "rss_bytes": gauge("rss_bytes"),
+            "threads": gauge("threads"),
+            "cpu_seconds": round(sum(item[0] for item in self.counters.values()) / self.clock_ticks, 2),
+            "read_bytes": self.samples[-1]["read_bytes"],
+            "write_bytes": self.samples[-1]["write_bytes"],
+            "timeseries_file": str(self.timeseries_path) if self.timeseries_path is not None else None,
+        }
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""Benchmark the partner mapping pipeline and the comparison stage on synthetic data.
+
+For each dataset size this script:
+1) generates (or reuses) a fixed-seed sample with generate_realistic_partner_dataset.py,
+2) runs run_partner_mapping_pipeline.py and times convert, lint, analyze and stakeholder_report,
+3) builds a stub sz_export CSV from the mapped JSONL (one entity per SOURCE_IPG_ID) and
+   times the E2E comparison stage on it (ExportIndex + make_comparison_outputs),
+4) writes duration, records/sec and peak RSS per stage to a JSON results file and,
+   with --baseline, fails when a stage regressed beyond --regression-threshold.
+
+Standard library only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+DEFAULT_SIZES = "10000,100000,1000000"
+DEFAULT_SEED = 20260226
+PIPELINE_STAGES = ("convert", "lint", "analyze", "stakeholder_report")
+STUB_MATCH_KEY = "+NAME+ADDRESS"
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI parser."""
+    parser = argparse.ArgumentParser(description="Benchmark mapping, lint, analysis and comparison stages.")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated dataset sizes in records (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Generator seed (default: {DEFAULT_SEED})")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Runs per size; the median duration is reported (default: 1)"
+    )
+    parser.add_argument(
+        "--bench-root", default="benchmark_runs", help="Datasets, pipeline runs and results (default: benchmark_runs)"
+    )
+    parser.add_argument(
+        "--results", default=None, help="Results JSON path (default: <bench-root>/results_<timestamp>.json)"
+    )
+    parser.add_argument("--baseline", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's results to --baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative loss in records/sec or growth in peak RSS per stage (default: 0.15)",
+    )
+    parser.add_argument(
+        "--noise-floor-seconds",
+        type=float,
+        default=1.0,
+        help="Do not compare throughput (or sampled peak RSS) of stages faster than this in both runs (default: 1.0)",
+    )
+    parser.add_argument(
+        "--resource-sample-seconds",
+        type=float,
+        default=0.1,
+        help="RSS sampling interval passed to the pipeline (default: 0.1)",
+    )
+    parser.add_argument("--skip-comparison", action="store_true", help="Do not benchmark the comparison stage")
+    parser.add_argument("--python-bin", default=sys.executable, help="Python executable for child scripts")
+    parser.add_argument(
+        "--comparison-child", nargs=3, metavar=("EXPORT_CSV", "INPUT_JSONL", "RUN_DIR"), help=argparse.SUPPRESS
+    )
+    return parser.parse_args()
+
+
+def parse_sizes(text: str) -> list[int]:
+    """Parse --sizes into positive ints, in the given order without duplicates."""
+    sizes: list[int] = []
+    for part in text.split(","):
+        value = int(part.strip())
+        if value <= 0:
+            raise ValueError(f"size must be > 0: {value}")
+        if value not in sizes:
+            sizes.append(value)
+    if not sizes:
+        raise ValueError("no sizes given")
+    return sizes
+
+
+def run_measured(command: list[str], log_file: Path) -> dict[str, Any]:
+    """Run one command with output to log_file; report exit code, duration and peak RSS (wait4)."""
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with log_file.open("w", encoding="utf-8") as log:
+        log.write(f"COMMAND: {' '.join(command)}\n\n")
+        log.flush()
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        _pid, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "exit_code": process.returncode,
+        "duration_seconds": round(time.perf_counter() - start, 3),
+        # ru_maxrss is KiB on Linux.
+        "peak_rss_bytes": usage.ru_maxrss * 1024,
+        "peak_rss_source": "wait4",
+        "log_file": str(log_file),
+    }
+
+
+def ensure_dataset(
+    args: argparse.Namespace, bench_root: Path, records: int, tools_dir: Path
+) -> tuple[Path, dict[str, Any] | None]:
+    """Generate the fixed-seed base input for one size, or reuse it from an earlier benchmark."""
+    dataset_dir = bench_root / "datasets" / f"n{records}_seed{args.seed}"
+    existing = sorted(dataset_dir.glob("partner_input_realistic_*.json"))
+    if existing:
+        return existing[-1], None
+
+    command = [
+        args.python_bin,
+        str(tools_dir / "generate_realistic_partner_dataset.py"),
+        "--records",
+        str(records),
+        "--seed",
+        str(args.seed),
+        "--sample-dir",
+        str(dataset_dir),
+        "--output-dir",
+        str(dataset_dir),
+        "--skip-mapper",
+    ]
+    result = run_measured(command, bench_root / "logs" / f"generate_{records}.log")
+    if result["exit_code"] != 0:
+        raise RuntimeError(f"dataset generation failed for {records} records, see {result['log_file']}")
+    generated = sorted(dataset_dir.glob("partner_input_realistic_*.json"))
+    if not generated:
+        raise RuntimeError(f"generator wrote no dataset to {dataset_dir}")
+    return generated[-1], result
+
+
+def run_pipeline(
+    args: argparse.Namespace,
+    bench_root: Path,
+    records: int,
+    attempt: int,
+    input_json: Path,
+    tools_dir: Path,
+) -> dict[str, Any]:
+    """Run the mapping pipeline once and return its pipeline_summary.json."""
+    output_root = bench_root / "runs" / f"n{records}" / f"attempt_{attempt:02d}"
+    command = [
+        args.python_bin,
+        str(tools_dir / "run_partner_mapping_pipeline.py"),
+        str(input_json),
+        "--output-root",
+        str(output_root),
+        "--run-name-prefix",
+        "pipeline",
+        "--resource-sample-seconds",
+        str(args.resource_sample_seconds),
+    ]
+    result = run_measured(command, bench_root / "logs" / f"pipeline_{records}_{attempt:02d}.log")
+    summaries = sorted(output_root.glob("pipeline_*/pipeline_summary.json"))
+    if not summaries:
+        raise RuntimeError(f"pipeline wrote no summary for {records} records, see {result['log_file']}")
+    summary = json.loads(summaries[-1].read_text(encoding="utf-8"))
+    if not summary.get("overall_ok"):
+        failed = [step["step"] for step in summary.get("steps", []) if not step.get("ok")]
+        raise RuntimeError(f"pipeline failed for {records} records at {failed}, see {summaries[-1]}")
+    return summary
+
+
+def iter_jsonl_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream the records of a JSONL file, skipping blank lines."""
+    with path.open("r", encoding="utf-8") as infile:
+        for line in infile:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_stub_export(records: Iterable[dict[str, Any]], export_csv: Path, number_record_ids: bool = False) -> int:
+    """Write an sz_export-style CSV that resolves records by SOURCE_IPG_ID.
+
+    Records sharing a SOURCE_IPG_ID form one entity (first record MATCH_LEVEL 0,
+    the rest 1 with a fixed match key); unlabeled records are singletons. With
+    number_record_ids a running number is appended to every RECORD_ID, for inputs
+    that repeat IDs. Returns the number of rows written. Shared with run_microbenchmarks.py.
+    """
+    entities: dict[str, list[tuple[str, str]]] = {}
+    singletons = 0
+    for record in records:
+        key = str(record.get("SOURCE_IPG_ID") or "").strip()
+        if not key:
+            singletons += 1
+            key = f"\0{singletons}"
+        entities.setdefault(key, []).append((str(record.get("DATA_SOURCE", "")), str(record.get("RECORD_ID", ""))))
+
+    rows = 0
+    with export_csv.open("w", encoding="utf-8", newline="") as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(
+            ["RESOLVED_ENTITY_ID", "RELATED_ENTITY_ID", "MATCH_LEVEL", "MATCH_KEY", "DATA_SOURCE", "RECORD_ID"]
+        )
+        for entity_id, members in enumerate(entities.values(), start=1):
+            for position, (data_source, record_id) in enumerate(members):
+                rows += 1
+                writer.writerow(
+                    [
+                        entity_id,
+                        0,
+                        0 if position == 0 else 1,
+                        "" if position == 0 else STUB_MATCH_KEY,
+                        data_source,
+                        f"{record_id}-{rows}" if number_record_ids else record_id,
+                    ]
+                )
+    return rows
+
+
+def comparison_child(export_csv: Path, input_jsonl: Path, run_dir: Path) -> int:
+    """Run the E2E comparison stage on a stub export (child process of the benchmark)."""
+    e2e_script = Path(__file__).resolve().parents[1] / "all_in_one" / "run_senzing_end_to_end.py"
+    spec = importlib.util.spec_from_file_location("run_senzing_end_to_end", e2e_script)
+    if spec is None or spec.loader is None:
+        print(f"ERROR: cannot load {e2e_script}", file=sys.stderr)
+        return 2
+    e2e = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(e2e)
+
+    start = time.perf_counter()
+    export_index = e2e.ExportIndex.from_csv(export_csv)
+    artifacts = e2e.make_comparison_outputs(
+        run_dir=run_dir,
+        input_jsonl_path=input_jsonl,
+        export_index=export_index,
+        matched_records_count=export_index.matched_records_count,
+        matched_pairs=export_index.iter_matched_pair_items(),
+        why_entity_results=[],
+        why_records_results=[],
+        records_input_count=len(export_index.record_ids),
+    )
+    print(
+        json.dumps(
+            {
+                "duration_seconds": round(time.perf_counter() - start, 3),
+                "comparison_dir": artifacts.get("comparison_dir"),
+            }
+        )
+    )
+    return 0
+
+
+def run_comparison(
+    args: argparse.Namespace, bench_root: Path, records: int, attempt: int, mapped_jsonl: Path
+) -> dict[str, Any]:
+    """Benchmark the comparison stage in a child process so its peak RSS is measured alone."""
+    run_dir = bench_root / "runs" / f"n{records}" / f"attempt_{attempt:02d}" / "comparison_stage"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    export_csv = run_dir / "entity_export_stub.csv"
+    write_stub_export(iter_jsonl_records(mapped_jsonl), export_csv)
+    command = [
+        args.python_bin,
+        str(Path(__file__).resolve()),
+        "--comparison-child",
+        str(export_csv),
+        str(mapped_jsonl),
+        str(run_dir),
+    ]
+    result = run_measured(command, bench_root / "logs" / f"comparison_{records}_{attempt:02d}.log")
+    if result["exit_code"] != 0:
+        raise RuntimeError(f"comparison stage failed for {records} records, see {result['log_file']}")
+    # The child reports the time spent in the stage itself, without interpreter start-up.
+    last_line = Path(result["log_file"]).read_text(encoding="utf-8").strip().splitlines()[-1]
+    result["duration_seconds"] = json.loads(last_line)["duration_seconds"]
+    return result
+
+
+def stage_result(records: int, attempts: list[dict[str, Any]]) -> dict[str, Any]:
+    """Median duration, records/sec and max peak RSS over the attempts of one stage."""
+    durations = [float(item["duration_seconds"]) for item in attempts]
+    duration = round(statistics.median(durations), 3)
+    rss_values = [item["peak_rss_bytes"] for item in attempts if item.get("peak_rss_bytes") is not None]
+    return {
+        "duration_seconds": duration,
+        "durations_seconds": durations,
+        "records_per_second": round(records / duration, 1) if duration > 0 else None,
+        "peak_rss_bytes": max(rss_values) if rss_values else None,
+        "peak_rss_source": attempts[0].get("peak_rss_source"),
+    }
+
+
+def benchmark_size(args: argparse.Namespace, bench_root: Path, records: int, tools_dir: Path) -> dict[str, Any]:
+    """Run all stages for one dataset size."""
+    input_json, generate = ensure_dataset(args, bench_root, records, tools_dir)
+    stages: dict[str, Any] = {}
+    if generate is not None:
+        stages["generate"] = stage_result(records, [generate])
+
+    attempts: dict[str, list[dict[str, Any]]] = {name: [] for name in (*PIPELINE_STAGES, "comparison")}
+    for attempt in range(1, args.repeat + 1):
+        print(f"[{records}] pipeline run {attempt}/{args.repeat}")
+        summary = run_pipeline(args, bench_root, records, attempt, input_json, tools_dir)
+        for step in summary.get("steps", []):
+            if step.get("step") in attempts:
+                resources = step.get("resources") or {}
+                attempts[step["step"]].append(
+                    {
+                        "duration_seconds": step.get("duration_seconds"),
+                        "peak_rss_bytes": (resources.get("rss_bytes") or {}).get("peak"),
+                        "peak_rss_source": "sampled",
+                    }
+                )
+        if not args.skip_comparison:
+            print(f"[{records}] comparison stage {attempt}/{args.repeat}")
+            mapped_jsonl = Path(summary["artifacts"]["output_jsonl"])
+            attempts["comparison"].append(run_comparison(args, bench_root, records, attempt, mapped_jsonl))
+
+    for name, items in attempts.items():
+        if items:
+            stages[name] = stage_result(records, items)
+    return {"records": records, "input_json": str(input_json), "stages": stages}
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    noise_floor_seconds: float,
+) -> list[dict[str, Any]]:
+    """List stage metrics of sizes present in both runs, flagging regressions beyond threshold."""
+    comparisons: list[dict[str, Any]] = []
+    for size, current in results.get("sizes", {}).items():
+        previous = baseline.get("sizes", {}).get(size)
+        if not previous:
+            continue
+        for stage, now in current.get("stages", {}).items():
+            before = previous.get("stages", {}).get(stage)
+            if not before:
+                continue
+            checks = []
+            long_enough = max(now["duration_seconds"], before["duration_seconds"]) >= noise_floor_seconds
+            if now.get("records_per_second") and before.get("records_per_second") and long_enough:
+                change = now["records_per_second"] / before["records_per_second"] - 1.0
+                checks.append(
+                    (
+                        "records_per_second",
+                        before["records_per_second"],
+                        now["records_per_second"],
+                        change,
+                        change < -threshold,
+                    )
+                )
+            # Sampled RSS of short stages only sees the first samples of the process.
+            rss_comparable = long_enough or now.get("peak_rss_source") == "wait4"
+            if now.get("peak_rss_bytes") and before.get("peak_rss_bytes") and rss_comparable:
+                change = now["peak_rss_bytes"] / before["peak_rss_bytes"] - 1.0
+                checks.append(
+                    ("peak_rss_bytes", before["peak_rss_bytes"], now["peak_rss_bytes"], change, change > threshold)
+                )
+            for metric, old_value, new_value, change, regressed in checks:
+                comparisons.append(
+                    {
+                        "records": int(size),
+                        "stage": stage,
+                        "metric": metric,
+                        "baseline": old_value,
+                        "current": new_value,
+                        "change_pct": round(change * 100.0, 1),
+                        "regressed": regressed,
+                    }
+                )
+    return comparisons
+
+
+def git_revision(repo_root: Path) -> str | None:
+    """Current commit of the repository, when available. Shared with run_microbenchmarks.py."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_root), "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def main() -> int:
+    """Entry point."""
+    args = parse_args()
+    if args.comparison_child:
+        export_csv, input_jsonl, run_dir = (Path(item) for item in args.comparison_child)
+        return comparison_child(export_csv, input_jsonl, run_dir)
+
+    try:
+        sizes = parse_sizes(args.sizes)
+    except ValueError as err:
+        print(f"ERROR: invalid --sizes: {err}", file=sys.stderr)
+        return 2
+    if args.repeat < 1:
+        print("ERROR: --repeat must be >= 1", file=sys.stderr)
+        return 2
+    if args.regression_threshold < 0:
+        print("ERROR: --regression-threshold must be >= 0", file=sys.stderr)
+        return 2
+    if args.update_baseline and not args.baseline:
+        print("ERROR: --update-baseline requires --baseline", file=sys.stderr)
+        return 2
+    baseline: dict[str, Any] | None = None
+    if args.baseline and not args.update_baseline:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            print(f"ERROR: baseline not found: {baseline_path}", file=sys.stderr)
+            return 2
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    tools_dir = Path(__file__).resolve().parent
+    repo_root = tools_dir.parents[1]
+    bench_root = Path(args.bench_root).resolve()
+    bench_root.mkdir(parents=True, exist_ok=True)
+    timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_path = Path(args.results) if args.results else bench_root / f"results_{timestamp}.json"
+
+    results: dict[str, Any] = {
+        "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(repo_root),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "sizes": {},
+    }
+    try:
+        for records in sizes:
+            results["sizes"][str(records)] = benchmark_size(args, bench_root, records, tools_dir)
+    except RuntimeError as err:
+        print(f"ERROR: {err}", file=sys.stderr)
+        return 1
+
+    regressions: list[dict[str, Any]] = []
+    if baseline is not None:
+        comparisons = compare_to_baseline(results, baseline, args.regression_threshold, args.noise_floor_seconds)
+        regressions = [item for item in comparisons if item["regressed"]]
+        results["baseline"] = {
+            "path": str(Path(args.baseline).resolve()),
+            "generated_at": baseline.get("generated_at"),
+            "git_revision": baseline.get("git_revision"),
+            "regression_threshold": args.regression_threshold,
+            "comparisons": comparisons,
+            "regressions": len(regressions),
+        }
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.update_baseline:
+        baseline_path = Path(args.baseline)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+
+    print("")
+    print(f"{'records':>9}  {'stage':<18} {'seconds':>9} {'rec/s':>11} {'peak RSS MiB':>12}")
+    for size, entry in results["sizes"].items():
+        for stage, metrics in entry["stages"].items():
+            rss = metrics.get("peak_rss_bytes")
+            print(
+                f"{int(size):>9,}  {stage:<18} {metrics['duration_seconds']:>9.2f} "
+                f"{metrics['records_per_second'] or 0:>11,.0f} {rss / 1048576 if rss else 0:>12.1f}"
+            )
+    for item in regressions:
+        print(
+            f"REGRESSION: {item['records']} records, {item['stage']} {item['metric']}: "
+            f"{item['baseline']} -> {item['current']} ({item['change_pct']:+.1f}%)",
+            file=sys.stderr,
+        )
+    print(f"Results: {results_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
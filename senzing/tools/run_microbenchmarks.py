@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the hot per-record functions of the mapping and E2E tools.
+
+Each case calls one function over representative inputs taken from `test_data/`
+(source partner JSON and mapped Senzing JSONL). The runner:
+1) warms every case up for --warmup-seconds,
+2) picks a loop count so one round takes at least --min-round-seconds,
+3) times --repeat rounds with garbage collection off (as `timeit` does),
+4) reports per-call min/median/mean/stdev/max in nanoseconds and calls per second.
+
+Results are written as JSON with stable ordering so CI can diff or compare them
+(--baseline). Standard library only; the tools are loaded from their script files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import functools
+import gc
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TOOLS_DIR = REPO_ROOT / "senzing" / "tools"
+E2E_SCRIPT = REPO_ROOT / "senzing" / "all_in_one" / "run_senzing_end_to_end.py"
+BENCHMARKS_SCRIPT = TOOLS_DIR / "run_benchmarks.py"
+SOURCE_INPUT_GLOB = "partner_input_*.json"
+MAPPED_INPUT_GLOB = "output/*.jsonl"
+
+
+class BenchmarkCase:
+    """One function under test: called once per item of `items` in every loop."""
+
+    def __init__(self, name: str, function: Callable[[Any], Any], items: list[Any], description: str) -> None:
+        self.name = name
+        self.function = function
+        self.items = items
+        self.description = description
+
+    def run(self, loops: int) -> int:
+        """Run `loops` passes over the items; returns elapsed nanoseconds."""
+        function = self.function
+        items = self.items
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            for item in items:
+                function(item)
+        return time.perf_counter_ns() - start
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI parser."""
+    parser = argparse.ArgumentParser(description="Micro-benchmark hot per-record functions on test_data inputs.")
+    parser.add_argument("--test-data", default=str(REPO_ROOT / "test_data"), help="Folder with representative inputs")
+    parser.add_argument(
+        "--cases", default=None, help="Comma-separated case names (or substrings) to run (default: all)"
+    )
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed rounds per case (default: 7)")
+    parser.add_argument("--warmup-seconds", type=float, default=0.2, help="Untimed warmup per case (default: 0.2)")
+    parser.add_argument(
+        "--min-round-seconds", type=float, default=0.2, help="Minimum duration of one round (default: 0.2)"
+    )
+    parser.add_argument("--output", default=None, help="Write results JSON here (default: stdout only shows the table)")
+    parser.add_argument("--baseline", default=None, help="Earlier results JSON to compare median per-call time against")
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.20,
+        help="Allowed relative growth of the median per-call time (default: 0.20)",
+    )
+    return parser.parse_args()
+
+
+@functools.lru_cache(maxsize=None)
+def load_tool(name: str, path: Path) -> ModuleType:
+    """Import a tool script by path (once per name)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_inputs(test_data: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Source partner records and mapped Senzing records (with FEATURES) from test_data."""
+    source_records: list[dict[str, Any]] = []
+    for path in sorted(test_data.glob(SOURCE_INPUT_GLOB)):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        source_records.extend(item for item in payload if isinstance(item, dict))
+    mapped_records: list[dict[str, Any]] = []
+    for path in sorted(test_data.glob(MAPPED_INPUT_GLOB)):
+        with path.open("r", encoding="utf-8") as infile:
+            for line in infile:
+                if line.strip():
+                    record = json.loads(line)
+                    if isinstance(record, dict) and isinstance(record.get("FEATURES"), list):
+                        mapped_records.append(record)
+    return source_records, mapped_records
+
+
+def why_payload(anchor: dict[str, Any], matched: dict[str, Any], entity_id: int) -> dict[str, Any]:
+    """WHY_RECORDS-shaped explain answer for two mapped records (test_data has no explain output)."""
+
+    def feature_values(record: dict[str, Any], attribute: str) -> list[str]:
+        return [
+            str(item[attribute]) for item in record.get("FEATURES", []) if isinstance(item, dict) and attribute in item
+        ]
+
+    scores: dict[str, list[dict[str, Any]]] = {}
+    for feature, attribute in (("NAME", "NAME_FULL"), ("ADDRESS", "ADDR_LINE1"), ("TAX_ID", "TAX_ID_NUMBER")):
+        inbound = feature_values(anchor, attribute)
+        candidate = feature_values(matched, attribute)
+        if inbound and candidate:
+            same = inbound[0] == candidate[0]
+            scores[feature] = [
+                {
+                    "INBOUND_FEAT_DESC": inbound[0],
+                    "CANDIDATE_FEAT_DESC": candidate[0],
+                    "SCORE": 100 if same else 80,
+                    "SCORE_BUCKET": "SAME" if same else "CLOSE",
+                }
+            ]
+    return {
+        "WHY_RESULTS": [
+            {
+                "ENTITY_ID": entity_id,
+                "FOCUS_RECORDS": [
+                    {"DATA_SOURCE": anchor.get("DATA_SOURCE"), "RECORD_ID": anchor.get("RECORD_ID")},
+                    {"DATA_SOURCE": matched.get("DATA_SOURCE"), "RECORD_ID": matched.get("RECORD_ID")},
+                ],
+                "MATCH_INFO": {
+                    "WHY_KEY": "+" + "+".join(scores) if scores else "",
+                    "WHY_ERRULE_CODE": "CNAME_CFF_CEXCL",
+                    "FEATURE_SCORES": scores,
+                },
+            }
+        ],
+        "ENTITIES": [
+            {
+                "RESOLVED_ENTITY": {
+                    "ENTITY_ID": entity_id,
+                    "RECORDS": [anchor.get("RECORD_ID"), matched.get("RECORD_ID")],
+                }
+            }
+        ],
+    }
+
+
+def build_cases(test_data: Path, work_dir: Path) -> list[BenchmarkCase]:
+    """Load the tools and build every case from test_data inputs."""
+    mapper = load_tool("partner_json_to_senzing", TOOLS_DIR / "partner_json_to_senzing.py")
+    linter = load_tool("lint_senzing_json", TOOLS_DIR / "lint_senzing_json.py")
+    json_analyzer = load_tool("sz_json_analyzer", TOOLS_DIR / "sz_json_analyzer.py")
+    schema_generator = load_tool("sz_schema_generator", TOOLS_DIR / "sz_schema_generator.py")
+    stakeholder = load_tool("sz_stakeholder_report", TOOLS_DIR / "sz_stakeholder_report.py")
+    e2e = load_tool("run_senzing_end_to_end", E2E_SCRIPT)
+    benchmarks = load_tool("run_benchmarks", BENCHMARKS_SCRIPT)
+
+    source_records, mapped_records = load_inputs(test_data)
+    if not source_records or not mapped_records:
+        raise ValueError(f"no source ({SOURCE_INPUT_GLOB}) or mapped ({MAPPED_INPUT_GLOB}) records in {test_data}")
+
+    source_keys = [key for record in source_records for key in record]
+    field_map = mapper.infer_field_map(source_records, 0.90)
+    canonical_fields = list(mapper.CANONICAL_FIELDS)
+    resolve_items = [(record, field) for record in source_records for field in canonical_fields]
+    mapper_args = mapper.build_arg_parser().parse_args(["-"])
+    engine = mapper.MapperEngine.from_args(mapper_args, field_map)
+
+    config_data = json.loads((TOOLS_DIR / "sz_default_config.json").read_text(encoding="utf-8"))
+    analyzer = json_analyzer.SzJsonAnalyzer(config_data)
+    file_analyzer = schema_generator.FileAnalyzer("benchmark.json", "json")
+    flat_items = [(key, value) for record in source_records for key, value in record.items() if key]
+
+    export_csv = work_dir / "entity_export_stub.csv"
+    # Record IDs repeat across test_data files; number them to keep export keys unique.
+    benchmarks.write_stub_export(mapped_records, export_csv, number_record_ids=True)
+
+    def match_inputs(path: Path) -> tuple[int, int]:
+        index = e2e.ExportIndex.from_csv(path)
+        return len(index.matched_record_items()), sum(1 for _ in index.iter_matched_pair_items())
+
+    why_items: list[tuple[dict[str, Any], str | None]] = []
+    for position in range(len(mapped_records) - 1):
+        why_items.append((why_payload(mapped_records[position], mapped_records[position + 1], position + 1), None))
+    why_items.append((None, "WHY_KEY: +NAME+ADDRESS\nERRULE: CNAME_CFF_CEXCL\n"))
+
+    return [
+        BenchmarkCase(
+            "normalize_key",
+            mapper.normalize_key,
+            source_keys,
+            "partner_json_to_senzing.normalize_key on every source field name",
+        ),
+        BenchmarkCase(
+            "resolve_value",
+            lambda item: mapper.resolve_value(item[0], field_map, item[1], 0.90),
+            resolve_items,
+            "resolve_value per (record, canonical field) with the inferred dataset field map",
+        ),
+        BenchmarkCase(
+            "resolve_value_unmapped",
+            lambda item: mapper.resolve_value(item[0], {}, item[1], 0.90),
+            resolve_items,
+            "resolve_value without a field map (per-record alias and fuzzy fallback)",
+        ),
+        BenchmarkCase(
+            "convert_record",
+            lambda item: mapper.convert_record(item[1], field_map, mapper_args, item[0]),
+            list(enumerate(source_records, start=1)),
+            "convert_record per source record (builds a MapperEngine per call)",
+        ),
+        BenchmarkCase(
+            "MapperEngine.convert",
+            lambda item: engine.convert(item[1], item[0]),
+            list(enumerate(source_records, start=1)),
+            "reused MapperEngine.convert per source record",
+        ),
+        BenchmarkCase(
+            "lint_record",
+            lambda record: linter.lint_record(record, "benchmark"),
+            mapped_records,
+            "lint_senzing_json.lint_record (strict) per mapped record",
+        ),
+        BenchmarkCase(
+            "SzJsonAnalyzer.analyze_json",
+            analyzer.analyze_json,
+            mapped_records,
+            "sz_json_analyzer analyze_json per mapped record with sz_default_config.json",
+        ),
+        BenchmarkCase(
+            "FileAnalyzer.update_node",
+            lambda item: file_analyzer.update_node("root", item[0], item[1]),
+            flat_items,
+            "sz_schema_generator update_node per top-level source field value",
+        ),
+        BenchmarkCase(
+            "feature_presence",
+            stakeholder.feature_presence,
+            mapped_records,
+            "sz_stakeholder_report.feature_presence per mapped record",
+        ),
+        BenchmarkCase(
+            "build_match_inputs",
+            match_inputs,
+            [export_csv],
+            f"ExportIndex.from_csv + matched records + matched pairs over a {len(mapped_records)}-row stub export",
+        ),
+        BenchmarkCase(
+            "extract_reason_summary",
+            lambda item: e2e.extract_reason_summary(item[0], item[1]),
+            why_items,
+            "extract_reason_summary per WHY_RECORDS-shaped answer built from mapped record pairs",
+        ),
+    ]
+
+
+def select_cases(cases: list[BenchmarkCase], selector: str | None) -> list[BenchmarkCase]:
+    """Filter cases by exact name or substring."""
+    if not selector:
+        return cases
+    wanted = [part.strip() for part in selector.split(",") if part.strip()]
+    return [case for case in cases if any(part == case.name or part in case.name for part in wanted)]
+
+
+def measure(case: BenchmarkCase, repeat: int, warmup_seconds: float, min_round_seconds: float) -> dict[str, Any]:
+    """Warm up, calibrate the loop count and time `repeat` rounds of one case."""
+    warmup_deadline = time.perf_counter() + warmup_seconds
+    case.run(1)
+    while time.perf_counter() < warmup_deadline:
+        case.run(1)
+
+    loops = 1
+    while True:
+        elapsed = case.run(loops)
+        if elapsed >= min_round_seconds * 1e9 or loops >= 1 << 30:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_round_seconds * 1e9 / elapsed) + 1))
+
+    calls_per_round = loops * len(case.items)
+    per_call_ns: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            per_call_ns.append(case.run(loops) / calls_per_round)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    median = statistics.median(per_call_ns)
+    return {
+        "description": case.description,
+        "items": len(case.items),
+        "loops": loops,
+        "rounds": repeat,
+        "per_call_ns": {
+            "min": round(min(per_call_ns), 1),
+            "median": round(median, 1),
+            "mean": round(statistics.fmean(per_call_ns), 1),
+            "stdev": round(statistics.stdev(per_call_ns), 1) if len(per_call_ns) > 1 else 0.0,
+            "max": round(max(per_call_ns), 1),
+        },
+        "calls_per_second": round(1e9 / median, 1) if median > 0 else None,
+    }
+
+
+def compare_to_baseline(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Median per-call change of every case present in both runs."""
+    comparisons = []
+    for name, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if not previous:
+            continue
+        before = previous["per_call_ns"]["median"]
+        now = current["per_call_ns"]["median"]
+        change = now / before - 1.0 if before else 0.0
+        comparisons.append(
+            {
+                "case": name,
+                "baseline_median_ns": before,
+                "current_median_ns": now,
+                "change_pct": round(change * 100.0, 1),
+                "regressed": change > threshold,
+            }
+        )
+    return comparisons
+
+
+def main() -> int:
+    """Entry point."""
+    args = parse_args()
+    if args.repeat < 1:
+        print("ERROR: --repeat must be >= 1", file=sys.stderr)
+        return 2
+    if args.min_round_seconds <= 0 or args.warmup_seconds < 0:
+        print("ERROR: --min-round-seconds must be > 0 and --warmup-seconds >= 0", file=sys.stderr)
+        return 2
+    test_data = Path(args.test_data)
+    if not test_data.is_dir():
+        print(f"ERROR: test data folder not found: {test_data}", file=sys.stderr)
+        return 2
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            print(f"ERROR: baseline not found: {baseline_path}", file=sys.stderr)
+            return 2
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    with tempfile.TemporaryDirectory(prefix="microbench_") as work_dir:
+        try:
+            cases = select_cases(build_cases(test_data, Path(work_dir)), args.cases)
+        except (ImportError, ValueError) as err:
+            print(f"ERROR: {err}", file=sys.stderr)
+            return 2
+        if args.list:
+            for case in cases:
+                print(f"{case.name:<28} {len(case.items):>5} items  {case.description}")
+            return 0
+        if not cases:
+            print(f"ERROR: no case matches --cases {args.cases}", file=sys.stderr)
+            return 2
+
+        results: dict[str, Any] = {
+            "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
+            "git_revision": load_tool("run_benchmarks", BENCHMARKS_SCRIPT).git_revision(REPO_ROOT),
+            "host": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+            },
+            "settings": {
+                "repeat": args.repeat,
+                "warmup_seconds": args.warmup_seconds,
+                "min_round_seconds": args.min_round_seconds,
+                "test_data": str(test_data.resolve()),
+            },
+            "cases": {},
+        }
+        print(f"{'case':<28} {'median ns':>12} {'stdev ns':>10} {'min ns':>12} {'calls/s':>14}")
+        for case in cases:
+            result = measure(case, args.repeat, args.warmup_seconds, args.min_round_seconds)
+            results["cases"][case.name] = result
+            stats = result["per_call_ns"]
+            print(
+                f"{case.name:<28} {stats['median']:>12,.1f} {stats['stdev']:>10,.1f} "
+                f"{stats['min']:>12,.1f} {result['calls_per_second'] or 0:>14,.0f}"
+            )
+
+    regressions: list[dict[str, Any]] = []
+    if baseline is not None:
+        comparisons = compare_to_baseline(results, baseline, args.regression_threshold)
+        regressions = [item for item in comparisons if item["regressed"]]
+        results["baseline"] = {
+            "path": str(Path(args.baseline).resolve()),
+            "git_revision": baseline.get("git_revision"),
+            "regression_threshold": args.regression_threshold,
+            "comparisons": comparisons,
+            "regressions": len(regressions),
+        }
+        for item in comparisons:
+            marker = "REGRESSION" if item["regressed"] else "ok"
+            print(
+                f"{marker:<10} {item['case']:<28} {item['baseline_median_ns']:>12,.1f} -> "
+                f"{item['current_median_ns']:>12,.1f} ns ({item['change_pct']:+.1f}%)"
+            )
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Results: {output_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,13 +21,37 @@ import time
 from pathlib import Path
 from typing import Any
 
+from process_sampler import ProcessTreeSampler
+
 DEFAULT_DATA_SOURCE = "PARTNERS"
 
 
-def run_step(step_name: str, command: list[str], log_file: Path) -> dict[str, Any]:
-    """Execute one pipeline step and capture logs."""
+def run_step(
+    step_name: str,
+    command: list[str],
+    log_file: Path,
+    resource_sample_seconds: float = 1.0,
+    resource_timeseries: bool = False,
+) -> dict[str, Any]:
+    """Execute one pipeline step, capture logs and sample its resource usage."""
     start = time.time()
-    result = subprocess.run(command, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    sampler = ProcessTreeSampler(
+        resource_sample_seconds,
+        log_file.with_suffix(".resources.jsonl") if resource_timeseries else None,
+    )
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as process:
+        sampler.start(process.pid)
+        stdout, stderr = process.communicate()
+    sampler.stop()
+    result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
     duration_seconds = round(time.time() - start, 3)
 
     log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -41,7 +65,7 @@ def run_step(step_name: str, command: list[str], log_file: Path) -> dict[str, An
         outfile.write("\n--- STDERR ---\n")
         outfile.write(result.stderr or "")
 
-    return {
+    step = {
         "step": step_name,
         "exit_code": result.returncode,
         "duration_seconds": duration_seconds,
@@ -50,6 +74,10 @@ def run_step(step_name: str, command: list[str], log_file: Path) -> dict[str, An
         "stderr_tail": (result.stderr or "")[-1200:],
         "ok": result.returncode == 0,
     }
+    resources = sampler.summary()
+    if resources is not None:
+        step["resources"] = resources
+    return step
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -69,6 +97,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="TAX_ID_TYPE value (default: TIN)",
     )
     parser.add_argument("--python-bin", default=sys.executable, help="Python executable for child scripts")
+    parser.add_argument(
+        "--resource-sample-seconds",
+        type=float,
+        default=1.0,
+        help="Interval for sampling CPU/RSS/IO/threads of each step from /proc (default: 1.0, 0 = off)",
+    )
+    parser.add_argument(
+        "--resource-timeseries",
+        action="store_true",
+        help="Also write every resource sample to logs/<step log>.resources.jsonl",
+    )
     return parser
 
 
@@ -112,6 +151,7 @@ def main() -> int:
     print("Starting pipeline...")
 
     steps: list[dict[str, Any]] = []
+    resource_options = (args.resource_sample_seconds, args.resource_timeseries)
 
     mapper_command = [
         args.python_bin,
@@ -127,21 +167,21 @@ def main() -> int:
     ]
     if args.include_unmapped_source_fields:
         mapper_command.append("--include-unmapped-source-fields")
-    mapper_result = run_step("convert", mapper_command, logs_dir / "01_convert.log")
+    mapper_result = run_step("convert", mapper_command, logs_dir / "01_convert.log", *resource_options)
     steps.append(mapper_result)
     if not mapper_result["ok"]:
         print("FAILED at step: convert")
         return_code = 1
     else:
         lint_command = [args.python_bin, str(linter_script), str(output_jsonl)]
-        lint_result = run_step("lint", lint_command, logs_dir / "02_lint.log")
+        lint_result = run_step("lint", lint_command, logs_dir / "02_lint.log", *resource_options)
         steps.append(lint_result)
         if not lint_result["ok"]:
             print("FAILED at step: lint")
             return_code = 1
         else:
             analyzer_command = [args.python_bin, str(analyzer_script), str(output_jsonl), "-o", str(analyzer_md)]
-            analyzer_result = run_step("analyze", analyzer_command, logs_dir / "03_analyze.log")
+            analyzer_result = run_step("analyze", analyzer_command, logs_dir / "03_analyze.log", *resource_options)
             steps.append(analyzer_result)
             if not analyzer_result["ok"]:
                 print("FAILED at step: analyze")
@@ -155,7 +195,9 @@ def main() -> int:
                     "--analyzer-md",
                     str(analyzer_md),
                 ]
-                stakeholder_result = run_step("stakeholder_report", stakeholder_command, logs_dir / "04_stakeholder.log")
+                stakeholder_result = run_step(
+                    "stakeholder_report", stakeholder_command, logs_dir / "04_stakeholder.log", *resource_options
+                )
                 steps.append(stakeholder_result)
                 return_code = 0 if stakeholder_result["ok"] else 1
 
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""Query and maintain the SQLite run registry in `output/run_registry.sqlite`.
+
+The E2E runner records every successful run there (next to the CSV registry)
+and the sample generator registers each `generation_summary_*.json` it writes.
+This tool:
+1) imports an existing `output/run_registry.csv` and `generation_summary_*.json` files,
+2) prints duration and load records/sec trends across runs, oldest first.
+
+It owns the registry schema: the runner and the generator import this file by
+path and write through `open_registry`, `insert_run` and `register_generation_summary`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import json
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+
+RUN_REGISTRY_DB_NAME = "run_registry.sqlite"
+RUN_REGISTRY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    generated_at TEXT NOT NULL,
+    run_directory TEXT NOT NULL,
+    run_name TEXT,
+    overall_ok INTEGER,
+    records_input INTEGER,
+    data_sources TEXT,
+    input_file TEXT,
+    load_input_jsonl TEXT,
+    project_dir TEXT,
+    fast_mode INTEGER,
+    resumed INTEGER,
+    duration_seconds REAL,
+    load_seconds REAL,
+    load_records_per_second REAL,
+    comparison_dir TEXT,
+    management_summary_md TEXT,
+    ground_truth_match_quality_md TEXT,
+    ground_truth_match_quality_json TEXT,
+    generation_summary_json TEXT,
+    base_input_json TEXT,
+    mapped_output_jsonl TEXT,
+    UNIQUE (run_directory, generated_at)
+);
+CREATE INDEX IF NOT EXISTS runs_generated_at ON runs (generated_at);
+CREATE INDEX IF NOT EXISTS runs_input_file ON runs (input_file);
+CREATE INDEX IF NOT EXISTS runs_mapped_output_jsonl ON runs (mapped_output_jsonl);
+CREATE TABLE IF NOT EXISTS generation_summaries (
+    summary_path TEXT PRIMARY KEY,
+    generated_at TEXT,
+    records INTEGER,
+    base_input_json TEXT,
+    mapped_output_jsonl TEXT,
+    mapped_output_name TEXT
+);
+CREATE INDEX IF NOT EXISTS generation_summaries_mapped_output
+    ON generation_summaries (mapped_output_jsonl);
+CREATE INDEX IF NOT EXISTS generation_summaries_mapped_name
+    ON generation_summaries (mapped_output_name);
+"""
+RUN_REGISTRY_COLUMNS = [
+    "generated_at",
+    "run_directory",
+    "run_name",
+    "overall_ok",
+    "records_input",
+    "data_sources",
+    "input_file",
+    "load_input_jsonl",
+    "project_dir",
+    "fast_mode",
+    "resumed",
+    "duration_seconds",
+    "load_seconds",
+    "load_records_per_second",
+    "comparison_dir",
+    "management_summary_md",
+    "ground_truth_match_quality_md",
+    "ground_truth_match_quality_json",
+    "generation_summary_json",
+    "base_input_json",
+    "mapped_output_jsonl",
+]
+LOAD_STEP_PREFIXES = ("load_records", "calibrate_load_threads")
+TREND_COLUMNS = [
+    "generated_at",
+    "run_name",
+    "overall_ok",
+    "records_input",
+    "duration_seconds",
+    "load_seconds",
+    "load_records_per_second",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI parser."""
+    parser = argparse.ArgumentParser(description="Import and query the SQLite run registry.")
+    parser.add_argument(
+        "--db",
+        default=f"output/{RUN_REGISTRY_DB_NAME}",
+        help=f"Registry database (default: output/{RUN_REGISTRY_DB_NAME})",
+    )
+    parser.add_argument(
+        "--import-csv",
+        nargs="?",
+        const="output/run_registry.csv",
+        default=None,
+        help="Import runs from a CSV registry (default path: output/run_registry.csv); "
+        "durations are read from each run's run_summary.json when it still exists",
+    )
+    parser.add_argument(
+        "--import-generation-summaries",
+        action="store_true",
+        help="Register generation_summary_*.json files found next to the database",
+    )
+    parser.add_argument("--input", default=None, help="Only runs whose input or mapped output path/name matches")
+    parser.add_argument("--since", default=None, help="Only runs generated at or after this ISO date/time")
+    parser.add_argument("--limit", type=int, default=50, help="Show the latest N runs (default: 50, 0 = all)")
+    parser.add_argument("--ok-only", action="store_true", help="Skip runs that did not finish successfully")
+    parser.add_argument("--format", choices=("table", "json", "csv"), default="table", help="Output format")
+    return parser.parse_args()
+
+
+def open_registry(db_path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the registry database."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    conn.executescript(RUN_REGISTRY_SCHEMA)
+    return conn
+
+
+def to_int(value: Any) -> int | None:
+    """Parse an int from registry text, None when empty or invalid."""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def to_flag(value: Any) -> int | None:
+    """Parse a CSV boolean ("True"/"False") into 1/0."""
+    text = str(value or "").strip().lower()
+    if text in {"true", "1", "yes"}:
+        return 1
+    if text in {"false", "0", "no"}:
+        return 0
+    return None
+
+
+def run_timings(summary: dict[str, Any]) -> dict[str, float | None]:
+    """Derive run duration, load seconds and load records/sec from a run summary."""
+    load_seconds = 0.0
+    for step in summary.get("steps", []):
+        if isinstance(step, dict) and str(step.get("step") or "").startswith(LOAD_STEP_PREFIXES):
+            load_seconds += float(step.get("duration_seconds") or 0.0)
+    records = to_int(summary.get("records_input"))
+    duration = summary.get("duration_seconds")
+    return {
+        "duration_seconds": float(duration) if duration is not None else None,
+        "load_seconds": round(load_seconds, 3) if load_seconds > 0 else None,
+        "load_records_per_second": (round(records / load_seconds, 1) if records and load_seconds > 0 else None),
+    }
+
+
+def insert_run(conn: sqlite3.Connection, row: dict[str, Any], replace: bool = False) -> bool:
+    """Insert one run row; returns False when the run is already registered.
+
+    With replace=True an existing row for the same run is overwritten instead.
+    """
+    placeholders = ", ".join("?" for _ in RUN_REGISTRY_COLUMNS)
+    conflict = "REPLACE" if replace else "IGNORE"
+    cursor = conn.execute(
+        f"INSERT OR {conflict} INTO runs ({', '.join(RUN_REGISTRY_COLUMNS)}) VALUES ({placeholders})",
+        [row.get(column) for column in RUN_REGISTRY_COLUMNS],
+    )
+    return cursor.rowcount > 0
+
+
+def register_generation_summary(conn: sqlite3.Connection, summary_path: Path, payload: dict[str, Any]) -> None:
+    """Insert or replace one generation summary."""
+    mapped_output = str(payload.get("mapped_output_jsonl") or "").strip() or None
+    conn.execute(
+        "INSERT OR REPLACE INTO generation_summaries "
+        "(summary_path, generated_at, records, base_input_json, mapped_output_jsonl, mapped_output_name) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            str(summary_path.resolve()),
+            str(payload.get("generated_at") or "") or None,
+            to_int(payload.get("records")),
+            str(payload.get("base_input_json") or "") or None,
+            mapped_output,
+            Path(mapped_output).name if mapped_output else None,
+        ),
+    )
+
+
+def import_generation_summaries(conn: sqlite3.Connection, output_dir: Path) -> int:
+    """Register every readable generation_summary_*.json in output_dir."""
+    imported = 0
+    for summary_path in sorted(output_dir.glob("generation_summary_*.json")):
+        try:
+            payload = json.loads(summary_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(payload, dict):
+            register_generation_summary(conn, summary_path, payload)
+            imported += 1
+    return imported
+
+
+def register_new_generation_summaries(conn: sqlite3.Connection, output_dir: Path) -> int:
+    """Register generation_summary_*.json files in output_dir not yet in the registry.
+
+    Covers summaries written before the registry existed or by older tools;
+    files already registered are not read again.
+    """
+    known = {row[0] for row in conn.execute("SELECT summary_path FROM generation_summaries")}
+    registered = 0
+    for summary_path in sorted(output_dir.glob("generation_summary_*.json")):
+        if str(summary_path.resolve()) in known:
+            continue
+        try:
+            payload = json.loads(summary_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(payload, dict):
+            register_generation_summary(conn, summary_path, payload)
+            registered += 1
+    return registered
+
+
+def find_generation_summary(conn: sqlite3.Connection, mapped_output: Path) -> tuple[str, str | None, str | None] | None:
+    """Newest generation summary whose mapped output matches the path or file name.
+
+    Returns (summary_path, base_input_json, mapped_output_jsonl) or None.
+    """
+    row = conn.execute(
+        "SELECT summary_path, base_input_json, mapped_output_jsonl FROM generation_summaries "
+        "WHERE mapped_output_jsonl = ? OR mapped_output_name = ? "
+        "ORDER BY generated_at DESC, summary_path DESC LIMIT 1",
+        (str(mapped_output), mapped_output.name),
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def import_csv_registry(conn: sqlite3.Connection, csv_path: Path) -> tuple[int, int]:
+    """Import rows of a CSV run registry; returns (rows read, rows inserted)."""
+    read_rows = 0
+    inserted = 0
+    with csv_path.open("r", encoding="utf-8", newline="") as infile:
+        for csv_row in csv.DictReader(infile):
+            read_rows += 1
+            row: dict[str, Any] = {key: (value or None) for key, value in csv_row.items() if key}
+            row["overall_ok"] = to_flag(csv_row.get("overall_ok"))
+            row["fast_mode"] = to_flag(csv_row.get("fast_mode"))
+            row["records_input"] = to_int(csv_row.get("records_input"))
+            run_dir = str(csv_row.get("run_directory") or "")
+            summary_path = Path(run_dir) / "run_summary.json" if run_dir else None
+            if summary_path is not None and summary_path.exists():
+                try:
+                    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError):
+                    summary = None
+                if isinstance(summary, dict):
+                    row.update(run_timings(summary))
+                    row["resumed"] = 1 if summary.get("resumed") else 0
+            if not row.get("generated_at") or not run_dir:
+                continue
+            if insert_run(conn, row):
+                inserted += 1
+    return read_rows, inserted
+
+
+def query_trends(
+    conn: sqlite3.Connection,
+    input_filter: str | None,
+    since: str | None,
+    limit: int,
+    ok_only: bool,
+) -> list[dict[str, Any]]:
+    """Return matching runs, oldest first, limited to the latest `limit`."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if input_filter:
+        name = Path(input_filter).name
+        clauses.append(
+            "(input_file = ? OR mapped_output_jsonl = ? OR load_input_jsonl = ? "
+            "OR input_file LIKE ? OR mapped_output_jsonl LIKE ?)"
+        )
+        params.extend([input_filter, input_filter, input_filter, f"%/{name}", f"%/{name}"])
+    if since:
+        clauses.append("generated_at >= ?")
+        params.append(since)
+    if ok_only:
+        clauses.append("overall_ok = 1")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    sql = f"SELECT {', '.join(TREND_COLUMNS)} FROM runs {where} ORDER BY generated_at DESC, id DESC"
+    if limit > 0:
+        sql += " LIMIT ?"
+        params.append(limit)
+    rows = [dict(zip(TREND_COLUMNS, values)) for values in conn.execute(sql, params)]
+    rows.reverse()
+    previous_rate: float | None = None
+    for row in rows:
+        rate = row.get("load_records_per_second")
+        row["load_rate_change_pct"] = (
+            round((rate - previous_rate) / previous_rate * 100.0, 1) if rate and previous_rate else None
+        )
+        if rate:
+            previous_rate = rate
+    return rows
+
+
+def trend_stats(rows: list[dict[str, Any]], column: str) -> dict[str, float] | None:
+    """Min/median/max of one numeric column."""
+    values = [float(row[column]) for row in rows if row.get(column) is not None]
+    if not values:
+        return None
+    return {
+        "min": round(min(values), 3),
+        "median": round(statistics.median(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def format_cell(value: Any) -> str:
+    """Render one table cell."""
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"{value:,}"
+    return str(value)
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    """Print runs and a min/median/max footer as a plain text table."""
+    columns = [*TREND_COLUMNS, "load_rate_change_pct"]
+    headers = ["generated_at", "run", "ok", "records", "duration_s", "load_s", "load_rec/s", "rate_chg_%"]
+    table = [headers]
+    for row in rows:
+        cells = [format_cell(row.get(column)) for column in columns]
+        cells[2] = {1: "yes", 0: "no"}.get(row.get("overall_ok"), "-")
+        table.append(cells)
+    widths = [max(len(line[index]) for line in table) for index in range(len(headers))]
+    for line in table:
+        cells = [
+            cell.ljust(width) if index < 3 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(line, widths))
+        ]
+        print("  ".join(cells))
+    print("")
+    print(f"Runs: {len(rows)}")
+    for column in ("duration_seconds", "load_records_per_second"):
+        stats = trend_stats(rows, column)
+        if stats:
+            print(f"{column}: min {stats['min']:,.1f}  median {stats['median']:,.1f}  max {stats['max']:,.1f}")
+
+
+def main() -> int:
+    """Entry point."""
+    args = parse_args()
+    db_path = Path(args.db).resolve()
+    if args.limit < 0:
+        print("ERROR: --limit must be >= 0", file=sys.stderr)
+        return 2
+    if args.since:
+        try:
+            dt.datetime.fromisoformat(args.since)
+        except ValueError:
+            print(f"ERROR: --since is not an ISO date/time: {args.since}", file=sys.stderr)
+            return 2
+
+    conn = open_registry(db_path)
+    try:
+        if args.import_csv:
+            csv_path = Path(args.import_csv).resolve()
+            if not csv_path.exists():
+                print(f"ERROR: CSV registry not found: {csv_path}", file=sys.stderr)
+                return 2
+            with conn:
+                read_rows, inserted = import_csv_registry(conn, csv_path)
+            print(f"Imported {inserted}/{read_rows} runs from {csv_path}", file=sys.stderr)
+        if args.import_generation_summaries:
+            with conn:
+                imported = import_generation_summaries(conn, db_path.parent)
+            print(f"Registered {imported} generation summaries from {db_path.parent}", file=sys.stderr)
+
+        rows = query_trends(conn, args.input, args.since, args.limit, args.ok_only)
+    finally:
+        conn.close()
+
+    if args.format == "json":
+        payload = {
+            "runs": rows,
+            "duration_seconds": trend_stats(rows, "duration_seconds"),
+            "load_records_per_second": trend_stats(rows, "load_records_per_second"),
+        }
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+    elif args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=[*TREND_COLUMNS, "load_rate_change_pct"])
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,9 @@ This tool validates mapped data before loading into Senzing, checking for:
 - Feature population and uniqueness statistics
 - Unmapped/payload attributes
 - Data quality warnings and errors
+
+Input and output files ending in .gz, .bz2, .xz or .zst (zstd requires the
+zstandard package) are compressed/decompressed on the fly.
 """
 
 import argparse
@@ -18,6 +21,8 @@ import sys
 import time
 from contextlib import suppress
 
+from compressed_io import COMPRESSION_SUFFIXES, open_file
+
 try:
     import prettytable
 except (ImportError, ModuleNotFoundError) as err:
@@ -509,6 +514,12 @@ class SzJsonAnalyzer:
         return table_rows
 
 
+def strip_compression_suffix(file_name):
+    """Return file name without a trailing compression extension."""
+    base, ext = os.path.splitext(file_name)
+    return base if ext.lower() in COMPRESSION_SUFFIXES else file_name
+
+
 # =========================
 class JsonlReader:
     """Iterator for reading JSON objects from a JSONL file line by line."""
@@ -915,7 +926,7 @@ if __name__ == "__main__":
         sys.exit(self_test())
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("input_file", help="the name of the input file to analyze")
+    parser.add_argument("input_file", help="the name of the input file to analyze (optionally .gz/.bz2/.xz/.zst)")
     parser.add_argument("-o", "--output_file", dest="output_file", help="optional name of the output file")
     args = parser.parse_args()
 
@@ -929,7 +940,10 @@ if __name__ == "__main__":
         sys.exit(1)
     analyzer = SzJsonAnalyzer(config_data)
 
-    input_file_handle = open(args.input_file, "r")
+    try:
+        input_file_handle = open_file(args.input_file)
+    except ValueError as err:
+        parser.error(str(err))
     reader = JsonlReader(input_file_handle)
 
     proc_start_time = time.time()
@@ -975,9 +989,9 @@ if __name__ == "__main__":
     # --write statistics file or display to terminal
     if args.output_file:
         # Detect output format based on file extension
-        file_ext = os.path.splitext(args.output_file)[1].lower()
+        file_ext = os.path.splitext(strip_compression_suffix(args.output_file))[1].lower()
 
-        with open(args.output_file, "w", encoding="utf-8") as outfile:
+        with open_file(args.output_file, "w") as outfile:
             if file_ext == ".md":
                 outfile.write(format_markdown_table(report_table))
                 print(f"Markdown report written to {args.output_file}\n")
@@ -3,17 +3,25 @@
 
 Supports CSV, JSON, JSONL, Parquet, and XML formats. Generates markdown
 reports with field statistics, data types, and sample values.
+
+Input and output files may be gzip, bz2, xz or zstd (requires zstandard)
+compressed; the codec is detected by extension or magic bytes.
 """
 import argparse
+import bisect
 import csv
 import glob
 import json
 import os
 import pathlib
+import random
 import subprocess
 import sys
 import time
 import xml.etree.ElementTree as ET  # Add import for XML parsing
+from array import array
+
+from compressed_io import COMPRESSION_SUFFIXES, open_file
 
 try:
     import numpy as np
@@ -31,6 +39,17 @@ except ImportError:
     prettytable = False
 
 
+# ============================================================================
+# COMPRESSION HELPERS
+# ============================================================================
+
+
+def strip_compression_suffix(file_path):
+    """Return file path without a trailing compression extension (data.csv.gz -> data.csv)."""
+    base, ext = os.path.splitext(file_path)
+    return base if ext.lower() in COMPRESSION_SUFFIXES else file_path
+
+
 # ============================================================================
 # FILE READER CLASSES
 # ============================================================================
@@ -72,9 +91,10 @@ class CSVReader(FileReader):
     """Reader for CSV files with automatic dialect detection."""
 
     def open(self):
-        self._file_handle = open(self.file_path, "r", encoding=self.encoding)
-        sample = self._file_handle.read(8192)
-        self._file_handle.seek(0)
+        # Sniff from a separate handle: compressed streams cannot always seek back
+        with open_file(self.file_path, "r", self.encoding) as sample_handle:
+            sample = sample_handle.read(8192)
+        self._file_handle = open_file(self.file_path, "r", self.encoding)
         try:
             csv_dialect = csv.Sniffer().sniff(sample, delimiters=[",", ";", "|", "\t"])
             self._reader = csv.DictReader(self._file_handle, dialect=csv_dialect)
@@ -95,7 +115,7 @@ class SocrataJSONReader(FileReader):
         self.field_metadata = {}  # Store field descriptions and metadata
 
     def open(self):
-        self._file_handle = open(self.file_path, "r", encoding=self.encoding)
+        self._file_handle = open_file(self.file_path, "r", self.encoding)
         raw_data = json.load(self._file_handle)
 
         # Extract schema from meta.view.columns
@@ -145,7 +165,7 @@ class JSONReader(FileReader):
         self.field_metadata = {}  # For Socrata field metadata
 
     def open(self):
-        self._file_handle = open(self.file_path, "r", encoding=self.encoding)
+        self._file_handle = open_file(self.file_path, "r", self.encoding)
         self._data = json.load(self._file_handle)
 
         # If root is a list, use it directly
@@ -200,7 +220,7 @@ class JSONLReader(FileReader):
     """Reader for JSONL (JSON Lines) files."""
 
     def open(self):
-        self._file_handle = open(self.file_path, "r", encoding=self.encoding)
+        self._file_handle = open_file(self.file_path, "r", self.encoding)
         self._line_number = 0
 
     def __iter__(self):
@@ -223,7 +243,8 @@ class XMLReader(FileReader):
         self.namespaces = {}
 
     def open(self):
-        tree = ET.parse(self.file_path)
+        with open_file(self.file_path, "rb") as xml_handle:
+            tree = ET.parse(xml_handle)
         root = tree.getroot()
 
         # Extract namespaces from root element
@@ -362,6 +383,199 @@ class Node:
         return tree
 
 
+# ============================================================================
+# RECORD TRACKER CLASSES
+# ============================================================================
+
+class RecordTracker:
+    """Base class for tracking which records contain an enumerated value.
+
+    Trackers report the number of distinct records through len() and expose
+    example record IDs through samples(). A record is identified by its ordinal
+    position in the input so that repeated values inside one record are only
+    counted once.
+    """
+
+    __slots__ = ("_count", "_last_ordinal")
+
+    def __init__(self):
+        self._count = 0
+        self._last_ordinal = None
+
+    def __len__(self):
+        return self._count
+
+    def add(self, record_id, ordinal):
+        """Register record_id (seen at input position ordinal) for this value."""
+        if ordinal == self._last_ordinal:
+            return
+        self._last_ordinal = ordinal
+        self._add(record_id, ordinal)
+
+    def _add(self, record_id, ordinal):
+        """Store a newly seen record. Override in subclasses."""
+        self._count += 1
+
+    def samples(self):
+        """Return example record IDs. Override in subclasses."""
+        return []
+
+
+class SetRecordTracker(RecordTracker):
+    """Keeps every record ID in a set (exact, unbounded memory)."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self):
+        super().__init__()
+        self._records = set()
+
+    def _add(self, record_id, ordinal):
+        self._records.add(record_id)
+        self._count = len(self._records)
+
+    def samples(self):
+        return self._records
+
+
+class ReservoirRecordTracker(RecordTracker):
+    """Keeps an exact record count plus a fixed-size reservoir of example IDs."""
+
+    __slots__ = ("_reservoir", "_size", "_rng")
+
+    def __init__(self, size, rng):
+        super().__init__()
+        self._reservoir = []
+        self._size = size
+        self._rng = rng
+
+    def _add(self, record_id, ordinal):
+        self._count += 1
+        if len(self._reservoir) < self._size:
+            self._reservoir.append(record_id)
+        else:
+            slot = self._rng.randrange(self._count)
+            if slot < self._size:
+                self._reservoir[slot] = record_id
+
+    def samples(self):
+        return self._reservoir
+
+
+class BitmapRecordTracker(RecordTracker):
+    """Keeps numeric record IDs in a compact roaring-style bitmap.
+
+    IDs are split into a 16-bit high key and a 16-bit low value. Each high key
+    owns a sorted array of low values until it holds more than 4096 entries,
+    after which it is converted to a fixed 8 KB bitmap. Records whose ID is not
+    a non-negative integer in canonical form are tracked by their input ordinal
+    in a separate bitmap, so the two ID spaces never collide, and are reported
+    as "record_<ordinal>" (the label used for records without an ID).
+    """
+
+    __slots__ = ("_containers", "_ordinals", "_sample_size")
+
+    ARRAY_LIMIT = 4096
+
+    def __init__(self, sample_size):
+        super().__init__()
+        self._containers = {}
+        self._ordinals = {}
+        self._sample_size = sample_size
+
+    def _add(self, record_id, ordinal):
+        try:
+            value = int(record_id)
+        except (TypeError, ValueError):
+            value = None
+        if value is not None and value >= 0 and str(value) == str(record_id):
+            containers = self._containers
+        else:
+            containers, value = self._ordinals, ordinal
+        if self._insert(containers, value):
+            self._count += 1
+
+    @classmethod
+    def _insert(cls, containers, value):
+        """Add value to one bitmap; returns False when it was already present."""
+        high, low = value >> 16, value & 0xFFFF
+        container = containers.get(high)
+        if container is None:
+            containers[high] = array("H", [low])
+            return True
+        if isinstance(container, bytearray):
+            byte_index, bit = low >> 3, 1 << (low & 7)
+            if container[byte_index] & bit:
+                return False
+            container[byte_index] |= bit
+            return True
+        index = bisect.bisect_left(container, low)
+        if index < len(container) and container[index] == low:
+            return False
+        container.insert(index, low)
+        if len(container) > cls.ARRAY_LIMIT:
+            bitmap = bytearray(8192)
+            for item in container:
+                bitmap[item >> 3] |= 1 << (item & 7)
+            containers[high] = bitmap
+        return True
+
+    @staticmethod
+    def _values(containers):
+        for high in sorted(containers):
+            container = containers[high]
+            base = high << 16
+            if isinstance(container, bytearray):
+                for byte_index, byte in enumerate(container):
+                    if byte:
+                        for bit in range(8):
+                            if byte & (1 << bit):
+                                yield base | (byte_index << 3) | bit
+            else:
+                for low in container:
+                    yield base | low
+
+    def __iter__(self):
+        yield from self._values(self._containers)
+        for ordinal in self._values(self._ordinals):
+            yield f"record_{ordinal}"
+
+    def samples(self):
+        result = []
+        for value in self:
+            if len(result) >= self._sample_size:
+                break
+            result.append(value)
+        return result
+
+
+def record_id_sort_key(record_id):
+    """Sort numeric record IDs numerically, ahead of all other IDs sorted as text."""
+    if isinstance(record_id, (int, float)) and not isinstance(record_id, bool):
+        return (0, record_id, "")
+    return (1, 0, str(record_id))
+
+
+def get_record_tracker(mode, sample_size=100, rng=None):
+    """Factory function to get a record tracker for the given mode.
+
+    Args:
+        mode: Tracking mode (set, reservoir, bitmap)
+        sample_size: Number of example record IDs to keep
+        rng: random.Random instance used for reservoir sampling
+
+    Returns:
+        RecordTracker instance
+    """
+    if mode == "set":
+        return SetRecordTracker()
+    if mode == "reservoir":
+        return ReservoirRecordTracker(sample_size, rng or random.Random(0))
+    if mode == "bitmap":
+        return BitmapRecordTracker(sample_size)
+    raise ValueError(f"Unsupported record tracking mode: {mode}")
+
+
 # ============================================================================
 # FILE ANALYZER CLASS
 # ============================================================================
@@ -369,7 +583,8 @@ class Node:
 class FileAnalyzer:
     """Analyzes file structure and collects field statistics."""
 
-    def __init__(self, file_name, file_type, group_by_attr=None, enumerate_config=None):
+    def __init__(self, file_name, file_type, group_by_attr=None, enumerate_config=None,
+                 record_tracking="reservoir", record_sample_size=100):
         self.record_count = 0
         self.root_node = Node("root")
         self.root_node.node_desc = file_name
@@ -383,6 +598,9 @@ class FileAnalyzer:
         self.group_by_filter = None  # Can be set after initialization
         self.field_metadata = {}  # For storing field descriptions and other metadata
         self.xml_namespaces = {}  # For storing XML namespace information
+        self.record_tracking = record_tracking  # set, reservoir or bitmap
+        self.record_sample_size = record_sample_size
+        self._tracker_rng = random.Random(0)  # Deterministic reservoir sampling
 
         # Handle both old and new enumeration formats
         if enumerate_config:
@@ -433,6 +651,10 @@ class FileAnalyzer:
             self.enumeration_stats = None
             self.pivot_stats = None
 
+    def new_record_tracker(self):
+        """Create a record tracker for one enumerated value using the configured mode."""
+        return get_record_tracker(self.record_tracking, self.record_sample_size, self._tracker_rng)
+
     def process_record(self, obj):
         """Process a single record, handling grouping and enumeration if enabled"""
         # Apply group_by filtering if specified
@@ -493,12 +715,13 @@ class FileAnalyzer:
                         if value_str not in self.enumeration_stats[group_value][attr_path]:
                             self.enumeration_stats[group_value][attr_path][value_str] = {
                                 'count': 0,
-                                'records': set()
+                                'records': self.new_record_tracker()
                             }
                         self.enumeration_stats[group_value][attr_path][value_str]['count'] += 1
                         # Track which records contain this code (using record ID if available)
                         record_id = obj.get('id', f'record_{self.record_count}')
-                        self.enumeration_stats[group_value][attr_path][value_str]['records'].add(record_id)
+                        value_stats = self.enumeration_stats[group_value][attr_path][value_str]
+                        value_stats['records'].add(record_id, self.record_count)
 
     def process_enumeration(self, obj):
         """Process enumeration attributes for a single record"""
@@ -511,12 +734,12 @@ class FileAnalyzer:
                         if value_str not in self.enumeration_stats[attr_path]:
                             self.enumeration_stats[attr_path][value_str] = {
                                 'count': 0,
-                                'records': set()
+                                'records': self.new_record_tracker()
                             }
                         self.enumeration_stats[attr_path][value_str]['count'] += 1
                         # Track which records contain this code (using record ID if available)
                         record_id = obj.get('id', f'record_{self.record_count}')
-                        self.enumeration_stats[attr_path][value_str]['records'].add(record_id)
+                        self.enumeration_stats[attr_path][value_str]['records'].add(record_id, self.record_count)
 
     def process_pivot_enumeration(self, obj):
         """Process pivot enumeration for a single record"""
@@ -612,11 +835,11 @@ class FileAnalyzer:
             if value_str not in group_pivot_stats[grouping_key]:
                 group_pivot_stats[grouping_key][value_str] = {
                     'count': 0,
-                    'records': set()
+                    'records': self.new_record_tracker()
                 }
             group_pivot_stats[grouping_key][value_str]['count'] += 1
             record_id = obj.get('id', f'record_{self.record_count}')
-            group_pivot_stats[grouping_key][value_str]['records'].add(record_id)
+            group_pivot_stats[grouping_key][value_str]['records'].add(record_id, self.record_count)
 
     def extract_nested_values(self, obj, attr_path):
         """Extract values from nested attribute path like 'properties.type.type'"""
@@ -856,7 +1079,7 @@ class FileAnalyzer:
         Returns one of: 'entity', 'relationship', 'config', 'feature'
         """
         if not table_name:
-            table_name = pathlib.Path(self.file_name).stem
+            table_name = pathlib.Path(strip_compression_suffix(self.file_name)).stem
 
         table_name_lower = table_name.lower()
 
@@ -1033,7 +1256,6 @@ class FileAnalyzer:
         return self.generate_enumeration_report()
 
 
-
 # ============================================================================
 # REPORT GENERATOR CLASSES
 # ============================================================================
@@ -1569,7 +1791,7 @@ class EnumerationReporter(BaseReporter):
                 unique_pct = round(unique_records / self.analyzer.record_count * 100, 2) if self.analyzer.record_count else 0
 
                 sample_records = [""] * min(self.analyzer.top_value_count, 5)
-                for i, record_id in enumerate(sorted(stats['records'])):
+                for i, record_id in enumerate(sorted(stats['records'].samples(), key=record_id_sort_key)):
                     if i >= min(self.analyzer.top_value_count, 5):
                         break
                     sample_records[i] = f"{record_id}"
@@ -1604,7 +1826,7 @@ class EnumerationReporter(BaseReporter):
                     unique_pct = round(unique_records / group_record_count * 100, 2) if group_record_count else 0
 
                     sample_records = [""] * min(self.analyzer.top_value_count, 5)
-                    for i, record_id in enumerate(sorted(stats['records'])):
+                    for i, record_id in enumerate(sorted(stats['records'].samples(), key=record_id_sort_key)):
                         if i >= min(self.analyzer.top_value_count, 5):
                             break
                         sample_records[i] = f"{record_id}"
@@ -1642,11 +1864,9 @@ class EnumerationReporter(BaseReporter):
 
                 for grouping_key, value_stats in group_pivot_stats.items():
                     total_record_cnt = sum(stats['count'] for stats in value_stats.values())
-                    all_records = set()
                     value_counts = {}
 
                     for value, stats in value_stats.items():
-                        all_records.update(stats['records'])
                         value_counts[value] = stats['count']
 
                     record_pct = round(total_record_cnt / group_record_count * 100, 2) if group_record_count else 0
@@ -1669,11 +1889,9 @@ class EnumerationReporter(BaseReporter):
         else:
             for grouping_key, value_stats in sorted(self.analyzer.pivot_stats.items()):
                 total_record_cnt = sum(stats['count'] for stats in value_stats.values())
-                all_records = set()
                 value_counts = {}
 
                 for value, stats in value_stats.items():
-                    all_records.update(stats['records'])
                     value_counts[value] = stats['count']
 
                 record_pct = round(total_record_cnt / self.analyzer.record_count * 100, 2) if self.analyzer.record_count else 0
@@ -1827,6 +2045,10 @@ Code Enumeration (analyze specific attribute values):
   %(prog)s data.jsonl --enumerate "properties:type,country:number" -o analysis.csv
   %(prog)s data.jsonl --group_by schema=Identification --enumerate "properties:type:number" -o id_types.csv
 
+Large Files (bounded-memory record tracking):
+  %(prog)s data.jsonl --enumerate "properties:type,country:number" --record-samples 20 -o analysis.csv
+  %(prog)s data.jsonl --enumerate "properties:type,country:number" --record-tracking bitmap -o analysis.csv
+
 Legacy Enumeration (backward compatibility):
   %(prog)s data.jsonl --enumerate "properties.type" -o codes.csv
 
@@ -1850,7 +2072,8 @@ GROUP_BY FORMATS:
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument("input_file",
-                       help="Input file or directory path (supports CSV, JSON, JSONL, Parquet, XML)")
+                       help="Input file or directory path (supports CSV, JSON, JSONL, Parquet, XML; "
+                            "optionally .gz/.bz2/.xz/.zst)")
     parser.add_argument("-t", "--file_type",
                        help='File type: "csv", "jsonl", "json", "parquet", "xml" (auto-detected if not specified)')
     parser.add_argument("-e", "--encoding", default="utf-8",
@@ -1868,6 +2091,13 @@ GROUP_BY FORMATS:
 Legacy: 'attr1,attr2' - list codes in attributes
 Pivot: 'level:dimensions:value' - cross-tabulate dimensions vs values
 Example: 'properties:type,country:number'""")
+    parser.add_argument("--record-tracking", choices=["reservoir", "bitmap", "set"], default="reservoir",
+                       help="""How --enumerate tracks records per value (default: reservoir):
+reservoir - exact record count plus a fixed-size sample of record IDs
+bitmap    - compact integer bitmap of numeric record IDs (others by input ordinal, shown as record_<n>)
+set       - every record ID in memory (legacy, unbounded)""")
+    parser.add_argument("--record-samples", type=int, default=100,
+                       help="Example record IDs kept per enumerated value in reservoir/bitmap mode (default: 100)")
     parser.add_argument("--detect-codes", action="store_true",
                        help="Auto-detect and enumerate code lists (low-cardinality string fields)")
     args = parser.parse_args()
@@ -1878,8 +2108,9 @@ Example: 'properties:type,country:number'""")
         data_extensions = ('.csv', '.json', '.jsonl', '.xml', '.xmls', '.parquet')
         file_list = []
         for ext in data_extensions:
-            pattern = os.path.join(args.input_file, f'*{ext}')
-            file_list.extend(glob.glob(pattern))
+            for compression_ext in ('',) + tuple(COMPRESSION_SUFFIXES):
+                pattern = os.path.join(args.input_file, f'*{ext}{compression_ext}')
+                file_list.extend(glob.glob(pattern))
 
         if not file_list:
             print(f"\nNo data files found in directory: {args.input_file}\n")
@@ -1896,7 +2127,7 @@ Example: 'properties:type,country:number'""")
             sys.exit(1)
 
     if not args.file_type:
-        ext = pathlib.Path(file_list[0]).suffix.lower()
+        ext = pathlib.Path(strip_compression_suffix(file_list[0])).suffix.lower()
         if ext in (".parquet", ".json", ".jsonl", ".xml", ".xmls"):
             args.file_type = ext[1:] if ext != ".xmls" else "xml"  # Map .xmls to 'xml'
         else:
@@ -1943,7 +2174,8 @@ Example: 'properties:type,country:number'""")
         print("\nError: When using --enumerate, you must specify -o/--output_file for the enumeration CSV output.\n")
         sys.exit(1)
 
-    analyzer = FileAnalyzer(args.input_file, args.file_type, group_by_attr, enumerate_config)
+    analyzer = FileAnalyzer(args.input_file, args.file_type, group_by_attr, enumerate_config,
+                            record_tracking=args.record_tracking, record_sample_size=args.record_samples)
     analyzer.top_value_count = args.top_values
 
     # Set group_by filter if specified
@@ -1983,14 +2215,14 @@ Example: 'properties:type,country:number'""")
             # Auto-detect file type for each file (useful when processing directories)
             file_type = args.file_type
             if len(file_list) > 1 and not args.file_type:
-                ext = pathlib.Path(file_name).suffix.lower()
+                ext = pathlib.Path(strip_compression_suffix(file_name)).suffix.lower()
                 if ext in (".parquet", ".json", ".jsonl", ".xml", ".xmls"):
                     file_type = ext[1:] if ext != ".xmls" else "xml"
                 else:
                     file_type = "csv"
 
             # Extract schema name from filename (remove extension)
-            schema_name = pathlib.Path(file_name).stem
+            schema_name = pathlib.Path(strip_compression_suffix(file_name)).stem
 
             # Use the new reader factory
             reader = get_reader(file_type, file_name, args.encoding)
@@ -2073,7 +2305,7 @@ Example: 'properties:type,country:number'""")
             enum_report = analyzer.generate_enumeration_report()
             if len(enum_report) > 1:  # Has data beyond header
                 if args.output_file:
-                    with open(args.output_file, "w") as file:
+                    with open_file(args.output_file, "w") as file:
                         writer = csv.writer(file)
                         writer.writerows(enum_report)
                     print(f"enumeration report saved to {args.output_file}\n")
@@ -2114,7 +2346,7 @@ Example: 'properties:type,country:number'""")
 
         if len(code_report) > 1:  # Has data beyond header
             if args.output_file:
-                with open(args.output_file, "w") as file:
+                with open_file(args.output_file, "w") as file:
                     writer = csv.writer(file)
                     writer.writerows(code_report)
                 print(f"code list report saved to {args.output_file}\n")
@@ -2147,7 +2379,7 @@ Example: 'properties:type,country:number'""")
         # Generate main schema report
         if args.output_file:
             # Check if output should be tree, markdown or CSV
-            output_file = pathlib.Path(args.output_file)
+            output_file = pathlib.Path(strip_compression_suffix(args.output_file))
             output_name = output_file.name.lower()
             output_ext = output_file.suffix.lower()
 
@@ -2155,19 +2387,19 @@ Example: 'properties:type,country:number'""")
                 # Generate tree format
                 reporter = get_reporter('tree', analyzer)
                 tree_content = reporter.generate()
-                with open(args.output_file, "w") as file:
+                with open_file(args.output_file, "w") as file:
                     file.write(tree_content)
                 print(f"tree schema saved to {args.output_file}\n")
             elif output_ext == '.md':
                 # Generate markdown format
                 markdown_content = analyzer.generate_markdown_report()
-                with open(args.output_file, "w") as file:
+                with open_file(args.output_file, "w") as file:
                     file.write(markdown_content)
                 print(f"markdown schema saved to {args.output_file}\n")
             else:
                 # Generate CSV format (default)
                 report_rows = analyzer.generate("report")
-                with open(args.output_file, "w") as file:
+                with open_file(args.output_file, "w") as file:
                     writer = csv.writer(file)
                     writer.writerows(report_rows)
                 print(f"statistical report saved to {args.output_file}\n")
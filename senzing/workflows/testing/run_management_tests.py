@@ -3,6 +3,7 @@
 
 Expected run directory input (produced by run_senzing_e2e):
 - input_normalized.jsonl
+- input_labels.json.gz (optional; record keys and labels, avoids re-reading the input)
 - comparison/entity_records.csv
 - comparison/matched_pairs.csv
 - comparison/match_key_stats.csv (optional for this script)
@@ -18,6 +19,7 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as dt
+import gzip
 import json
 import math
 import sys
@@ -211,6 +213,45 @@ def detect_epg(row: dict[str, Any], candidates: list[str]) -> str | None:
     return None
 
 
+def load_input_labels_sidecar(
+    sidecar_path: Path,
+    input_jsonl: Path,
+    candidates: list[str],
+) -> tuple[int, set[tuple[str, str]], dict[tuple[str, str], str], int] | None:
+    # The sidecar holds labels of one field; it only stands in for detect_epg when no
+    # other candidate field occurs in the input and it was written for this exact file.
+    try:
+        with gzip.open(sidecar_path, "rt", encoding="utf-8") as infile:
+            payload = json.load(infile)
+    except (OSError, ValueError, EOFError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != 1:
+        return None
+    label_field = payload.get("label_field")
+    presence = payload.get("field_presence") or {}
+    if label_field not in candidates:
+        return None
+    if any(candidate != label_field and presence.get(candidate, 1) for candidate in candidates):
+        return None
+    source = payload.get("source") or {}
+    input_stat = input_jsonl.stat()
+    if source.get("size") != input_stat.st_size or source.get("mtime_ns") != input_stat.st_mtime_ns:
+        return None
+
+    data_sources = payload["data_sources"]
+    labels = payload["labels"]
+    input_keys: set[tuple[str, str]] = set()
+    record_to_epg: dict[tuple[str, str], str] = {}
+    for source_code, record_id, label_code in zip(
+        payload["record_source"], payload["record_ids"], payload["record_label"]
+    ):
+        key = (data_sources[source_code], record_id)
+        input_keys.add(key)
+        if label_code >= 0:
+            record_to_epg[key] = labels[label_code]
+    return int(payload["records_total"]), input_keys, record_to_epg, int(payload["label_conflicts"])
+
+
 def format_percent(value: float | None) -> str:
     if value is None:
         return "N/A"
@@ -283,27 +324,33 @@ def main() -> int:
 
     epg_candidates = [item.strip() for item in args.epg_field_candidates.split(",") if item.strip()]
 
-    input_rows = read_jsonl(input_jsonl)
     entity_rows = read_csv_rows(entity_records_csv)
     pair_rows = read_csv_rows(matched_pairs_csv)
 
-    input_keys: set[tuple[str, str]] = set()
-    record_to_epg: dict[tuple[str, str], str] = {}
-    record_to_epg_conflicts = 0
-
-    for row in input_rows:
-        key = key_of(row.get("DATA_SOURCE"), row.get("RECORD_ID"))
-        if key is None:
-            continue
-        input_keys.add(key)
-        epg = detect_epg(row, epg_candidates)
-        if epg is None:
-            continue
-        existing = record_to_epg.get(key)
-        if existing is not None and existing != epg:
-            record_to_epg_conflicts += 1
-            continue
-        record_to_epg[key] = epg
+    input_labels = load_input_labels_sidecar(run_dir / "input_labels.json.gz", input_jsonl, epg_candidates)
+    if input_labels is not None:
+        input_records, input_keys, record_to_epg, record_to_epg_conflicts = input_labels
+    else:
+        input_rows = read_jsonl(input_jsonl)
+        input_records = len(input_rows)
+        input_keys = set()
+        record_to_epg = {}
+        record_to_epg_conflicts = 0
+
+        for row in input_rows:
+            key = key_of(row.get("DATA_SOURCE"), row.get("RECORD_ID"))
+            if key is None:
+                continue
+            input_keys.add(key)
+            epg = detect_epg(row, epg_candidates)
+            if epg is None:
+                continue
+            existing = record_to_epg.get(key)
+            if existing is not None and existing != epg:
+                record_to_epg_conflicts += 1
+                continue
+            record_to_epg[key] = epg
+        del input_rows
 
     entity_entries: list[dict[str, Any]] = []
     entity_keys: set[tuple[str, str]] = set()
@@ -547,7 +594,8 @@ def main() -> int:
             "baseline_value": baseline_value,
         },
         "data_quality": {
-            "input_records": len(input_rows),
+            "input_records": input_records,
+            "input_labels_source": "sidecar" if input_labels is not None else "input_scan",
             "input_keys": len(input_keys),
             "records_with_epg": len(record_to_epg),
             "record_to_epg_conflicts": record_to_epg_conflicts,
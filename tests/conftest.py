@@ -0,0 +1,10 @@
+"""Put senzing/tools on sys.path so tool scripts loaded by path can import their shared modules."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1] / "senzing" / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
@@ -0,0 +1,63 @@
+"""Tests for the chunked, multi-process generation of generate_realistic_partner_dataset."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+# Imported by name (senzing/tools is on sys.path) so worker processes can unpickle generate_chunk.
+import generate_realistic_partner_dataset as generator
+
+RECORDS = 300
+CHUNK_RECORDS = 40
+
+
+def generate(tmp_path: Path, workers: int, seed: int = 7, output_format: str = "json", compression: str = "none"):
+    """Generate a small dataset with the given worker count; returns (file bytes, stats)."""
+    output_path = tmp_path / f"dataset_{workers}_{seed}.{output_format}"
+    stats = generator.generate_dataset_parallel(
+        RECORDS,
+        person_ratio=0.7,
+        ipg_rate=0.35,
+        seed=seed,
+        output_path=output_path,
+        workers=workers,
+        chunk_records=CHUNK_RECORDS,
+        output_format=output_format,
+        compression=compression,
+    )
+    return output_path.read_bytes(), stats
+
+
+@pytest.mark.parametrize(("output_format", "compression"), [("json", "none"), ("jsonl", "none"), ("json", "gzip")])
+def test_same_seed_gives_identical_bytes_for_any_worker_count(
+    tmp_path: Path, output_format: str, compression: str
+) -> None:
+    outputs = [
+        generate(tmp_path, workers, output_format=output_format, compression=compression) for workers in (1, 2, 4)
+    ]
+
+    assert outputs[0][1]["chunks"] > 4
+    assert all(content == outputs[0][0] for content, _ in outputs)
+    assert all(stats == outputs[0][1] for _, stats in outputs)
+
+
+def test_parallel_output_is_a_complete_record_sequence(tmp_path: Path) -> None:
+    content, stats = generate(tmp_path, 3, compression="gzip")
+
+    records = json.loads(gzip.decompress(content))
+
+    assert len(records) == RECORDS == stats["records_total"]
+    assert stats["person_records"] + stats["organization_records"] == RECORDS
+    assert sum(1 for record in records if record["IPG ID"]) == stats["records_with_ipg_id"]
+    assert [record["externalPartnerKeyDirExternalID"] for record in records] == [
+        f"PTN-{number:09d}" for number in range(1, RECORDS + 1)
+    ]
+    assert not list(tmp_path.glob(".*.chunks"))
+
+
+def test_different_seeds_give_different_output(tmp_path: Path) -> None:
+    assert generate(tmp_path, 2, seed=7)[0] != generate(tmp_path, 2, seed=8)[0]
@@ -0,0 +1,145 @@
+"""Tests for streaming input parsing and stdout output in partner_json_to_senzing."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOL_PATH = Path(__file__).resolve().parents[1] / "senzing" / "tools" / "partner_json_to_senzing.py"
+
+
+def load_mapper():
+    """Import the mapper script as a module."""
+    spec = importlib.util.spec_from_file_location("partner_json_to_senzing", TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mapper = load_mapper()
+
+PARTNER = {"Partner ID": "P1", "Record Type": "PERSON", "Partner Name": "Doe", "Legal First Name": "Jane"}
+
+
+def read_records(text: str, array_key: str | None = None, chunk_size: int | None = None) -> list:
+    """Parse all records from text through iter_input_records."""
+    if chunk_size is None:
+        return list(mapper.iter_input_records(io.StringIO(text), array_key))
+    return list(mapper.iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"a": 1}, {"b": 2}]',
+        '  [\n  {"a": 1},\n  {"b": 2}\n]\n',
+        '[{"a":1},{"b":2}]',
+    ],
+)
+def test_json_array(text: str) -> None:
+    assert read_records(text) == [{"a": 1}, {"b": 2}]
+
+
+def test_empty_json_array() -> None:
+    assert read_records("[]") == []
+
+
+def test_json_array_small_chunks() -> None:
+    text = json.dumps([{"a": index, "n": 12345.678} for index in range(20)])
+    assert read_records(text, chunk_size=3) == [{"a": index, "n": 12345.678} for index in range(20)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"a":1},,{"b":2}]',
+        '[,{"a":1}]',
+        '[{"a":1} {"b":2}]',
+        '[{"a":1},]',
+        '[{"a":1}',
+    ],
+)
+def test_malformed_json_array(text: str) -> None:
+    with pytest.raises(ValueError):
+        read_records(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_malformed_json_array_small_chunks(chunk_size: int) -> None:
+    with pytest.raises(ValueError):
+        read_records('[{"a":1} , , {"b":2}]', chunk_size=chunk_size)
+
+
+def test_jsonl() -> None:
+    assert read_records('{"a": 1}\n\n{"b": 2}\n') == [{"a": 1}, {"b": 2}]
+
+
+def test_jsonl_reports_line_number() -> None:
+    with pytest.raises(ValueError, match="line 3"):
+        read_records('{"a": 1}\n{"b": 2}\n{"c":\n')
+
+
+def test_pretty_printed_single_object() -> None:
+    text = json.dumps(PARTNER, indent=2)
+    assert read_records(text) == [PARTNER]
+
+
+def test_object_with_array_key() -> None:
+    text = json.dumps({"partners": [PARTNER]}, indent=2)
+    assert read_records(text, array_key="partners") == [PARTNER]
+
+
+def test_non_object_record() -> None:
+    with pytest.raises(ValueError, match="Record 2"):
+        read_records('[{"a": 1}, 2]')
+
+
+def test_stdout_output_keeps_field_map(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+    input_path = tmp_path / "partners.json"
+    input_path.write_text(json.dumps([PARTNER]), encoding="utf-8")
+    run_root = tmp_path / "runs"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["partner_json_to_senzing.py", str(input_path), "-", "--run-output-root", str(run_root)],
+    )
+
+    assert mapper.main() == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 1
+    (run_directory,) = run_root.iterdir()
+    field_map = json.loads((run_directory / "field_map.json").read_text(encoding="utf-8"))
+    assert field_map["canonical_to_source"]["external_partner_key_dir_external_id"] == "Partner ID"
+    run_info = json.loads((run_directory / "run_info.json").read_text(encoding="utf-8"))
+    assert run_info["output_jsonl"] == "<stdout>"
+
+
+def test_stdout_output_with_field_map_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_path = tmp_path / "partners.json"
+    input_path.write_text(json.dumps([PARTNER]), encoding="utf-8")
+    run_root = tmp_path / "runs"
+    map_path = tmp_path / "field_map.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "partner_json_to_senzing.py",
+            str(input_path),
+            "-",
+            "--run-output-root",
+            str(run_root),
+            "--write-field-map",
+            str(map_path),
+        ],
+    )
+
+    assert mapper.main() == 0
+
+    assert map_path.exists()
+    assert not run_root.exists()
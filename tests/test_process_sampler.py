@@ -0,0 +1,47 @@
+"""Tests for ProcessTreeSampler, the /proc resource sampler shared by the pipeline runners."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from process_sampler import ProcessTreeSampler
+
+pytestmark = pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="needs /proc")
+
+CHILD_SCRIPT = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(0.5)']); "
+    "time.sleep(0.5); child.wait()"
+)
+
+
+def test_samples_the_whole_process_tree(tmp_path: Path) -> None:
+    timeseries = tmp_path / "step.resources.jsonl"
+    sampler = ProcessTreeSampler(0.1, timeseries)
+
+    with subprocess.Popen([sys.executable, "-c", CHILD_SCRIPT]) as process:
+        sampler.start(process.pid)
+        process.wait()
+    sampler.stop()
+    summary = sampler.summary()
+
+    assert summary is not None
+    assert max(sample["processes"] for sample in sampler.samples) == 2
+    assert summary["rss_bytes"]["peak"] > 0
+    assert summary["samples"] == len(timeseries.read_text(encoding="utf-8").splitlines())
+    assert json.loads(timeseries.read_text(encoding="utf-8").splitlines()[0])["t"] > 0
+
+
+def test_zero_interval_disables_sampling() -> None:
+    sampler = ProcessTreeSampler(0)
+
+    sampler.start(1)
+    sampler.stop()
+
+    assert not sampler.enabled
+    assert sampler.summary() is None
@@ -0,0 +1,523 @@
+"""Tests for the in-process SDK loader of run_senzing_end_to_end, driven by StubSenzingEngine."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+RUNNER_PATH = Path(__file__).resolve().parents[1] / "senzing" / "all_in_one" / "run_senzing_end_to_end.py"
+RETRY_POLICY = {"retryable": 2, "other": 1, "bad_input": 0, "fatal": 0}
+
+
+def load_runner():
+    """Import the E2E runner script as a module."""
+    spec = importlib.util.spec_from_file_location("run_senzing_end_to_end", RUNNER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+runner = load_runner()
+
+
+@pytest.fixture(name="input_jsonl")
+def fixture_input_jsonl(tmp_path: Path) -> Path:
+    """Twenty records plus a blank line and one line that is not a record."""
+    lines = [json.dumps({"DATA_SOURCE": "PARTNERS", "RECORD_ID": str(index)}) for index in range(1, 21)]
+    lines.insert(5, "")
+    lines.insert(10, "not json")
+    path = tmp_path / "input.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def load(engine, input_jsonl: Path, tmp_path: Path, **options):
+    """Run load_records_with_sdk with test defaults."""
+    checkpoints: list[tuple[int, int]] = []
+    step = runner.load_records_with_sdk(
+        engine,
+        input_jsonl,
+        tmp_path / "logs" / "02_load.log",
+        threads=4,
+        max_in_flight=8,
+        retry_policy=RETRY_POLICY,
+        checkpoint_fn=lambda offset, records: checkpoints.append((offset, records)),
+        **options,
+    )
+    return step, checkpoints
+
+
+def test_loads_every_record(input_jsonl: Path, tmp_path: Path) -> None:
+    engine = runner.StubSenzingEngine()
+
+    step, checkpoints = load(engine, input_jsonl, tmp_path)
+
+    assert step["ok"]
+    assert engine.records_added == 20
+    assert step["loader"]["records_loaded"] == 20
+    assert step["loader"]["invalid_lines"] == 1
+    assert step["loader"]["errors_by_class"] == {"invalid_json": 1}
+    assert checkpoints[-1] == (input_jsonl.stat().st_size, 21)
+    assert Path(step["log_file"]).exists()
+
+
+def test_bad_input_fails_the_step_without_retry(input_jsonl: Path, tmp_path: Path) -> None:
+    engine = runner.StubSenzingEngine(bad_input_rate=1.0)
+
+    step, checkpoints = load(engine, input_jsonl, tmp_path)
+
+    assert not step["ok"]
+    assert step["exit_code"] == 1
+    assert step["loader"]["too_many_failures"]
+    assert step["loader"]["records_loaded"] == 0
+    assert step["loader"]["retries"] == 0
+    assert step["loader"]["errors_by_class"]["bad_input"] == 20
+    assert checkpoints[-1][0] == input_jsonl.stat().st_size
+
+
+def test_failure_rate_above_limit_fails_the_step(input_jsonl: Path, tmp_path: Path) -> None:
+    step, _ = load(runner.StubSenzingEngine(), input_jsonl, tmp_path, max_failure_rate=0.01)
+
+    assert not step["ok"]
+    assert step["loader"]["records_loaded"] == 20
+    assert step["loader"]["failure_rate"] == round(1 / 21, 4)
+    assert "failed to load" in step["stderr_tail"]
+
+
+def test_retryable_errors_are_retried(input_jsonl: Path, tmp_path: Path) -> None:
+    engine = runner.StubSenzingEngine(retryable_rate=1.0)
+
+    step, _ = load(engine, input_jsonl, tmp_path)
+
+    assert step["loader"]["retries"] == 20 * RETRY_POLICY["retryable"]
+    assert step["loader"]["errors_by_class"]["retryable"] == 20
+
+
+def test_resumes_from_offset(input_jsonl: Path, tmp_path: Path) -> None:
+    lines = input_jsonl.read_bytes().splitlines(keepends=True)
+    start_offset = sum(len(line) for line in lines[:12])
+    engine = runner.StubSenzingEngine()
+
+    step, checkpoints = load(engine, input_jsonl, tmp_path, start_offset=start_offset)
+
+    assert step["ok"]
+    assert engine.records_added == 10
+    assert step["loader"]["start_offset"] == start_offset
+    assert checkpoints[-1] == (input_jsonl.stat().st_size, 10)
+
+
+def test_file_load_resume_skips_loaded_segments(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_jsonl = tmp_path / "load.jsonl"
+    input_jsonl.write_text(
+        "".join(json.dumps({"DATA_SOURCE": "PARTNERS", "RECORD_ID": str(index)}) + "\n" for index in range(10)),
+        encoding="utf-8",
+    )
+    checkpoint_path = tmp_path / runner.LOAD_CHECKPOINT_NAME
+    runner.write_load_checkpoint(
+        checkpoint_path,
+        {"records_input_count": 10, "byte_offset": 0, "records_committed": 0, "segments_completed": 0},
+    )
+    loaded: list[str] = []
+    steps_run: list[str] = []
+    killed_step = {"name": "load_records_segment_0002"}
+
+    def fake_file_loader(step_name: str, command: list[str], log_file: Path, **_kwargs) -> dict:
+        steps_run.append(step_name)
+        if step_name == killed_step["name"]:
+            return {"step": step_name, "ok": False, "exit_code": -9}
+        segment = Path(command[command.index("-f") + 1])
+        loaded.extend(json.loads(line)["RECORD_ID"] for line in segment.read_text(encoding="utf-8").splitlines())
+        return {"step": step_name, "ok": True, "exit_code": 0}
+
+    monkeypatch.setattr(runner, "run_shell_step", fake_file_loader)
+
+    def load_file() -> bool:
+        ok, _, _, _ = runner.run_checkpointed_file_load(
+            runner.read_load_checkpoint(checkpoint_path),
+            checkpoint_path,
+            tmp_path / "setupEnv",
+            input_jsonl,
+            tmp_path / "segments",
+            tmp_path / "logs",
+            segment_records=4,
+            attempts=[("primary", 4, False)],
+            timeout_seconds=0,
+            keep_temp_files=True,
+        )
+        return ok
+
+    first_ok = load_file()
+    interrupted = runner.read_load_checkpoint(checkpoint_path)
+    killed_step["name"] = ""
+    resumed_ok = load_file()
+    final = runner.read_load_checkpoint(checkpoint_path)
+
+    assert not first_ok
+    assert interrupted["segments_completed"] == 1 and interrupted["records_committed"] == 4
+    assert resumed_ok
+    assert steps_run == [
+        "load_records_segment_0001",
+        "load_records_segment_0002",
+        "load_records_segment_0002",
+        "load_records_segment_0003",
+    ]
+    assert loaded == [str(index) for index in range(10)]
+    assert final["completed"] and final["records_committed"] == 10
+    assert final["byte_offset"] == input_jsonl.stat().st_size
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_explain_log_streams_each_kind_through_index(tmp_path: Path, compression: str | None) -> None:
+    log_path = tmp_path / "explain" / ("explain_log.jsonl.gz" if compression else "explain_log.jsonl")
+    index_path = tmp_path / "explain" / "explain_log.index.tsv"
+    entity_input = {"data_source": "PARTNERS", "record_id": "1"}
+    pair_input = {
+        "anchor_data_source": "PARTNERS",
+        "anchor_record_id": "1",
+        "matched_data_source": "PARTNERS",
+        "matched_record_id": "2",
+    }
+    with runner.ExplainLog(log_path, index_path, compression) as explain_log:
+        explain_log.append(
+            "why_entity", 0, "why_entity_by_record_0000", entity_input, {"ok": True, "output_json": {}}, 0.1
+        )
+        explain_log.append("why_records", 0, "why_records_0000", pair_input, {"ok": False, "error": "boom"}, 0.2)
+        explain_log.append(
+            "why_entity", 1, "why_entity_by_record_0001", entity_input, {"ok": True, "output_text": "x"}, 0.1
+        )
+
+    entities = list(runner.iter_explain_log(log_path, index_path, "why_entity"))
+    pairs = list(runner.iter_explain_log(log_path, index_path, "why_records"))
+
+    assert [entry["index"] for entry in entities] == [0, 1]
+    assert entities[1]["output_text"] == "x"
+    assert pairs == [runner.read_explain_log_entry(log_path, *offset_and_length(index_path, "why_records"))]
+    assert pairs[0]["input"] == pair_input and pairs[0]["ok"] is False
+    assert list(runner.iter_explain_log(tmp_path / "missing.jsonl", index_path, "why_entity")) == []
+
+
+def offset_and_length(index_path: Path, kind: str) -> tuple[int, int]:
+    """Offset and length of the first index row of one kind."""
+    for line in index_path.read_text(encoding="utf-8").splitlines()[1:]:
+        row = line.split("\t")
+        if row[0] == kind:
+            return int(row[2]), int(row[3])
+    raise AssertionError(kind)
+
+
+def test_explain_cache_is_reused_after_reload_with_new_entity_ids(tmp_path: Path) -> None:
+    db_path = tmp_path / "explain_cache.sqlite"
+    members = ["PARTNERS:1:aaa", "PARTNERS:2:bbb"]
+    pair = {
+        "anchor_data_source": "PARTNERS",
+        "anchor_record_id": "1",
+        "matched_data_source": "PARTNERS",
+        "matched_record_id": "2",
+    }
+    first_run = runner.ExplainCache(db_path, "config", {"7": members})
+    first_key = first_run.key_for("why_records", {**pair, "resolved_entity_id": "7"})
+    first_run.put("why_records", first_key, {"ok": True, "method": "why_records", "output_text": '{"WHY": 1}'})
+    first_run.close()
+
+    second_run = runner.ExplainCache(db_path, "config", {"42": members, "43": ["PARTNERS:2:changed"]})
+    second_key = second_run.key_for("why_records", {**pair, "resolved_entity_id": "42"})
+    cached = second_run.get("why_records", second_key)
+    changed_key = second_run.key_for("why_records", {**pair, "resolved_entity_id": "43"})
+    second_run.close()
+
+    assert second_key == first_key
+    assert cached is not None and cached["cache_hit"] and cached["output_json"] == {"WHY": 1}
+    assert changed_key != first_key
+    assert second_run.summary()["hits"] == 1
+
+
+def test_input_label_sidecar_round_trips_and_detects_stale_input(tmp_path: Path) -> None:
+    input_jsonl = tmp_path / "input.jsonl"
+    records = [
+        {"DATA_SOURCE": "PARTNERS", "RECORD_ID": "1", "SOURCE_IPG_ID": "IPG-1"},
+        {"DATA_SOURCE": "PARTNERS", "RECORD_ID": "2", "SOURCE_IPG_ID": "IPG-1"},
+        {"DATA_SOURCE": "PARTNERS", "RECORD_ID": "1", "SOURCE_IPG_ID": "IPG-9"},
+        {"DATA_SOURCE": "VENDORS", "RECORD_ID": "3", "EPG_ID": "E-3"},
+        {"RECORD_ID": "4"},
+    ]
+    input_jsonl.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    sidecar = tmp_path / runner.INPUT_LABELS_NAME
+
+    runner.InputLabelIndex.from_jsonl(input_jsonl).save(sidecar, input_jsonl)
+    loaded = runner.InputLabelIndex.load(sidecar, input_jsonl)
+
+    assert loaded is not None
+    assert list(loaded.iter_labeled_records()) == [("PARTNERS", "1", "IPG-1"), ("PARTNERS", "2", "IPG-1")]
+    assert (loaded.records_total, loaded.rows_with_record_key, loaded.rows_with_label) == (5, 4, 3)
+    assert loaded.label_conflicts == 1
+    assert loaded.field_presence["SOURCE_IPG_ID"] == 3 and loaded.field_presence["EPG_ID"] == 1
+    assert loaded.data_sources == ["PARTNERS", "VENDORS"]
+
+    with input_jsonl.open("a", encoding="utf-8") as outfile:
+        outfile.write(json.dumps({"DATA_SOURCE": "PARTNERS", "RECORD_ID": "5"}) + "\n")
+
+    assert runner.InputLabelIndex.load(sidecar, input_jsonl) is None
+    assert runner.InputLabelIndex.load(tmp_path / "missing.json.gz") is None
+
+
+def write_clean_jsonl(path: Path) -> bytes:
+    """Write three records, one compact JSON object per line."""
+    content = "".join(json.dumps({"DATA_SOURCE": "PARTNERS", "RECORD_ID": str(index)}) + "\n" for index in range(3))
+    path.write_text(content, encoding="utf-8")
+    return content.encode("utf-8")
+
+
+def test_scan_plain_jsonl_never_hardlinks_by_default(tmp_path: Path) -> None:
+    source = tmp_path / "input.jsonl"
+    content = write_clean_jsonl(source)
+    target = tmp_path / "input_normalized.jsonl"
+    data_sources: set[str] = set()
+
+    records, mode = runner.scan_plain_jsonl(source, target, data_sources, None)
+
+    assert (records, data_sources) == (3, {"PARTNERS"})
+    assert mode in {"reflink", "copy_file_range", "copy"}
+    assert target.read_bytes() == content
+    assert not source.samefile(target)
+    target.write_text("changed\n", encoding="utf-8")
+    assert source.read_bytes() == content
+
+
+def test_scan_plain_jsonl_hardlinks_only_when_allowed(tmp_path: Path) -> None:
+    source = tmp_path / "input.jsonl"
+    write_clean_jsonl(source)
+    target = tmp_path / "input_normalized.jsonl"
+
+    _, mode = runner.scan_plain_jsonl(source, target, set(), None, allow_hardlink=True)
+
+    assert mode == "hardlink"
+    assert source.samefile(target)
+
+
+def test_scan_plain_jsonl_rewrites_only_the_unclean_tail(tmp_path: Path) -> None:
+    source = tmp_path / "input.jsonl"
+    clean = write_clean_jsonl(source)
+    with source.open("a", encoding="utf-8") as outfile:
+        outfile.write('\n  {"DATA_SOURCE": "PARTNERS", "RECORD_ID": "9"}  \n')
+    target = tmp_path / "input_normalized.jsonl"
+
+    records, mode = runner.scan_plain_jsonl(source, target, set(), None)
+
+    assert (records, mode) == (4, "rewrite_partial")
+    assert target.read_bytes() == clean + b'{"DATA_SOURCE": "PARTNERS", "RECORD_ID": "9"}\n'
+
+
+def test_clone_file_falls_back_to_copy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    fcntl = pytest.importorskip("fcntl")
+    source = tmp_path / "input.jsonl"
+    content = write_clean_jsonl(source)
+
+    def unsupported(*_args) -> None:
+        raise OSError("not supported")
+
+    monkeypatch.setattr(runner.os, "link", unsupported)
+    monkeypatch.setattr(fcntl, "ioctl", unsupported)
+    monkeypatch.setattr(runner.os, "copy_file_range", unsupported, raising=False)
+
+    mode = runner.clone_file(source, tmp_path / "clone.jsonl", allow_hardlink=True)
+
+    assert mode == "copy"
+    assert (tmp_path / "clone.jsonl").read_bytes() == content
+
+
+def test_setup_env_is_cached_in_memory_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    setup_env = tmp_path / "setupEnv"
+    setup_env.write_text("export SZ_TEST_VALUE=from-setup-env\n", encoding="utf-8")
+    monkeypatch.setattr(runner, "SETUP_ENV_CACHE", {})
+
+    first = runner.load_setup_env(setup_env)
+    monkeypatch.setenv("SZ_TEST_PARENT", "changed")
+    second = runner.load_setup_env(setup_env)
+
+    assert first["SZ_TEST_VALUE"] == "from-setup-env"
+    assert second == first
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["setupEnv"]
+
+
+def test_explain_worker_is_seeded_with_parent_setup_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    setup_env = tmp_path / "setupEnv"
+    setup_env.write_text("exit 1\n", encoding="utf-8")
+    monkeypatch.setattr(runner, "SETUP_ENV_CACHE", {})
+    monkeypatch.setattr(runner, "init_g2_engine", lambda *_args: (None, None, {"error": "no SDK"}))
+    for name in ("EXPLAIN_WORKER_ENGINE", "EXPLAIN_WORKER_CLEANUP", "EXPLAIN_WORKER_ERROR"):
+        monkeypatch.setattr(runner, name, None)
+
+    runner.init_explain_worker(str(tmp_path), str(setup_env), {"SZ_TEST_VALUE": "seeded"})
+
+    assert runner.load_setup_env(setup_env) == {"SZ_TEST_VALUE": "seeded"}
+
+
+@pytest.mark.parametrize(
+    ("budget", "expected"),
+    [(1, ("sequential", 1, 1)), (3, ("concurrent", 2, 2)), (16, ("concurrent", 2, 4))],
+)
+def test_read_stage_plan_keeps_snapshot_within_budget(budget: int, expected: tuple[str, int, int]) -> None:
+    plan = runner.plan_read_stage_threads(budget, 4, run_snapshot=True, run_export=True)
+
+    assert (plan["mode"], plan["max_parallel"], plan["snapshot_threads"]) == expected
+
+
+def test_read_stage_plan_gives_a_lone_snapshot_the_whole_budget() -> None:
+    plan = runner.plan_read_stage_threads(3, 8, run_snapshot=True, run_export=False)
+
+    assert (plan["mode"], plan["snapshot_threads"]) == ("sequential", 3)
+
+
+def recording_stages(specs: dict[str, tuple[tuple[str, ...], bool]]):
+    """Stages that record start/end order and the peak number running at once."""
+    lock = threading.Lock()
+    events: list[str] = []
+    active = [0, 0]
+
+    def make(name: str, ok: bool):
+        def stage() -> bool:
+            with lock:
+                events.append(f"start:{name}")
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+                events.append(f"end:{name}")
+            return ok
+
+        return stage
+
+    stages = {name: (deps, make(name, ok)) for name, (deps, ok) in specs.items()}
+    return stages, events, active
+
+
+@pytest.mark.parametrize(("max_parallel", "peak"), [(1, 1), (2, 2), (3, 3)])
+def test_stage_graph_respects_max_parallel(max_parallel: int, peak: int) -> None:
+    stages, events, active = recording_stages({name: ((), True) for name in ("a", "b", "c")})
+
+    results = runner.run_stage_graph(stages, max_parallel, time.time())
+
+    assert active[1] == peak
+    assert all(results[name]["ok"] for name in ("a", "b", "c"))
+    if max_parallel == 1:
+        assert events == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
+
+
+def test_stage_graph_orders_dependencies_and_skips_after_failure() -> None:
+    stages, events, _ = recording_stages(
+        {
+            "load": ((), True),
+            "snapshot": (("load",), False),
+            "export": (("load",), True),
+            "report": (("snapshot",), True),
+        }
+    )
+
+    results = runner.run_stage_graph(stages, 2, time.time())
+
+    assert events.index("end:load") < events.index("start:snapshot")
+    assert events.index("end:load") < events.index("start:export")
+    assert results["snapshot"]["ok"] is False
+    assert results["report"] == {"ok": False, "skipped": True}
+    assert "start:report" not in events
+    assert runner.stage_overlap_seconds(results) > 0
+
+
+def test_stage_graph_rejects_unsatisfiable_dependencies() -> None:
+    stages, _, _ = recording_stages({"export": (("missing",), True)})
+
+    with pytest.raises(ValueError, match="export"):
+        runner.run_stage_graph(stages, 1, time.time())
+
+
+def trial(threads: int, records_per_second: float | None, failure_rate: float = 0.0, ok: bool = True) -> dict:
+    """A calibration trial as calibrate_load_threads reports it."""
+    return {"threads": threads, "records_per_second": records_per_second, "failure_rate": failure_rate, "ok": ok}
+
+
+def test_default_thread_candidates_cover_fractions_of_the_cpus() -> None:
+    assert runner.default_thread_candidates(16) == [2, 4, 8, 16]
+    assert runner.default_thread_candidates(2) == [1, 2]
+
+
+def test_choose_load_threads_prefers_fewer_threads_within_tolerance() -> None:
+    trials = [trial(2, 500.0), trial(4, 960.0), trial(8, 1000.0), trial(16, 990.0)]
+
+    threads, reason = runner.choose_load_threads(trials, tolerance=0.05)
+
+    assert threads == 4
+    assert "within 5%" in reason and "8 threads" in reason
+
+
+def test_choose_load_threads_takes_the_best_when_nothing_is_close() -> None:
+    trials = [trial(2, 500.0), trial(4, 700.0), trial(8, 1000.0)]
+
+    threads, reason = runner.choose_load_threads(trials, tolerance=0.05)
+
+    assert threads == 8
+    assert reason.startswith("highest throughput")
+
+
+def test_choose_load_threads_skips_trials_that_fail_more_records() -> None:
+    trials = [trial(2, 500.0, 0.0), trial(4, 900.0, 0.005), trial(8, 2000.0, 0.2), trial(16, 3000.0, ok=False)]
+
+    threads, _ = runner.choose_load_threads(trials, failure_margin=0.01)
+
+    assert threads == 4
+
+
+def test_choose_load_threads_without_a_usable_trial() -> None:
+    trials = [trial(2, 800.0, 1.0, ok=False), trial(4, None)]
+
+    assert runner.choose_load_threads(trials) == (None, "no calibration slice loaded successfully")
+
+
+@pytest.mark.parametrize(
+    ("step", "expected"),
+    [
+        (
+            {"loader": {"throughput": {"records_per_second": {"p50": 750}}}, "duration_seconds": 10},
+            (750.0, "sdk_throughput_p50"),
+        ),
+        (
+            {"progress": {"samples": [{"t": 2, "count": 100}, {"t": 6, "count": 900}]}, "duration_seconds": 10},
+            (200.0, "progress_samples"),
+        ),
+        ({"progress": {"samples": [{"t": 2, "count": 100, "rate": 321}]}}, (321.0, "progress_rate")),
+        ({"duration_seconds": 4}, (250.0, "step_duration")),
+        ({"duration_seconds": 0}, (None, "step_duration")),
+    ],
+)
+def test_calibration_rate_prefers_the_loaders_steady_state_rate(step: dict, expected: tuple) -> None:
+    assert runner.calibration_rate(step, 1000) == expected
+
+
+def test_calibration_loads_consecutive_slices_once(tmp_path: Path) -> None:
+    source = tmp_path / "input.jsonl"
+    record_ids = [str(index) for index in range(10)]
+    source.write_text(
+        "".join(json.dumps({"RECORD_ID": record_id}) + "\n" for record_id in record_ids), encoding="utf-8"
+    )
+    seen: list[tuple[int, list[str]]] = []
+
+    def run_slice(threads: int, slice_path: Path, records: int) -> dict:
+        ids = [json.loads(line)["RECORD_ID"] for line in slice_path.read_text(encoding="utf-8").splitlines()]
+        seen.append((threads, ids))
+        failed = 1 if threads == 4 else 0
+        return {"ok": True, "duration_seconds": records / 100, "loader": {"records_failed": failed}}
+
+    trials, steps, offset, loaded = runner.calibrate_load_threads(
+        source, 0, [1, 2, 4, 8], 4, tmp_path / "slices", run_slice
+    )
+
+    assert [threads for threads, _ in seen] == [1, 2, 4]
+    assert [record_id for _, ids in seen for record_id in ids] == record_ids
+    assert (offset, loaded, len(steps)) == (source.stat().st_size, 10, 3)
+    assert [item["failure_rate"] for item in trials] == [0.0, 0.0, 0.5]
+    assert not any((tmp_path / "slices").iterdir())